@@ -0,0 +1,465 @@
+"""
+Módulo con heurísticas mejoradas para el puzzle de 15 losetas.
+
+Ofrece dos heurísticas admisibles más informadas que la distancia de
+Manhattan y casi tan baratas de evaluar: conflictos lineales y distancia
+caminante (walking distance). Ambas tienen la interfaz de
+`main.HeuristicaManhattan` (`evaluar` y `mover`), así que se pasan como
+`heuristica` a `ramificacion_y_poda` o a `ida_estrella`, o se eligen por
+nombre ("conflicto_lineal", "caminante") en `main.HEURISTICAS`. Las dos son
+consistentes, por lo que A* no necesita reabrir estados.
+
+Incluye además una comprobación de admisibilidad sobre soluciones óptimas
+y una comparación de nodos explorados sobre un conjunto fijo de instancias.
+
+Contenido
+---------
+- Clases
+    - HeuristicaConflictoLineal: Manhattan más conflictos lineales.
+    - HeuristicaCaminante: Distancia caminante con tablas precalculadas.
+- Funciones
+    - comprobar_admisibilidad: Verifica h contra los costos reales de soluciones óptimas.
+    - comparar_heuristicas: Nodos explorados por cada heurística en un conjunto de instancias.
+
+Attributes
+----------
+INSTANCIAS : list of list of int
+    Instancias fijas de la comparación, con soluciones óptimas de 14 a 38
+    movimientos.
+"""
+
+import collections
+import functools
+import sys
+import time
+
+from main import (CONFIG_FINAL, CONFIG_INICIAL, HEURISTICAS, empaquetar,
+                  ramificacion_y_poda, tabla_manhattan)
+
+INSTANCIAS = [
+    CONFIG_INICIAL,
+    [1, 2, 3, 4, 5, 6, 10, 7, 16, 9, 15, 8, 13, 14, 11, 12],
+    [2, 3, 4, 8, 1, 7, 11, 12, 10, 6, 16, 15, 5, 9, 13, 14],
+    [1, 2, 6, 4, 5, 7, 10, 8, 9, 14, 3, 12, 13, 15, 11, 16],
+    [1, 11, 6, 2, 13, 9, 8, 10, 5, 14, 12, 3, 15, 16, 7, 4],
+    [2, 10, 5, 4, 1, 3, 13, 7, 16, 14, 15, 6, 9, 12, 11, 8],
+    [2, 3, 16, 7, 1, 5, 10, 4, 13, 6, 8, 11, 15, 9, 14, 12],
+    [10, 1, 4, 3, 2, 16, 8, 6, 14, 7, 5, 12, 9, 13, 11, 15],
+    [1, 5, 7, 4, 2, 10, 15, 16, 6, 14, 3, 12, 13, 8, 9, 11],
+]
+
+
+def _conflictos_linea(columnas_objetivo):
+    """
+    Movimientos extra por conflictos lineales en una fila (o columna).
+
+    `columnas_objetivo` son, en orden, las columnas objetivo de las losetas
+    de la línea que pertenecen a ella. Las que no forman una subsecuencia
+    creciente deben salir de la línea y volver, dos movimientos cada una;
+    el mínimo de losetas a sacar es el tamaño menos la subsecuencia
+    creciente más larga.
+    """
+    if len(columnas_objetivo) < 2:
+        return 0
+    mas_larga = [1] * len(columnas_objetivo)
+    for i, columna in enumerate(columnas_objetivo):
+        for j in range(i):
+            if columnas_objetivo[j] < columna and mas_larga[j] + 1 > mas_larga[i]:
+                mas_larga[i] = mas_larga[j] + 1
+    return 2 * (len(columnas_objetivo) - max(mas_larga))
+
+
+class HeuristicaConflictoLineal:
+    """
+    Distancia de Manhattan más conflictos lineales.
+
+    Dos losetas están en conflicto lineal si ambas están en su fila (o
+    columna) objetivo pero en orden inverso: una debe salir de la línea
+    para dejar pasar a la otra, lo que suma dos movimientos que Manhattan
+    no cuenta. Los de filas y columnas se suman: los de una fila son
+    movimientos verticales de losetas que ya están en su fila objetivo y
+    los de una columna, horizontales, así que nunca se cuentan dos veces.
+
+    La memoria de cada tablero es (manhattan, conflictos, lineas), con los
+    conflictos de cada fila y luego de cada columna. Un movimiento vertical
+    no cambia el orden de las losetas de ninguna columna, y uno horizontal
+    no cambia el de ninguna fila; además la loseta movida solo cuenta en su
+    fila o columna objetivo. Por eso `mover` recalcula a lo sumo una línea,
+    en O(n^2), y Manhattan en O(1).
+
+    Attributes
+    ----------
+    consistente : bool
+        True: h cambia exactamente en 1 por movimiento.
+
+    References
+    ----------
+    Hansson, O., Mayer, A., & Yung, M. (1992). Criticizing solutions to
+    relaxed models yields powerful admissible heuristics. Information
+    Sciences, 63(3), 207-227.
+
+    Examples
+    --------
+    >>> heuristica = HeuristicaConflictoLineal([1, 2, 3, 4, 5, 6, 7, 8, 16])
+    >>> heuristica.evaluar(empaquetar([2, 1, 3, 5, 4, 6, 7, 8, 16]))[0]
+    8
+    """
+
+    consistente = True
+
+    def __init__(self, objetivo=CONFIG_FINAL):
+        self.n = int(len(objetivo) ** 0.5)
+        self.manhattan = tabla_manhattan(objetivo)
+        # Fila y columna objetivo de cada loseta codificada (el vacío no tiene)
+        self.fila_objetivo = [None] * 16
+        self.columna_objetivo = [None] * 16
+        for pos, valor in enumerate(objetivo):
+            if valor != 16:
+                self.fila_objetivo[valor - 1], self.columna_objetivo[valor - 1] = divmod(pos, self.n)
+
+    def _conflictos(self, codigo, linea):
+        """Conflictos de la fila `linea` (< n) o de la columna `linea - n`."""
+        n = self.n
+        if linea < n:
+            posiciones = range(linea * n, (linea + 1) * n)
+            propias, orden = self.fila_objetivo, self.columna_objetivo
+        else:
+            posiciones = range(linea - n, n * n, n)
+            propias, orden = self.columna_objetivo, self.fila_objetivo
+            linea -= n
+        losetas = [(codigo >> (4 * pos)) & 15 for pos in posiciones]
+        return _conflictos_linea([orden[t] for t in losetas if propias[t] == linea])
+
+    def evaluar(self, codigo):
+        """
+        Calcula la heurística de un tablero.
+
+        Parameters
+        ----------
+        codigo : int
+            Tablero codificado con `main.empaquetar`.
+
+        Returns
+        -------
+        tuple
+            Una tupla (h, memoria).
+        """
+        manhattan = sum(self.manhattan[(codigo >> (4 * pos)) & 15][pos]
+                        for pos in range(self.n * self.n))
+        lineas = tuple(self._conflictos(codigo, linea) for linea in range(2 * self.n))
+        conflictos = sum(lineas)
+        return manhattan + conflictos, (manhattan, conflictos, lineas)
+
+    def mover(self, memoria, codigo, t, desde, hasta):
+        """
+        Actualiza la heurística tras mover una loseta.
+
+        Parameters
+        ----------
+        memoria : tuple
+            Memoria del tablero padre.
+        codigo : int
+            Tablero codificado tras el movimiento.
+        t : int
+            Loseta movida, codificada como en `main.empaquetar`.
+        desde, hasta : int
+            Posiciones de origen y destino de la loseta.
+
+        Returns
+        -------
+        tuple
+            Una tupla (h, memoria) del tablero tras el movimiento.
+        """
+        manhattan, conflictos, lineas = memoria
+        distancias = self.manhattan[t]
+        manhattan += distancias[hasta] - distancias[desde]
+
+        n = self.n
+        fila_desde, columna_desde = divmod(desde, n)
+        fila_hasta, columna_hasta = divmod(hasta, n)
+        # Solo cambia la línea objetivo de la loseta, si entra en ella o sale de ella
+        if fila_desde != fila_hasta:
+            linea = self.fila_objetivo[t]
+            cambia = linea in (fila_desde, fila_hasta)
+        else:
+            linea = n + self.columna_objetivo[t]
+            cambia = self.columna_objetivo[t] in (columna_desde, columna_hasta)
+        if cambia:
+            nuevos = self._conflictos(codigo, linea)
+            conflictos += nuevos - lineas[linea]
+            lineas = lineas[:linea] + (nuevos,) + lineas[linea + 1:]
+        return manhattan + conflictos, (manhattan, conflictos, lineas)
+
+
+@functools.lru_cache(maxsize=None)
+def _tabla_caminante(lineas_objetivo, linea_vacio, n):
+    """
+    Distancias caminantes de todos los estados verticales alcanzables.
+
+    Un estado cuenta, para cada fila i y cada fila objetivo j, cuántas
+    losetas de la fila i pertenecen a la fila j (3 bits por entrada, bits
+    3 * (i * n + j)), más la fila del vacío en los bits 3 * n * n. Se
+    recorre en anchura desde el objetivo; un movimiento lleva una loseta
+    de una fila adyacente a la fila del vacío.
+    """
+    desplazamiento_vacio = 3 * n * n
+    inicial = linea_vacio << desplazamiento_vacio
+    for i, j in enumerate(lineas_objetivo):
+        if j is not None:
+            inicial += 1 << (3 * ((i // n) * n + j))
+
+    distancias = {inicial: 0}
+    cola = collections.deque([inicial])
+    while cola:
+        estado = cola.popleft()
+        vacio = estado >> desplazamiento_vacio
+        conteos = estado & ((1 << desplazamiento_vacio) - 1)
+        for fila in (vacio - 1, vacio + 1):
+            if not 0 <= fila < n:
+                continue
+            for j in range(n):
+                if (conteos >> (3 * (fila * n + j))) & 7:
+                    nuevo = (conteos - (1 << (3 * (fila * n + j))) + (1 << (3 * (vacio * n + j)))
+                             + (fila << desplazamiento_vacio))
+                    if nuevo not in distancias:
+                        distancias[nuevo] = distancias[estado] + 1
+                        cola.append(nuevo)
+    return distancias
+
+
+class HeuristicaCaminante:
+    """
+    Distancia caminante (walking distance).
+
+    Considera por separado los movimientos verticales y los horizontales.
+    En la parte vertical solo importa en qué fila está cada loseta y a qué
+    fila pertenece: el estado es una tabla n x n de conteos más la fila del
+    vacío, y cada movimiento vertical real es un movimiento de esa tabla.
+    La distancia desde cada estado hasta el objetivo se precalcula por
+    búsqueda en anchura (24964 estados en el tablero de 4x4); la parte
+    horizontal es la misma con columnas. La suma es admisible, porque cada
+    movimiento real es vertical u horizontal, y nunca es menor que Manhattan.
+
+    La memoria de cada tablero son los dos estados codificados como
+    enteros; un movimiento vertical cambia dos conteos y la fila del vacío
+    del estado vertical con sumas y restas, así que `mover` es O(1).
+
+    Attributes
+    ----------
+    consistente : bool
+        True: un movimiento cambia una de las dos partes en a lo sumo 1.
+
+    References
+    ----------
+    Takahashi, K. Walking distance: heurística para el puzzle de 15
+    difundida por su autor junto con su solucionador IDA*.
+
+    Examples
+    --------
+    >>> heuristica = HeuristicaCaminante([1, 2, 3, 4, 5, 6, 7, 8, 16])
+    >>> heuristica.evaluar(empaquetar([2, 1, 3, 5, 4, 6, 7, 8, 16]))[0]
+    6
+    """
+
+    consistente = True
+
+    def __init__(self, objetivo=CONFIG_FINAL):
+        n = self.n = int(len(objetivo) ** 0.5)
+        self._desplazamiento_vacio = 3 * n * n
+        self.fila_objetivo = [None] * 16
+        self.columna_objetivo = [None] * 16
+        for pos, valor in enumerate(objetivo):
+            if valor != 16:
+                self.fila_objetivo[valor - 1], self.columna_objetivo[valor - 1] = divmod(pos, n)
+
+        # La parte horizontal es la vertical del tablero traspuesto
+        filas = tuple(None if valor == 16 else pos // n for pos, valor in enumerate(objetivo))
+        traspuesto = [objetivo[(pos % n) * n + pos // n] for pos in range(n * n)]
+        columnas = tuple(None if valor == 16 else pos // n
+                         for pos, valor in enumerate(traspuesto))
+        vacio = objetivo.index(16)
+        self.tabla_vertical = _tabla_caminante(filas, vacio // n, n)
+        self.tabla_horizontal = _tabla_caminante(columnas, vacio % n, n)
+
+    def evaluar(self, codigo):
+        """
+        Calcula la heurística de un tablero.
+
+        Parameters
+        ----------
+        codigo : int
+            Tablero codificado con `main.empaquetar`.
+
+        Returns
+        -------
+        tuple
+            Una tupla (h, memoria).
+        """
+        n = self.n
+        vertical = horizontal = 0
+        for pos in range(n * n):
+            t = (codigo >> (4 * pos)) & 15
+            fila, columna = divmod(pos, n)
+            if t == 15:
+                vertical += fila << self._desplazamiento_vacio
+                horizontal += columna << self._desplazamiento_vacio
+            else:
+                vertical += 1 << (3 * (fila * n + self.fila_objetivo[t]))
+                horizontal += 1 << (3 * (columna * n + self.columna_objetivo[t]))
+        return (self.tabla_vertical[vertical] + self.tabla_horizontal[horizontal],
+                (vertical, horizontal))
+
+    def mover(self, memoria, codigo, t, desde, hasta):
+        """
+        Actualiza la heurística tras mover una loseta.
+
+        Parameters
+        ----------
+        memoria : tuple of int
+            Estados vertical y horizontal del tablero padre.
+        codigo : int
+            Tablero codificado tras el movimiento (no se usa).
+        t : int
+            Loseta movida, codificada como en `main.empaquetar`.
+        desde, hasta : int
+            Posiciones de origen y destino de la loseta.
+
+        Returns
+        -------
+        tuple
+            Una tupla (h, memoria) del tablero tras el movimiento.
+        """
+        n = self.n
+        vertical, horizontal = memoria
+        fila_desde, columna_desde = divmod(desde, n)
+        fila_hasta, columna_hasta = divmod(hasta, n)
+        # La loseta pasa de la línea `desde` a la `hasta`, y el vacío al revés
+        if fila_desde != fila_hasta:
+            j = self.fila_objetivo[t]
+            vertical += ((1 << (3 * (fila_hasta * n + j))) - (1 << (3 * (fila_desde * n + j)))
+                         + ((fila_desde - fila_hasta) << self._desplazamiento_vacio))
+        else:
+            j = self.columna_objetivo[t]
+            horizontal += ((1 << (3 * (columna_hasta * n + j)))
+                           - (1 << (3 * (columna_desde * n + j)))
+                           + ((columna_desde - columna_hasta) << self._desplazamiento_vacio))
+        return (self.tabla_vertical[vertical] + self.tabla_horizontal[horizontal],
+                (vertical, horizontal))
+
+
+def comprobar_admisibilidad(heuristica, instancias=None, objetivo=CONFIG_FINAL):
+    """
+    Verifica una heurística contra los costos reales de soluciones óptimas.
+
+    Resuelve cada instancia con `ramificacion_y_poda` y la distancia de
+    Manhattan, y comprueba en cada estado del camino óptimo que h no supera
+    los movimientos que faltan y que el valor de `heuristica.mover` coincide
+    con el de `heuristica.evaluar`.
+
+    Parameters
+    ----------
+    heuristica : object
+        Heurística con la interfaz de `main.HeuristicaManhattan`.
+    instancias : list of list of int, optional
+        Estados iniciales con solución. Por defecto `INSTANCIAS`.
+    objetivo : list of int, optional
+        Estado objetivo del tablero. Por defecto `CONFIG_FINAL`.
+
+    Returns
+    -------
+    list of tuple
+        Una tupla (instancia, paso, h, movimientos_restantes) por cada
+        violación encontrada; la lista vacía indica que no hubo ninguna.
+    """
+    if instancias is None:
+        instancias = INSTANCIAS
+    violaciones = []
+    for i, instancia in enumerate(instancias):
+        camino, _, _ = ramificacion_y_poda(list(instancia), objetivo)
+        codigos = [empaquetar(estado) for estado in camino]
+        h, memoria = heuristica.evaluar(codigos[0])
+        for paso, codigo in enumerate(codigos):
+            if paso > 0:
+                anterior = codigos[paso - 1]
+                desde = camino[paso].index(16)
+                hasta = camino[paso - 1].index(16)
+                t = (anterior >> (4 * desde)) & 15
+                h, memoria = heuristica.mover(memoria, codigo, t, desde, hasta)
+                if h != heuristica.evaluar(codigo)[0]:
+                    raise ValueError(f"La actualización incremental difiere de la evaluación "
+                                     f"completa en la instancia {i}, paso {paso}.")
+            restantes = len(codigos) - 1 - paso
+            if h > restantes:
+                violaciones.append((i, paso, h, restantes))
+    return violaciones
+
+
+def comparar_heuristicas(nombres=None, instancias=None, objetivo=CONFIG_FINAL):
+    """
+    Compara los nodos explorados por cada heurística en las mismas instancias.
+
+    Parameters
+    ----------
+    nombres : list of str, optional
+        Heurísticas de `main.HEURISTICAS`. Por defecto "manhattan",
+        "conflicto_lineal" y "caminante".
+    instancias : list of list of int, optional
+        Estados iniciales con solución. Por defecto `INSTANCIAS`.
+    objetivo : list of int, optional
+        Estado objetivo del tablero. Por defecto `CONFIG_FINAL`.
+
+    Returns
+    -------
+    list of dict
+        Un registro por instancia y heurística, con las claves "instancia",
+        "heuristica", "movimientos", "nodos" y "tiempo".
+
+    Raises
+    ------
+    ValueError
+        Si dos heurísticas dan soluciones de distinta longitud, lo que
+        indicaría que alguna no es admisible.
+    """
+    if nombres is None:
+        nombres = ["manhattan", "conflicto_lineal", "caminante"]
+    if instancias is None:
+        instancias = INSTANCIAS
+    heuristicas = {nombre: HEURISTICAS[nombre][0](objetivo) for nombre in nombres}
+
+    registros = []
+    for i, instancia in enumerate(instancias):
+        longitudes = set()
+        for nombre, heuristica in heuristicas.items():
+            camino, nodos, tiempo = ramificacion_y_poda(list(instancia), objetivo, heuristica)
+            longitudes.add(len(camino) - 1)
+            registros.append({"instancia": i, "heuristica": nombre, "movimientos": len(camino) - 1,
+                              "nodos": nodos, "tiempo": tiempo})
+        if len(longitudes) > 1:
+            raise ValueError(f"Las heurísticas dan soluciones de distinta longitud en la "
+                             f"instancia {i}: {sorted(longitudes)}")
+    return registros
+
+
+def main():
+    """Comprueba las heurísticas y muestra la comparación de nodos explorados."""
+    nombres = sys.argv[1:] or ["manhattan", "conflicto_lineal", "caminante"]
+
+    print("Comprobando admisibilidad sobre las soluciones óptimas...")
+    for nombre in nombres:
+        violaciones = comprobar_admisibilidad(HEURISTICAS[nombre][0](CONFIG_FINAL))
+        print(f"  {nombre}: {'admisible' if not violaciones else violaciones}")
+
+    inicio = time.time()
+    registros = comparar_heuristicas(nombres)
+    print(f"\n{'Instancia':>9} {'Movs':>5} " + " ".join(f"{nombre:>17}" for nombre in nombres))
+    for i in range(len(INSTANCIAS)):
+        fila = [r for r in registros if r["instancia"] == i]
+        print(f"{i:>9} {fila[0]['movimientos']:>5} "
+              + " ".join(f"{r['nodos']:>17}" for r in fila))
+    totales = [sum(r["nodos"] for r in registros if r["heuristica"] == nombre) for nombre in nombres]
+    print(f"{'Total':>15} " + " ".join(f"{total:>17}" for total in totales))
+    print(f"\nTiempo total: {time.time() - inicio:.2f} segundos")
+
+
+if __name__ == "__main__":
+    main()
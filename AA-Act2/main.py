@@ -11,12 +11,19 @@ Email: dap465@gmail.com
 
 Contenido
 ---------
+- Clases
+    - HeuristicaManhattan: Distancia de Manhattan con actualización incremental.
 - Funciones
+    - empaquetar: Codifica un tablero en un entero de 4 bits por loseta.
+    - desempaquetar: Convierte un tablero codificado de nuevo en lista.
     - mostrar_tablero: Muestra el tablero del puzzle en consola.
+    - tabla_manhattan: Precalcula la distancia de Manhattan de cada loseta.
     - calcular_heuristica: Calcula la distancia de Manhattan.
     - obtener_movimientos_validos: Obtiene los movimientos posibles.
+    - obtener_movimientos_empaquetados: Movimientos posibles sobre tableros codificados.
     - comprobar: Verifica si un puzzle tiene solución.
     - ramificacion_y_poda: Resuelve el puzzle usando ramificación y poda.
+    - ida_estrella: Resuelve el puzzle con A* de profundización iterativa.
     - validar_solucion: Valida que una secuencia de movimientos sea correcta.
     - comprobar: Verifica si un estado del puzzle tiene solución.
 
@@ -26,9 +33,16 @@ CONFIG_INICIAL : list of int
     Configuración inicial del tablero.
 CONFIG_FINAL : list of int
     Configuración objetivo del tablero.
+HEURISTICAS : dict
+    Heurísticas disponibles en `main`, por nombre.
+MOTORES : dict
+    Algoritmos de búsqueda disponibles en `main`, por nombre.
 """
 
+import functools
 import heapq
+import math
+import sys
 import time
 
 # Configuraciones del puzzle
@@ -39,6 +53,59 @@ CONFIG_INICIAL = [1, 2, 3, 4, 5, 6, 7, 8, 9, 16, 10, 12, 11, 15, 13, 14] # Soluc
 CONFIG_FINAL = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]
 
 
+def empaquetar(estado):
+    """
+    Codifica un tablero en un único entero, con 4 bits por loseta.
+
+    La loseta de la posición i ocupa los bits 4i a 4i + 3 y se guarda como
+    su valor menos uno, de modo que el espacio vacío (16) es 15 (0b1111).
+    Un tablero de 4x4 cabe así en 64 bits.
+
+    Parameters
+    ----------
+    estado : list of int
+        Estado del tablero como lista, con 16 para el espacio vacío.
+
+    Returns
+    -------
+    int
+        El tablero codificado.
+
+    Examples
+    --------
+    >>> hex(empaquetar([2, 1, 16, 3]))
+    '0x2f01'
+    """
+    codigo = 0
+    for i, valor in enumerate(estado):
+        codigo |= (valor - 1) << (4 * i)
+    return codigo
+
+
+def desempaquetar(codigo, n=4):
+    """
+    Convierte un tablero codificado con `empaquetar` de nuevo en lista.
+
+    Parameters
+    ----------
+    codigo : int
+        Tablero codificado.
+    n : int, optional
+        Tamaño del tablero (n x n). Por defecto 4.
+
+    Returns
+    -------
+    list of int
+        Estado del tablero como lista, con 16 para el espacio vacío.
+
+    Examples
+    --------
+    >>> desempaquetar(0x2f01, 2)
+    [2, 1, 16, 3]
+    """
+    return [((codigo >> (4 * i)) & 15) + 1 for i in range(n * n)]
+
+
 def mostrar_tablero(lista, n):
     """
     Muestra el tablero del puzzle en formato visual.
@@ -48,8 +115,9 @@ def mostrar_tablero(lista, n):
 
     Parameters
     ----------
-    lista : list of int
-        Lista que representa el estado actual del tablero.
+    lista : list of int or int
+        Lista que representa el estado actual del tablero, o el tablero
+        codificado con `empaquetar`.
     n : int
         Tamaño del tablero (n x n).
 
@@ -66,6 +134,9 @@ def mostrar_tablero(lista, n):
     |13 |14 |15 |   |
     +---+---+---+---+
     """
+    if isinstance(lista, int):
+        lista = desempaquetar(lista, n)
+
     print()
     for i in range(n + 1):
         for j in range(n):
@@ -81,6 +152,49 @@ def mostrar_tablero(lista, n):
             print("|")
 
 
+@functools.lru_cache(maxsize=None)
+def _tabla_manhattan(objetivo):
+    """`tabla_manhattan` para un objetivo dado como tupla (memorizable)."""
+    n = int(len(objetivo) ** 0.5)
+    # Una fila por código de 4 bits, para que el 16 tenga fila en cualquier tablero
+    tabla = [(0,) * (n * n)] * 16
+    for pos_objetivo, valor in enumerate(objetivo):
+        if valor != 16:  # El espacio vacío no cuenta: su fila queda a cero
+            fila_objetivo, col_objetivo = divmod(pos_objetivo, n)
+            tabla[valor - 1] = tuple(
+                abs(pos // n - fila_objetivo) + abs(pos % n - col_objetivo)
+                for pos in range(n * n)
+            )
+    return tuple(tabla)
+
+
+def tabla_manhattan(objetivo):
+    """
+    Precalcula la distancia de Manhattan de cada loseta en cada posición.
+
+    Parameters
+    ----------
+    objetivo : list of int
+        Estado objetivo del tablero.
+
+    Returns
+    -------
+    tuple of tuple of int
+        Tabla donde `tabla[valor - 1][pos]` es la distancia de la loseta
+        `valor` en la posición `pos` hasta su posición en `objetivo`. La
+        fila del espacio vacío (16) vale cero. El índice `valor - 1` es el
+        que guarda `empaquetar`, así que sirve tal cual con tableros
+        codificados. Las tablas se calculan una vez por objetivo.
+
+    Examples
+    --------
+    >>> tabla = tabla_manhattan([1, 2, 3, 16])
+    >>> tabla[0], tabla[2], tabla[15]
+    ((0, 1, 1, 2), (1, 2, 0, 1), (0, 0, 0, 0))
+    """
+    return _tabla_manhattan(tuple(objetivo))
+
+
 def calcular_heuristica(estado, objetivo):
     """
     Calcula la distancia de Manhattan entre el estado actual y el objetivo.
@@ -105,32 +219,98 @@ def calcular_heuristica(estado, objetivo):
     Esta heurística es admisible (nunca sobreestima el costo real) y se usa
     en el algoritmo A* para guiar la búsqueda hacia la solución óptima.
 
+    Las distancias se leen de `tabla_manhattan`, por lo que el cálculo es
+    O(n^2) en el número de casillas sin buscar cada loseta en `objetivo`.
+    Durante la búsqueda no hace falta recalcularla: un movimiento solo cambia
+    la posición de una loseta (ver `ramificacion_y_poda`).
+
     Examples
     --------
     >>> calcular_heuristica([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 16, 15],
     ...                     [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16])
     2
     """
-    n = int(len(estado) ** 0.5)
-    distancia = 0
+    tabla = tabla_manhattan(objetivo)
+    return sum(tabla[valor - 1][pos] for pos, valor in enumerate(estado))
 
-    for i, valor in enumerate(estado):
-        if valor != 16:  # No calcular para el espacio vacío
-            # Posición actual
-            fila_actual = i // n
-            col_actual = i % n
-
-            # Posición objetivo
-            pos_objetivo = objetivo.index(valor)
-            fila_objetivo = pos_objetivo // n
-            col_objetivo = pos_objetivo % n
-
-            # Distancia de Manhattan
-            distancia += abs(fila_actual - fila_objetivo) + abs(
-                col_actual - col_objetivo
-            )
 
-    return distancia
+class HeuristicaManhattan:
+    """
+    Distancia de Manhattan con actualización incremental, para los motores.
+
+    Los motores de búsqueda (`ramificacion_y_poda` e `ida_estrella`) usan
+    cualquier heurística con esta misma interfaz: `evaluar` calcula h de un
+    tablero codificado junto con una memoria auxiliar, y `mover` obtiene la
+    h y la memoria de un sucesor a partir de las del padre, sabiendo qué
+    loseta se movió. La memoria es opaca para el motor, que solo la guarda
+    y la devuelve; aquí es la propia h.
+
+    Attributes
+    ----------
+    tabla : tuple of tuple of int
+        Distancias de `tabla_manhattan` hacia el objetivo.
+    consistente : bool
+        Si h nunca baja más de 1 en un movimiento. Con heurísticas solo
+        admisibles (False), `ramificacion_y_poda` reabre los estados que
+        alcanza por un camino más corto para seguir siendo óptimo.
+
+    Examples
+    --------
+    >>> heuristica = HeuristicaManhattan([1, 2, 3, 16])
+    >>> h, memoria = heuristica.evaluar(empaquetar([1, 16, 3, 2]))
+    >>> h
+    1
+    >>> heuristica.mover(memoria, empaquetar([1, 2, 3, 16]), 1, 3, 1)
+    (0, 0)
+    """
+
+    consistente = True
+
+    def __init__(self, objetivo):
+        self.tabla = tabla_manhattan(objetivo)
+
+    def evaluar(self, codigo):
+        """
+        Calcula la heurística de un tablero.
+
+        Parameters
+        ----------
+        codigo : int
+            Tablero codificado con `empaquetar`.
+
+        Returns
+        -------
+        tuple
+            Una tupla (h, memoria) con la heurística y la memoria que recibe
+            `mover` para los sucesores.
+        """
+        tabla = self.tabla
+        h = sum(tabla[(codigo >> (4 * pos)) & 15][pos] for pos in range(len(tabla[0])))
+        return h, h
+
+    def mover(self, memoria, codigo, t, desde, hasta):
+        """
+        Actualiza la heurística tras mover una loseta.
+
+        Parameters
+        ----------
+        memoria : object
+            Memoria del tablero padre, devuelta por `evaluar` o `mover`.
+        codigo : int
+            Tablero codificado tras el movimiento.
+        t : int
+            Loseta movida, codificada como en `empaquetar` (valor - 1).
+        desde, hasta : int
+            Posiciones de origen y destino de la loseta.
+
+        Returns
+        -------
+        tuple
+            Una tupla (h, memoria) del tablero tras el movimiento.
+        """
+        distancias = self.tabla[t]
+        h = memoria - distancias[desde] + distancias[hasta]
+        return h, h
 
 
 def obtener_movimientos_validos(estado):
@@ -184,51 +364,70 @@ def obtener_movimientos_validos(estado):
     return movimientos
 
 
-class Nodo:
+@functools.lru_cache(maxsize=None)
+def _tabla_vecinos(n):
+    """Posiciones adyacentes a cada casilla, en el orden arriba, abajo, izquierda, derecha."""
+    tabla = []
+    for pos in range(n * n):
+        fila, col = divmod(pos, n)
+        tabla.append(tuple(
+            (fila + df) * n + col + dc
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+            if 0 <= fila + df < n and 0 <= col + dc < n
+        ))
+    return tuple(tabla)
+
+
+def obtener_movimientos_empaquetados(codigo, pos_vacio, n=4):
     """
-    Representa un nodo en el árbol de búsqueda.
+    Obtiene los movimientos válidos de un tablero codificado.
 
-    Attributes
+    Equivale a `obtener_movimientos_validos` sin crear listas: como el
+    espacio vacío vale 0b1111, intercambiarlo con la loseta t de otra
+    posición es aplicar a ambas casillas un XOR con t ^ 0b1111.
+
+    Parameters
     ----------
-    estado : list of int
-        Estado del tablero en este nodo.
-    costo_g : int
-        Costo del camino desde el estado inicial hasta este nodo.
-    costo_h : int
-        Valor heurístico (distancia de Manhattan al objetivo).
-    costo_f : int
-        Costo total (g + h).
-    padre : Nodo or None
-        Nodo padre en el camino de solución.
-    """
+    codigo : int
+        Tablero codificado con `empaquetar`.
+    pos_vacio : int
+        Posición del espacio vacío en el tablero.
+    n : int, optional
+        Tamaño del tablero (n x n). Por defecto 4.
 
-    def __init__(self, estado, costo_g, costo_h, padre=None):
-        """
-        Inicializa un nuevo nodo.
+    Returns
+    -------
+    list of tuple of int
+        Tuplas (nuevo_codigo, nueva_pos_vacio), una por movimiento, en el
+        mismo orden que `obtener_movimientos_validos`.
 
-        Parameters
-        ----------
-        estado : list of int
-            Estado del tablero.
-        costo_g : int
-            Costo del camino desde el inicio.
-        costo_h : int
-            Valor heurístico.
-        padre : Nodo, optional
-            Nodo padre.
-        """
-        self.estado = estado
-        self.costo_g = costo_g
-        self.costo_h = costo_h
-        self.costo_f = costo_g + costo_h
-        self.padre = padre
+    Examples
+    --------
+    >>> movimientos = obtener_movimientos_empaquetados(empaquetar([1, 2, 3, 16]), 3, 2)
+    >>> [(desempaquetar(codigo, 2), pos) for codigo, pos in movimientos]
+    [([1, 16, 3, 2], 1), ([1, 2, 16, 3], 2)]
+    """
+    desplazamiento_vacio = 4 * pos_vacio
+    movimientos = []
+    for pos in _tabla_vecinos(n)[pos_vacio]:
+        delta = ((codigo >> (4 * pos)) & 15) ^ 15
+        movimientos.append((codigo ^ (delta << desplazamiento_vacio) ^ (delta << (4 * pos)), pos))
+    return movimientos
 
-    def __lt__(self, other):
-        """Comparación para la cola de prioridad."""
-        return self.costo_f < other.costo_f
 
+def _preparar_heuristica(heuristica, objetivo):
+    """Heurística para `objetivo` a partir de un objeto, un nombre de `HEURISTICAS` o None."""
+    if heuristica is None:
+        return HeuristicaManhattan(objetivo)
+    if isinstance(heuristica, str):
+        if heuristica not in HEURISTICAS:
+            raise ValueError(f"Heurística desconocida: {heuristica!r}. "
+                             f"Opciones: {', '.join(HEURISTICAS)}")
+        return HEURISTICAS[heuristica][0](objetivo)
+    return heuristica
 
-def ramificacion_y_poda(estado_inicial, estado_objetivo):
+
+def ramificacion_y_poda(estado_inicial, estado_objetivo, heuristica=None):
     """
     Resuelve el puzzle usando el algoritmo de ramificación y poda (A*).
 
@@ -241,6 +440,10 @@ def ramificacion_y_poda(estado_inicial, estado_objetivo):
         Configuración inicial del tablero.
     estado_objetivo : list of int
         Configuración objetivo del tablero.
+    heuristica : object or str, optional
+        Heurística admisible con la interfaz de `HeuristicaManhattan`,
+        construida para `estado_objetivo`, o su nombre en `HEURISTICAS`.
+        Por defecto, la distancia de Manhattan.
 
     Returns
     -------
@@ -257,6 +460,22 @@ def ramificacion_y_poda(estado_inicial, estado_objetivo):
     2. La heurística de distancia de Manhattan para guiar la búsqueda.
     3. Un conjunto de estados visitados para evitar ciclos.
 
+    Internamente cada estado es un entero de 64 bits (ver `empaquetar`) y
+    los sucesores se generan con operaciones de bits; la cola guarda tuplas
+    de enteros y los visitados, un diccionario de estado a estado padre con
+    el que se reconstruye el camino. Así cada estado ocupa unas decenas de
+    bytes en lugar de una lista y un nodo por estado.
+
+    La heurística de cada sucesor se obtiene de la de su padre con
+    `heuristica.mover`: el movimiento solo desplaza una loseta, así que con
+    Manhattan basta con restar su distancia en la posición de origen y
+    sumar la de destino, ambas leídas de `tabla_manhattan`.
+
+    Si la heurística no es consistente (`heuristica.consistente` es False),
+    un estado ya expandido se vuelve a expandir cuando se alcanza con menor
+    costo g; así la solución sigue siendo óptima con heurísticas que solo
+    son admisibles, como las bases de patrones.
+
     La ramificación ocurre al generar todos los movimientos válidos,
     y la poda se realiza mediante la heurística y evitando estados repetidos.
 
@@ -273,60 +492,181 @@ def ramificacion_y_poda(estado_inicial, estado_objetivo):
         fin_tiempo = time.time()
         return [estado_inicial], 0, fin_tiempo - inicio_tiempo
 
-    # Inicializar estructuras de datos
+    # Los estados se manejan codificados: un entero por tablero
+    n = int(len(estado_inicial) ** 0.5)
+    inicial = empaquetar(estado_inicial)
+    objetivo = empaquetar(estado_objetivo)
+    vecinos = _tabla_vecinos(n)
+    heuristica = _preparar_heuristica(heuristica, estado_objetivo)
+    mover = heuristica.mover
+    consistente = heuristica.consistente
+
+    # Inicializar estructuras de datos. Cada entrada de la cola es
+    # (f, h, g, estado, posición del vacío, estado padre, memoria de la
+    # heurística); ante igual f se expande primero el de menor h, el más
+    # cercano al objetivo
     cola_prioridad = []
-    estados_visitados = set()
+    padres = {}  # estado visitado -> estado padre; también sirve de conjunto de visitados
+    costos = {}  # estado visitado -> g, solo si hay que reabrir estados
     nodos_explorados = 0
 
-    # Nodo inicial
-    h_inicial = calcular_heuristica(estado_inicial, estado_objetivo)
-    nodo_inicial = Nodo(estado_inicial, 0, h_inicial)
-    heapq.heappush(cola_prioridad, nodo_inicial)
+    # Nodo inicial (su padre es -1, que no es ningún estado)
+    h_inicial, memoria = heuristica.evaluar(inicial)
+    heapq.heappush(cola_prioridad,
+                   (h_inicial, h_inicial, 0, inicial, estado_inicial.index(16), -1, memoria))
 
     while cola_prioridad:
-        nodo_actual = heapq.heappop(cola_prioridad)
+        _, _, costo_g, estado, pos_vacio, padre, memoria = heapq.heappop(cola_prioridad)
         nodos_explorados += 1
 
-        # Convertir estado a tupla para poder agregarlo al conjunto
-        estado_tuple = tuple(nodo_actual.estado)
-
-        # Si ya visitamos este estado, continuar
-        if estado_tuple in estados_visitados:
+        # Si ya visitamos este estado, continuar (salvo que se reabra con menor g)
+        if estado in padres and (consistente or costos[estado] <= costo_g):
             continue
 
-        estados_visitados.add(estado_tuple)
+        padres[estado] = padre
+        if not consistente:
+            costos[estado] = costo_g
 
         # Verificar si llegamos al objetivo
-        if nodo_actual.estado == estado_objetivo:
+        if estado == objetivo:
             # Reconstruir camino
             camino = []
-            nodo = nodo_actual
-            while nodo is not None:
-                camino.append(nodo.estado.copy())
-                nodo = nodo.padre
+            while estado != -1:
+                camino.append(desempaquetar(estado, n))
+                estado = padres[estado]
             camino.reverse()
 
             fin_tiempo = time.time()
             return camino, nodos_explorados, fin_tiempo - inicio_tiempo
 
-        # Generar sucesores (ramificación)
-        movimientos_validos = obtener_movimientos_validos(nodo_actual.estado)
-
-        for nuevo_estado in movimientos_validos:
-            nuevo_estado_tuple = tuple(nuevo_estado)
-
+        # Generar sucesores (ramificación), como en obtener_movimientos_empaquetados.
+        # Solo se mueve la loseta t, de nueva_pos a pos_vacio
+        nuevo_g = costo_g + 1
+        desplazamiento_vacio = 4 * pos_vacio
+        for nueva_pos in vecinos[pos_vacio]:
+            t = (estado >> (4 * nueva_pos)) & 15
+            delta = t ^ 15
+            nuevo_estado = estado ^ (delta << desplazamiento_vacio) ^ (delta << (4 * nueva_pos))
             # Poda: si ya visitamos este estado, no lo consideramos
-            if nuevo_estado_tuple not in estados_visitados:
-                nuevo_g = nodo_actual.costo_g + 1
-                nuevo_h = calcular_heuristica(nuevo_estado, estado_objetivo)
-                nuevo_nodo = Nodo(nuevo_estado, nuevo_g, nuevo_h, nodo_actual)
-                heapq.heappush(cola_prioridad, nuevo_nodo)
+            if nuevo_estado in padres and (consistente or costos[nuevo_estado] <= nuevo_g):
+                continue
+            nuevo_h, nueva_memoria = mover(memoria, nuevo_estado, t, nueva_pos, pos_vacio)
+            heapq.heappush(cola_prioridad, (nuevo_g + nuevo_h, nuevo_h, nuevo_g, nuevo_estado,
+                                            nueva_pos, estado, nueva_memoria))
 
     # No se encontró solución
     fin_tiempo = time.time()
     return None, nodos_explorados, fin_tiempo - inicio_tiempo
 
 
+def ida_estrella(estado_inicial, estado_objetivo, heuristica=None):
+    """
+    Resuelve el puzzle usando A* de profundización iterativa (IDA*).
+
+    Realiza búsquedas en profundidad sucesivas limitadas por una cota de
+    f = g + h. La primera cota es la heurística del estado inicial y cada
+    nueva cota es el menor f que superó la anterior, por lo que la primera
+    solución encontrada es óptima, igual que con `ramificacion_y_poda`.
+
+    Parameters
+    ----------
+    estado_inicial : list of int
+        Configuración inicial del tablero.
+    estado_objetivo : list of int
+        Configuración objetivo del tablero.
+    heuristica : object or str, optional
+        Heurística admisible con la interfaz de `HeuristicaManhattan`,
+        construida para `estado_objetivo`, o su nombre en `HEURISTICAS`.
+        Por defecto, la distancia de Manhattan.
+
+    Returns
+    -------
+    tuple
+        Una tupla conteniendo:
+        - camino (list of list of int): Secuencia de estados desde inicial hasta objetivo.
+        - nodos_explorados (int): Número de nodos explorados, sumando todas las iteraciones.
+        - tiempo_ejecucion (float): Tiempo de ejecución en segundos.
+
+    Notes
+    -----
+    A diferencia de `ramificacion_y_poda`, no guarda la cola ni los estados
+    visitados: solo el camino actual, así que la memoria es lineal en la
+    profundidad de la solución y no en el número de nodos. A cambio, los
+    estados se pueden revisitar entre iteraciones y por caminos distintos;
+    solo se poda el movimiento que deshace el anterior. La heurística se
+    actualiza en cada movimiento con `heuristica.mover`.
+
+    Si el puzzle no tiene solución la búsqueda no termina, por lo que debe
+    comprobarse antes con `comprobar`.
+
+    References
+    ----------
+    Korf, R. E. (1985). Depth-first iterative-deepening: An optimal
+    admissible tree search. Artificial Intelligence, 27(1), 97-109.
+
+    Examples
+    --------
+    >>> camino, nodos, _ = ida_estrella([1, 2, 3, 4, 5, 6, 16, 7, 8],
+    ...                                 [1, 2, 3, 4, 5, 6, 7, 8, 16])
+    >>> len(camino) - 1, nodos
+    (2, 3)
+    """
+    inicio_tiempo = time.time()
+
+    n = int(len(estado_inicial) ** 0.5)
+    objetivo = empaquetar(estado_objetivo)
+    vecinos = _tabla_vecinos(n)
+    heuristica = _preparar_heuristica(heuristica, estado_objetivo)
+    mover = heuristica.mover
+
+    # Camino actual de estados codificados; es lo único que crece con la búsqueda
+    camino = [empaquetar(estado_inicial)]
+    nodos_explorados = 0
+
+    def buscar(estado, pos_vacio, pos_anterior, costo_g, memoria, cota):
+        """Búsqueda limitada por `cota`; None si llega al objetivo, o el menor f podado."""
+        nonlocal nodos_explorados
+        nodos_explorados += 1
+        if estado == objetivo:
+            return None
+
+        minimo = math.inf
+        nuevo_g = costo_g + 1
+        desplazamiento_vacio = 4 * pos_vacio
+        for nueva_pos in vecinos[pos_vacio]:
+            # Poda: volver a la posición anterior deshace el último movimiento
+            if nueva_pos == pos_anterior:
+                continue
+            t = (estado >> (4 * nueva_pos)) & 15
+            delta = t ^ 15
+            nuevo_estado = estado ^ (delta << desplazamiento_vacio) ^ (delta << (4 * nueva_pos))
+            nuevo_h, nueva_memoria = mover(memoria, nuevo_estado, t, nueva_pos, pos_vacio)
+            f = nuevo_g + nuevo_h
+            if f > cota:
+                minimo = min(minimo, f)
+                continue
+
+            camino.append(nuevo_estado)
+            resultado = buscar(nuevo_estado, nueva_pos, pos_vacio, nuevo_g, nueva_memoria, cota)
+            if resultado is None:
+                return None
+            camino.pop()
+            minimo = min(minimo, resultado)
+        return minimo
+
+    cota, memoria = heuristica.evaluar(camino[0])
+    while True:
+        cota = buscar(camino[0], estado_inicial.index(16), -1, 0, memoria, cota)
+        if cota is None:
+            fin_tiempo = time.time()
+            camino = [desempaquetar(estado, n) for estado in camino]
+            return camino, nodos_explorados, fin_tiempo - inicio_tiempo
+        if cota == math.inf:
+            # Ningún movimiento posible: no se encontró solución
+            fin_tiempo = time.time()
+            return None, nodos_explorados, fin_tiempo - inicio_tiempo
+
+
 def validar_solucion(camino, estado_inicial, estado_objetivo):
     """
     Valida que una secuencia de movimientos sea correcta.
@@ -337,7 +677,8 @@ def validar_solucion(camino, estado_inicial, estado_objetivo):
     Parameters
     ----------
     camino : list of list of int
-        Secuencia de estados del tablero.
+        Secuencia de estados del tablero, como listas o codificados con
+        `empaquetar`.
     estado_inicial : list of int
         Estado inicial esperado.
     estado_objetivo : list of int
@@ -358,6 +699,10 @@ def validar_solucion(camino, estado_inicial, estado_objetivo):
     if not camino:
         return False
 
+    n = int(len(estado_inicial) ** 0.5)
+    camino = [desempaquetar(estado, n) if isinstance(estado, int) else estado
+              for estado in camino]
+
     # Verificar estados inicial y final
     if camino[0] != estado_inicial or camino[-1] != estado_objetivo:
         return False
@@ -468,17 +813,78 @@ def comprobar(estado):
     return tiene_solucion, mensaje
 
 
-def main():
+def _heuristica_patrones(particion):
+    """Construye la heurística de bases de patrones; el módulo se importa al usarla."""
+    def construir(objetivo):
+        from bases_patrones import BasesPatrones  # pylint: disable=import-outside-toplevel
+        return BasesPatrones(particion, objetivo)
+    return construir
+
+
+def _heuristica_conflicto_lineal(objetivo):
+    """Construye `heuristicas.HeuristicaConflictoLineal`; el módulo se importa al usarla."""
+    from heuristicas import HeuristicaConflictoLineal  # pylint: disable=import-outside-toplevel
+    return HeuristicaConflictoLineal(objetivo)
+
+
+def _heuristica_caminante(objetivo):
+    """Construye `heuristicas.HeuristicaCaminante`; el módulo se importa al usarla."""
+    from heuristicas import HeuristicaCaminante  # pylint: disable=import-outside-toplevel
+    return HeuristicaCaminante(objetivo)
+
+
+# Heurísticas disponibles: nombre -> (constructor a partir del objetivo, descripción)
+HEURISTICAS = {
+    "manhattan": (HeuristicaManhattan, "Distancia de Manhattan"),
+    "conflicto_lineal": (_heuristica_conflicto_lineal, "Manhattan con conflictos lineales"),
+    "caminante": (_heuristica_caminante, "Distancia caminante"),
+    "patrones": (_heuristica_patrones("5-5-5"), "Bases de patrones aditivas 5-5-5"),
+    "patrones_663": (_heuristica_patrones("6-6-3"), "Bases de patrones aditivas 6-6-3"),
+}
+
+# Algoritmos de búsqueda disponibles: nombre -> (función, descripción)
+MOTORES = {
+    "a_estrella": (ramificacion_y_poda, "Ramificación y Poda (A*)"),
+    "ida_estrella": (ida_estrella, "A* de profundización iterativa (IDA*)"),
+}
+
+
+def main(motor="a_estrella", heuristica="manhattan"):
     """
     Función principal que ejecuta el solucionador del puzzle.
 
-    Muestra la configuración inicial, ejecuta el algoritmo de ramificación
-    y poda, y presenta los resultados incluyendo el camino de solución,
+    Muestra la configuración inicial, ejecuta el algoritmo de búsqueda
+    elegido y presenta los resultados incluyendo el camino de solución,
     estadísticas de rendimiento y validación.
+
+    Parameters
+    ----------
+    motor : str, optional
+        Nombre del algoritmo en `MOTORES`. Por defecto "a_estrella"; con
+        "ida_estrella" la memoria usada es lineal en la longitud de la
+        solución. Desde la línea de comandos se pasa como primer argumento.
+    heuristica : str, optional
+        Nombre de la heurística en `HEURISTICAS`. Por defecto "manhattan".
+        Las bases de patrones se generan la primera vez que se usan. Desde
+        la línea de comandos se pasa como segundo argumento.
+
+    Raises
+    ------
+    ValueError
+        Si el motor o la heurística no existen.
     """
+    if motor not in MOTORES:
+        raise ValueError(f"Motor desconocido: {motor!r}. Opciones: {', '.join(MOTORES)}")
+    if heuristica not in HEURISTICAS:
+        raise ValueError(f"Heurística desconocida: {heuristica!r}. "
+                         f"Opciones: {', '.join(HEURISTICAS)}")
+    resolver, descripcion = MOTORES[motor]
+    construir_heuristica, descripcion_heuristica = HEURISTICAS[heuristica]
+
     print("=" * 60)
     print("SOLUCIONADOR DEL PUZLE DE LAS LOSETAS")
-    print("Algoritmo: Ramificación y Poda (A*)")
+    print(f"Algoritmo: {descripcion}")
+    print(f"Heurística: {descripcion_heuristica}")
     print("=" * 60)
 
     print("\nConfiguración inicial:")
@@ -503,7 +909,7 @@ def main():
     print("-" * 40)
 
     # Resolver el puzzle
-    resultado = ramificacion_y_poda(CONFIG_INICIAL, CONFIG_FINAL)
+    resultado = resolver(CONFIG_INICIAL, CONFIG_FINAL, construir_heuristica(CONFIG_FINAL))
     camino, nodos_explorados, tiempo_ejecucion = resultado
 
     if camino is None:
@@ -539,4 +945,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:3])
@@ -0,0 +1,198 @@
+"""
+Pruebas del puzzle de losetas sobre el espacio completo del tablero de 3x3.
+
+El tablero de 3x3 tiene 181440 estados alcanzables, pocos para recorrerlos
+todos con una búsqueda en anchura desde el objetivo: así se conoce la
+distancia óptima de cada estado y se comparan con ella los motores
+de búsqueda y las heurísticas.
+
+Contenido
+---------
+- Funciones
+    - distancias_3x3: Distancia óptima al objetivo de cada estado de 3x3.
+    - test_empaquetar_ida_y_vuelta: `desempaquetar` invierte `empaquetar`.
+    - test_movimientos_empaquetados: Mismos sucesores que con listas.
+    - test_motor_optimo: Cada motor, con cada heurística, da caminos óptimos.
+    - test_manhattan_incremental: La actualización con `tabla_manhattan`
+      coincide con `calcular_heuristica`.
+    - test_mover_coincide_con_evaluar: La actualización incremental de cada
+      heurística coincide con su evaluación completa.
+    - test_heuristica_admisible: Ninguna heurística sobreestima en 3x3.
+    - test_heuristicas_dominan_a_manhattan: Conflictos lineales y distancia
+      caminante nunca son menores que Manhattan.
+"""
+import collections
+import functools
+import random
+
+import pytest
+
+from bases_patrones import BasesPatrones
+from heuristicas import HeuristicaCaminante, HeuristicaConflictoLineal, comprobar_admisibilidad
+from main import (
+    CONFIG_FINAL,
+    HEURISTICAS,
+    MOTORES,
+    HeuristicaManhattan,
+    calcular_heuristica,
+    desempaquetar,
+    empaquetar,
+    obtener_movimientos_empaquetados,
+    obtener_movimientos_validos,
+    tabla_manhattan,
+    validar_solucion,
+)
+
+OBJETIVO_3X3 = [1, 2, 3, 4, 5, 6, 7, 8, 16]
+OBJETIVOS = {3: OBJETIVO_3X3, 4: CONFIG_FINAL}
+
+# Particiones pequeñas: las bases se generan en un directorio temporal en décimas de segundo
+PARTICIONES_PRUEBA = {3: [(1, 2, 3, 4), (5, 6, 7, 8)], 4: [(1, 2, 3), (5, 6, 7), (4, 8, 12)]}
+
+
+@functools.lru_cache(maxsize=None)
+def distancias_3x3():
+    """
+    Distancia óptima al objetivo de cada estado de 3x3, por búsqueda en anchura.
+
+    Returns
+    -------
+    dict
+        Tablero codificado -> número mínimo de movimientos hasta `OBJETIVO_3X3`.
+    """
+    inicial = empaquetar(OBJETIVO_3X3)
+    distancias = {inicial: 0}
+    cola = collections.deque([(inicial, OBJETIVO_3X3.index(16))])
+    while cola:
+        codigo, pos_vacio = cola.popleft()
+        siguiente = distancias[codigo] + 1
+        for nuevo, nueva_pos in obtener_movimientos_empaquetados(codigo, pos_vacio, 3):
+            if nuevo not in distancias:
+                distancias[nuevo] = siguiente
+                cola.append((nuevo, nueva_pos))
+    return distancias
+
+
+def _instancias(cantidad, semilla):
+    """Estados de 3x3 al azar (y el objetivo) con su distancia óptima."""
+    distancias = distancias_3x3()
+    codigos = random.Random(semilla).sample(sorted(distancias), cantidad)
+    return [(desempaquetar(codigo, 3), distancias[codigo])
+            for codigo in [empaquetar(OBJETIVO_3X3)] + codigos]
+
+
+def _caminata(objetivo, pasos, semilla):
+    """Tableros codificados de un recorrido al azar desde el objetivo, con su vacío."""
+    n = int(len(objetivo) ** 0.5)
+    azar = random.Random(semilla)
+    codigo, pos_vacio = empaquetar(objetivo), objetivo.index(16)
+    recorrido = [(codigo, pos_vacio)]
+    for _ in range(pasos):
+        codigo, pos_vacio = azar.choice(obtener_movimientos_empaquetados(codigo, pos_vacio, n))
+        recorrido.append((codigo, pos_vacio))
+    return recorrido
+
+
+@pytest.fixture(scope="module")
+def directorio_bases(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("bases_patrones"))
+
+
+def _heuristica(nombre, objetivo, directorio):
+    """Construye la heurística `nombre`; las de patrones, con las particiones de prueba."""
+    if nombre.startswith("patrones"):
+        n = int(len(objetivo) ** 0.5)
+        return BasesPatrones(PARTICIONES_PRUEBA[n], objetivo, directorio)
+    return HEURISTICAS[nombre][0](objetivo)
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_empaquetar_ida_y_vuelta(n):
+    azar = random.Random(n)
+    for _ in range(200):
+        estado = azar.sample(range(1, n * n), n * n - 1) + [16]
+        azar.shuffle(estado)
+
+        codigo = empaquetar(estado)
+
+        assert 0 <= codigo < 1 << (4 * n * n)
+        assert desempaquetar(codigo, n) == estado
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_movimientos_empaquetados(n):
+    for codigo, pos_vacio in _caminata(OBJETIVOS[n], 300, n):
+        estado = desempaquetar(codigo, n)
+
+        movimientos = obtener_movimientos_empaquetados(codigo, pos_vacio, n)
+
+        assert [desempaquetar(nuevo, n) for nuevo, _ in movimientos] == \
+            obtener_movimientos_validos(estado)
+        assert all(desempaquetar(nuevo, n).index(16) == pos for nuevo, pos in movimientos)
+
+
+@pytest.mark.parametrize("heuristica", sorted(HEURISTICAS))
+@pytest.mark.parametrize("motor", sorted(MOTORES))
+def test_motor_optimo(motor, heuristica, directorio_bases):
+    resolver = MOTORES[motor][0]
+    for estado, distancia in _instancias(15, 24):
+        camino, nodos, _ = resolver(estado, OBJETIVO_3X3,
+                                    _heuristica(heuristica, OBJETIVO_3X3, directorio_bases))
+
+        assert len(camino) - 1 == distancia
+        assert validar_solucion(camino, estado, OBJETIVO_3X3)
+        assert nodos >= distancia
+
+
+@pytest.mark.parametrize("n", [3, 4])
+def test_manhattan_incremental(n):
+    objetivo = OBJETIVOS[n]
+    tabla = tabla_manhattan(objetivo)
+    recorrido = _caminata(objetivo, 500, 22 + n)
+    h = 0
+
+    for (anterior, pos_anterior), (codigo, pos_vacio) in zip(recorrido, recorrido[1:]):
+        # La loseta t pasa de pos_vacio (el nuevo vacío) a pos_anterior
+        t = (anterior >> (4 * pos_vacio)) & 15
+        h += tabla[t][pos_anterior] - tabla[t][pos_vacio]
+
+        assert h == calcular_heuristica(desempaquetar(codigo, n), objetivo)
+
+
+@pytest.mark.parametrize("n", [3, 4])
+@pytest.mark.parametrize("nombre", sorted(HEURISTICAS))
+def test_mover_coincide_con_evaluar(nombre, n, directorio_bases):
+    heuristica = _heuristica(nombre, OBJETIVOS[n], directorio_bases)
+    recorrido = _caminata(OBJETIVOS[n], 400, n)
+    h, memoria = heuristica.evaluar(recorrido[0][0])
+    assert h == 0
+
+    for (anterior, pos_anterior), (codigo, pos_vacio) in zip(recorrido, recorrido[1:]):
+        t = (anterior >> (4 * pos_vacio)) & 15
+        nuevo_h, memoria = heuristica.mover(memoria, codigo, t, pos_vacio, pos_anterior)
+
+        assert nuevo_h == heuristica.evaluar(codigo)[0]
+        if heuristica.consistente:
+            assert abs(nuevo_h - h) <= 1
+        h = nuevo_h
+
+
+@pytest.mark.parametrize("nombre", sorted(HEURISTICAS))
+def test_heuristica_admisible(nombre, directorio_bases):
+    heuristica = _heuristica(nombre, OBJETIVO_3X3, directorio_bases)
+
+    sobreestimados = [codigo for codigo, distancia in distancias_3x3().items()
+                      if heuristica.evaluar(codigo)[0] > distancia]
+
+    assert sobreestimados == []
+
+
+def test_heuristicas_dominan_a_manhattan():
+    manhattan = HeuristicaManhattan(OBJETIVO_3X3)
+    mejoradas = [HeuristicaConflictoLineal(OBJETIVO_3X3), HeuristicaCaminante(OBJETIVO_3X3)]
+    instancias = [estado for estado, _ in _instancias(10, 25)]
+
+    for heuristica in mejoradas:
+        assert comprobar_admisibilidad(heuristica, instancias, OBJETIVO_3X3) == []
+        for codigo in distancias_3x3():
+            assert heuristica.evaluar(codigo)[0] >= manhattan.evaluar(codigo)[0]
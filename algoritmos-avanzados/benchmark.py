@@ -0,0 +1,356 @@
+"""
+Módulo de pruebas de rendimiento para los motores del par más cercano.
+
+Genera conjuntos de datos reproducibles (a partir de una semilla) en el
+mismo formato de dos líneas que `datos_100.txt`, con distintas
+distribuciones, y mide cada motor con un reloj de alta resolución,
+repeticiones y calentamiento. También registra la memoria pico. Los
+resultados se guardan en JSON y CSV, y opcionalmente como gráficas de
+escalamiento, para detectar regresiones y ubicar el cruce entre O(n^2) y
+O(n log n).
+
+Contenido
+---------
+- Funciones
+    - generar_puntos: Genera coordenadas con una distribución dada.
+    - escribir_archivo: Guarda coordenadas en el formato de dos líneas.
+    - medir_tiempos: Cronometra una función con calentamiento y repeticiones.
+    - medir_memoria_pico: Mide la memoria pico de una ejecución.
+    - ejecutar_benchmark: Ejecuta la batería completa y devuelve los registros.
+    - guardar_resultados: Escribe los registros en JSON y CSV.
+    - graficar_escalamiento: Dibuja tiempo frente a n por distribución.
+
+Attributes
+----------
+DISTRIBUCIONES : dict
+    Generadores de coordenadas disponibles, indexados por nombre.
+
+Examples
+--------
+Desde la línea de comandos::
+
+    python benchmark.py --tamanos 100 1000 10000 --repeticiones 5 --graficar
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from main import MOTORES, encontrar_par_mas_cercano, leer_puntos, par_mas_cercano_fuerza_bruta
+
+
+def _uniforme(n, rng):
+    rango = max(1000, 10 * n)
+    return ([rng.randint(-rango, rango) for _ in range(n)],
+            [rng.randint(-rango, rango) for _ in range(n)])
+
+
+def _agrupado(n, rng):
+    rango = max(1000, 10 * n)
+    centros = [(rng.randint(-rango, rango), rng.randint(-rango, rango))
+               for _ in range(max(1, n // 1000))]
+    dispersion = rango / 100
+    xs, ys = [], []
+    for _ in range(n):
+        cx, cy = rng.choice(centros)
+        xs.append(round(rng.gauss(cx, dispersion)))
+        ys.append(round(rng.gauss(cy, dispersion)))
+    return xs, ys
+
+
+def _duplicados(n, rng):
+    rango = max(1000, 10 * n)
+    distintos = [(rng.randint(-rango, rango), rng.randint(-rango, rango))
+                 for _ in range(max(1, n // 10))]
+    puntos = [rng.choice(distintos) for _ in range(n)]
+    return [p[0] for p in puntos], [p[1] for p in puntos]
+
+
+def _colineal(n, rng):
+    # Todos los puntos en la misma vertical: el peor caso para dividir por x
+    rango = max(1000, 10 * n)
+    return [0] * n, [rng.randint(-rango, rango) for _ in range(n)]
+
+
+def _rango_enorme(n, rng):
+    rango = 2**40
+    return ([rng.randint(-rango, rango) for _ in range(n)],
+            [rng.randint(-rango, rango) for _ in range(n)])
+
+
+DISTRIBUCIONES = {
+    "uniforme": _uniforme,
+    "agrupado": _agrupado,
+    "duplicados": _duplicados,
+    "colineal": _colineal,
+    "rango_enorme": _rango_enorme,
+}
+
+
+def generar_puntos(distribucion, n, semilla=0):
+    """
+    Genera coordenadas enteras con una distribución dada.
+
+    Parameters
+    ----------
+    distribucion : str
+        Una de las claves de `DISTRIBUCIONES`.
+    n : int
+        Número de puntos.
+    semilla : int, optional
+        Semilla del generador; la misma semilla produce los mismos puntos.
+
+    Returns
+    -------
+    tuple of list of int
+        Listas (xs, ys) de coordenadas.
+    """
+    return DISTRIBUCIONES[distribucion](n, random.Random(f"{distribucion}-{n}-{semilla}"))
+
+
+def escribir_archivo(nombre_archivo, xs, ys):
+    """
+    Guarda las coordenadas en el formato de dos líneas de `leer_puntos`.
+
+    Parameters
+    ----------
+    nombre_archivo : str
+        Ruta del archivo de salida.
+    xs, ys : list of int
+        Coordenadas x e y.
+    """
+    with open(nombre_archivo, "w", encoding="utf-8") as salida:
+        salida.write(",".join(map(str, xs)) + "\n")
+        salida.write(",".join(map(str, ys)) + "\n")
+
+
+def medir_tiempos(funcion, argumento, repeticiones=5, calentamiento=1):
+    """
+    Cronometra `funcion(argumento)` con `time.perf_counter`.
+
+    Parameters
+    ----------
+    funcion : callable
+        Función a medir.
+    argumento : object
+        Argumento único de la función.
+    repeticiones : int, optional
+        Número de ejecuciones medidas. Por defecto 5.
+    calentamiento : int, optional
+        Ejecuciones previas no medidas. Por defecto 1.
+
+    Returns
+    -------
+    tuple
+        Una tupla (tiempos, resultado) con la lista de tiempos en segundos
+        y el resultado de la última ejecución.
+    """
+    resultado = None
+    for _ in range(calentamiento):
+        resultado = funcion(argumento)
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(argumento)
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos, resultado
+
+
+def medir_memoria_pico(funcion, argumento):
+    """
+    Mide la memoria pico asignada durante `funcion(argumento)`.
+
+    Se hace en una ejecución aparte porque `tracemalloc` distorsiona los
+    tiempos. NumPy también informa sus asignaciones a `tracemalloc`.
+
+    Returns
+    -------
+    int
+        Bytes asignados en el pico, por encima de lo ya asignado al empezar.
+    """
+    tracemalloc.start()
+    try:
+        funcion(argumento)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico
+
+
+def _motores_disponibles(nombres, semilla):
+    """Devuelve las funciones (puntos) -> (p, q, dist) de cada motor pedido."""
+    motores = {}
+    for nombre in nombres:
+        if nombre == "fuerza_bruta":
+            motores[nombre] = par_mas_cercano_fuerza_bruta
+        elif nombre == "rejilla":
+            motores[nombre] = lambda puntos: encontrar_par_mas_cercano(
+                puntos, "rejilla", semilla=semilla)
+        elif nombre in MOTORES:
+            motores[nombre] = lambda puntos, motor=nombre: encontrar_par_mas_cercano(
+                puntos, motor)
+        else:
+            raise ValueError(f"Motor desconocido: {nombre!r}")
+    return motores
+
+
+def ejecutar_benchmark(tamanos, distribuciones, motores, repeticiones=5, calentamiento=1,
+                       semilla=0, limite_fuerza_bruta=5000, directorio_datos=None):
+    """
+    Ejecuta todos los motores sobre todos los conjuntos generados.
+
+    Parameters
+    ----------
+    tamanos : list of int
+        Números de puntos a probar.
+    distribuciones : list of str
+        Claves de `DISTRIBUCIONES`.
+    motores : list of str
+        "fuerza_bruta" o claves de `MOTORES`.
+    repeticiones, calentamiento : int, optional
+        Ver `medir_tiempos`.
+    semilla : int, optional
+        Semilla de los datos y del motor "rejilla".
+    limite_fuerza_bruta : int, optional
+        Tamaño máximo para el que se ejecuta la fuerza bruta. Por defecto 5000.
+    directorio_datos : str, optional
+        Donde se escriben los archivos generados; por defecto, un directorio
+        temporal que se borra al terminar.
+
+    Returns
+    -------
+    list of dict
+        Un registro por (distribución, n, motor) con los tiempos, la memoria
+        pico, la distancia encontrada y si coincide con la de los demás motores.
+    """
+    funciones = _motores_disponibles(motores, semilla)
+    registros = []
+    with tempfile.TemporaryDirectory() as temporal:
+        directorio = directorio_datos or temporal
+        os.makedirs(directorio, exist_ok=True)
+        for distribucion in distribuciones:
+            for n in tamanos:
+                nombre_archivo = os.path.join(directorio, f"{distribucion}_{n}_{semilla}.txt")
+                escribir_archivo(nombre_archivo, *generar_puntos(distribucion, n, semilla))
+                tiempos_lectura, puntos = medir_tiempos(leer_puntos, nombre_archivo, 1, 0)
+
+                inicio = len(registros)
+                distancias = {}
+                for motor, funcion in funciones.items():
+                    if motor == "fuerza_bruta" and n > limite_fuerza_bruta:
+                        continue
+                    tiempos, (_, _, distancia) = medir_tiempos(
+                        funcion, puntos, repeticiones, calentamiento)
+                    distancias[motor] = distancia
+                    registros.append({
+                        "distribucion": distribucion,
+                        "n": n,
+                        "motor": motor,
+                        "repeticiones": repeticiones,
+                        "lectura_s": tiempos_lectura[0],
+                        "mediana_s": statistics.median(tiempos),
+                        "minimo_s": min(tiempos),
+                        "media_s": statistics.fmean(tiempos),
+                        "memoria_pico_bytes": medir_memoria_pico(funcion, puntos),
+                        "distancia": distancia,
+                    })
+                    print(f"{distribucion:>12} n={n:<9} {motor:<12} "
+                          f"{registros[-1]['mediana_s']:.6f} s")
+
+                if not distancias:
+                    # Todos los motores se omitieron para este tamaño
+                    continue
+                referencia = min(distancias.values())
+                for registro in registros[inicio:]:
+                    registro["coincide"] = math.isclose(registro["distancia"], referencia)
+    return registros
+
+
+def guardar_resultados(registros, prefijo):
+    """
+    Escribe los registros en `<prefijo>.json` y `<prefijo>.csv`.
+
+    Parameters
+    ----------
+    registros : list of dict
+        Salida de `ejecutar_benchmark`.
+    prefijo : str
+        Ruta de salida sin extensión.
+    """
+    with open(prefijo + ".json", "w", encoding="utf-8") as salida:
+        json.dump(registros, salida, indent=2)
+    if registros:
+        with open(prefijo + ".csv", "w", encoding="utf-8", newline="") as salida:
+            escritor = csv.DictWriter(salida, fieldnames=list(registros[0]))
+            escritor.writeheader()
+            escritor.writerows(registros)
+
+
+def graficar_escalamiento(registros, prefijo):
+    """
+    Dibuja, por distribución, la mediana del tiempo frente a n en escala log-log.
+
+    Se guarda una imagen `<prefijo>_<distribucion>.png` por distribución.
+    Matplotlib se importa solo aquí, por lo que no es necesario para medir.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    for distribucion in sorted({r["distribucion"] for r in registros}):
+        plt.figure(figsize=(8, 6))
+        for motor in sorted({r["motor"] for r in registros}):
+            serie = sorted((r["n"], r["mediana_s"]) for r in registros
+                           if r["distribucion"] == distribucion and r["motor"] == motor)
+            if serie:
+                plt.plot(*zip(*serie), marker="o", label=motor)
+        plt.xscale("log")
+        plt.yscale("log")
+        plt.title(f"Escalamiento del par más cercano: {distribucion}")
+        plt.xlabel("Número de puntos (n)")
+        plt.ylabel("Tiempo mediano (s)")
+        plt.grid(True, which="both", alpha=0.3)
+        plt.legend()
+        plt.savefig(f"{prefijo}_{distribucion}.png")
+        plt.close()
+
+
+def main():
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--distribuciones", nargs="+", default=list(DISTRIBUCIONES),
+                        choices=list(DISTRIBUCIONES))
+    parser.add_argument("--motores", nargs="+",
+                        default=["fuerza_bruta", "div_conq", "indices", "iterativo", "rejilla", "numpy"])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--calentamiento", type=int, default=1)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--limite-fuerza-bruta", type=int, default=5000)
+    parser.add_argument("--directorio-datos", default=None,
+                        help="Conserva aquí los archivos generados.")
+    parser.add_argument("--salida", default="resultados_benchmark",
+                        help="Prefijo de los archivos de resultados.")
+    parser.add_argument("--graficar", action="store_true",
+                        help="Genera las gráficas de escalamiento (requiere Matplotlib).")
+    argumentos = parser.parse_args()
+
+    registros = ejecutar_benchmark(
+        argumentos.tamanos, argumentos.distribuciones, argumentos.motores,
+        argumentos.repeticiones, argumentos.calentamiento, argumentos.semilla,
+        argumentos.limite_fuerza_bruta, argumentos.directorio_datos,
+    )
+    guardar_resultados(registros, argumentos.salida)
+    print(f"Resultados guardados en '{argumentos.salida}.json' y '{argumentos.salida}.csv'")
+    if argumentos.graficar:
+        graficar_escalamiento(registros, argumentos.salida)
+
+
+if __name__ == "__main__":
+    main()
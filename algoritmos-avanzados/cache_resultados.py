@@ -0,0 +1,236 @@
+"""
+Módulo con una caché persistente de resultados del par más cercano.
+
+Los resultados se guardan en un directorio, uno por archivo JSON, con una
+clave que combina el hash del contenido del archivo de puntos, el motor, sus
+opciones y `VERSION_CACHE`. Así, un archivo sin cambios (aunque se haya
+copiado o renombrado) se responde sin leerlo ni resolverlo, y calcular la
+clave solo requiere recorrer los bytes del archivo una vez.
+
+Contenido
+---------
+- Clases
+    - CacheResultados: Caché en disco con desalojo LRU y acceso concurrente.
+- Funciones
+    - hash_archivo: Hash del contenido de un archivo, leído por trozos.
+
+Attributes
+----------
+VERSION_CACHE : int
+    Versión de los resultados; al cambiarla se ignoran las entradas antiguas.
+    Debe incrementarse si un cambio en los motores altera sus resultados.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from main import encontrar_par_mas_cercano, leer_puntos
+
+VERSION_CACHE = 1
+
+# Entradas de más, sobre `max_entradas`, antes de recorrer el directorio
+_MARGEN_DESALOJO = 0.1
+# Antigüedad a partir de la cual un temporal se da por abandonado
+_EDAD_TEMPORALES_S = 300
+
+
+def hash_archivo(nombre_archivo, tam_lectura=1 << 20):
+    """
+    Calcula el hash BLAKE2b del contenido de un archivo, leído por trozos.
+
+    Parameters
+    ----------
+    nombre_archivo : str
+        Ruta del archivo.
+    tam_lectura : int, optional
+        Bytes leídos del disco en cada acceso. Por defecto 1 MiB.
+
+    Returns
+    -------
+    str
+        El hash en hexadecimal.
+
+    Notes
+    -----
+    La memoria usada es O(tam_lectura) y el costo es el de leer el archivo,
+    muy inferior al de interpretar sus números con `leer_puntos`.
+    """
+    resumen = hashlib.blake2b(digest_size=20)
+    with open(nombre_archivo, "rb") as archivo:
+        while trozo := archivo.read(tam_lectura):
+            resumen.update(trozo)
+    return resumen.hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché en disco de resultados de `encontrar_par_mas_cercano`.
+
+    Cada entrada es un archivo `<clave>.json` del directorio. Se escriben de
+    forma atómica (archivo temporal y `os.replace`), por lo que varios
+    procesos pueden leer y escribir a la vez sin ver entradas a medias. La
+    fecha de modificación de cada entrada se actualiza en cada acierto y,
+    cuando las entradas superan `max_entradas` en más de un 10 %, se
+    eliminan las usadas hace más tiempo hasta volver a `max_entradas`.
+
+    Para no recorrer el directorio en cada escritura, cada instancia lleva
+    la cuenta aproximada de las entradas: la obtiene del primer recorrido y
+    la incrementa con cada `guardar`. Con varios procesos cada uno solo
+    cuenta sus escrituras, así que el directorio puede superar ese margen
+    hasta que alguno lo recorra.
+
+    Attributes
+    ----------
+    directorio : str
+        Directorio de las entradas; se crea si no existe.
+    max_entradas : int
+        Número máximo de entradas que se conservan.
+
+    Examples
+    --------
+    >>> cache = CacheResultados("cache_par")  # doctest: +SKIP
+    >>> cache.resolver("datos_1000.txt", "numpy")  # doctest: +SKIP
+    ((-3191, -2265), (-3190, -2267), 2.23606797749979)
+    """
+
+    def __init__(self, directorio, max_entradas=10000):
+        self.directorio = directorio
+        self.max_entradas = max_entradas
+        self._entradas = None
+        os.makedirs(directorio, exist_ok=True)
+
+    def clave(self, nombre_archivo, motor="div_conq", **opciones):
+        """
+        Calcula la clave de un archivo, un motor y sus opciones.
+
+        Parameters
+        ----------
+        nombre_archivo : str
+            Ruta del archivo de puntos.
+        motor : str, optional
+            Motor de `encontrar_par_mas_cercano`. Por defecto "div_conq".
+        **opciones
+            Opciones del motor; forman parte de la clave.
+
+        Returns
+        -------
+        str
+            La clave en hexadecimal.
+        """
+        descripcion = json.dumps([hash_archivo(nombre_archivo), motor, opciones,
+                                  VERSION_CACHE], sort_keys=True)
+        return hashlib.blake2b(descripcion.encode(), digest_size=20).hexdigest()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + ".json")
+
+    def obtener(self, clave):
+        """
+        Devuelve el resultado guardado con `clave`, o None si no existe.
+
+        Parameters
+        ----------
+        clave : str
+            Clave calculada con `clave`.
+
+        Returns
+        -------
+        tuple or None
+            Una tupla (punto1, punto2, min_dist) como la de
+            `encontrar_par_mas_cercano`, o None si no hay entrada.
+        """
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, encoding="utf-8") as entrada:
+                p, q, distancia = json.load(entrada)
+            # Acierto: la entrada pasa a ser la más reciente
+            os.utime(ruta)
+        except (OSError, ValueError):
+            # Inexistente, desalojada por otro proceso o ilegible: es un fallo
+            return None
+        return (tuple(p) if p is not None else None,
+                tuple(q) if q is not None else None, distancia)
+
+    def guardar(self, clave, resultado):
+        """
+        Guarda `resultado` con `clave` y desaloja entradas si hace falta.
+
+        Parameters
+        ----------
+        clave : str
+            Clave calculada con `clave`.
+        resultado : tuple
+            Una tupla (punto1, punto2, min_dist).
+        """
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.directorio,
+                                         suffix=".tmp", delete=False) as salida:
+            json.dump(list(resultado), salida)
+        os.replace(salida.name, self._ruta(clave))
+        # Sobrescribir una entrada también cuenta: la cuenta solo peca por exceso
+        if self._entradas is not None:
+            self._entradas += 1
+        limite = self.max_entradas + max(1, int(self.max_entradas * _MARGEN_DESALOJO))
+        if self._entradas is None or self._entradas > limite:
+            self._desalojar()
+
+    def _desalojar(self):
+        """
+        Elimina las entradas menos recientes que excedan `max_entradas`.
+
+        También borra los temporales de escrituras interrumpidas, con más de
+        `_EDAD_TEMPORALES_S` segundos, y actualiza la cuenta de entradas.
+        """
+        entradas = []
+        caducidad = time.time_ns() - _EDAD_TEMPORALES_S * 10**9
+        with os.scandir(self.directorio) as contenido:
+            for entrada in contenido:
+                try:
+                    if entrada.name.endswith(".json"):
+                        entradas.append((entrada.stat().st_mtime_ns, entrada.path))
+                    elif (entrada.name.endswith(".tmp")
+                          and entrada.stat().st_mtime_ns < caducidad):
+                        os.remove(entrada.path)
+                except FileNotFoundError:
+                    continue
+        self._entradas = min(len(entradas), self.max_entradas)
+        if len(entradas) <= self.max_entradas:
+            return
+        entradas.sort()
+        for _, ruta in entradas[:len(entradas) - self.max_entradas]:
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                # Otro proceso la desalojó primero
+                pass
+
+    def resolver(self, nombre_archivo, motor="div_conq", **opciones):
+        """
+        Devuelve el par más cercano de un archivo, usando la caché.
+
+        Si hay entrada para el contenido del archivo, el motor y las
+        opciones, se devuelve sin leer los puntos; si no, se resuelve con
+        `encontrar_par_mas_cercano` y se guarda.
+
+        Parameters
+        ----------
+        nombre_archivo : str
+            Ruta del archivo de puntos.
+        motor : str, optional
+            Motor de `encontrar_par_mas_cercano`. Por defecto "div_conq".
+        **opciones
+            Opciones del motor, que forman parte de la clave.
+
+        Returns
+        -------
+        tuple
+            Una tupla (punto1, punto2, min_dist) como la de
+            `encontrar_par_mas_cercano`.
+        """
+        clave = self.clave(nombre_archivo, motor, **opciones)
+        resultado = self.obtener(clave)
+        if resultado is None:
+            resultado = encontrar_par_mas_cercano(leer_puntos(nombre_archivo), motor, **opciones)
+            self.guardar(clave, resultado)
+        return resultado
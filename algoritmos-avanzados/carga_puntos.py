@@ -0,0 +1,320 @@
+"""
+Módulo para cargar archivos de puntos de forma rápida.
+
+Los archivos tienen dos líneas: todas las coordenadas x separadas por coma
+en la primera y todas las y en la segunda (o, para puntos de d dimensiones,
+una línea por coordenada). Este módulo las convierte
+directamente en arreglos tipados de NumPy y guarda, junto al archivo de
+texto, una copia binaria que en las siguientes cargas se mapea en memoria
+sin volver a interpretar el texto. También permite recorrer archivos más
+grandes que la memoria por bloques de puntos.
+
+Contenido
+---------
+- Funciones
+    - ruta_cache: Ruta del archivo binario asociado a un archivo de puntos.
+    - leer_columnas: Lee un archivo de puntos como dos arreglos x e y.
+    - leer_bloques: Recorre un archivo de puntos por bloques con memoria acotada.
+    - leer_puntos_nd: Lee un archivo de puntos de d dimensiones, una línea por coordenada.
+"""
+import io
+import itertools
+import os
+import struct
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:  # NumPy solo es necesario para leer_columnas
+    np = None
+
+_MAGIA = b"PUNTOS01"
+# magia, tamaño del texto, mtime del texto (ns), número de puntos, tipo;
+# se rellena hasta 64 bytes para que los datos queden alineados
+_CABECERA = struct.Struct("<8sQqQc")
+_TAM_CABECERA = 64
+
+
+def ruta_cache(nombre_archivo):
+    """
+    Devuelve la ruta del archivo binario asociado a `nombre_archivo`.
+
+    Parameters
+    ----------
+    nombre_archivo : str
+        Ruta del archivo de texto con los puntos.
+
+    Returns
+    -------
+    str
+        La misma ruta con la extensión cambiada a ".bin".
+
+    Examples
+    --------
+    >>> ruta_cache("datos_100.txt")
+    'datos_100.bin'
+    """
+    return os.path.splitext(nombre_archivo)[0] + ".bin"
+
+
+def _parsear_linea(linea):
+    """Convierte una línea de números separados por coma en un arreglo."""
+    if not linea.strip():
+        return np.empty(0, dtype=np.int64)
+    # Primero como enteros; un valor con decimales o exponente hace fallar la
+    # lectura entera y la línea se lee como float64
+    for tipo in (np.int64, np.float64):
+        try:
+            return np.loadtxt(io.StringIO(linea), dtype=tipo, delimiter=",", ndmin=1)
+        except (ValueError, OverflowError):
+            continue
+    raise ValueError("La línea contiene valores que no son números.")
+
+
+def _cargar_cache(ruta, estado):
+    """Mapea en memoria el binario si corresponde al texto con `estado`."""
+    try:
+        with open(ruta, "rb") as entrada:
+            cabecera = entrada.read(_TAM_CABECERA)
+    except OSError:
+        return None
+    if len(cabecera) < _CABECERA.size:
+        return None
+    magia, tamano, mtime, n, tipo = _CABECERA.unpack_from(cabecera)
+    if magia != _MAGIA or tamano != estado.st_size or mtime != estado.st_mtime_ns:
+        return None
+    dtype = np.dtype(tipo.decode())
+    # Un binario truncado (p. ej. por una escritura interrumpida) se regenera
+    try:
+        if os.path.getsize(ruta) != _TAM_CABECERA + 2 * n * dtype.itemsize:
+            return None
+    except OSError:
+        return None
+    if n == 0:
+        vacio = np.empty(0, dtype=dtype)
+        return vacio, vacio
+    datos = np.memmap(ruta, dtype=dtype, mode="r", offset=_TAM_CABECERA, shape=(2, n))
+    return datos[0], datos[1]
+
+
+def _guardar_cache(ruta, estado, x, y):
+    """Escribe el binario de forma atómica: otros procesos nunca lo ven a medias."""
+    tipo = b"q" if x.dtype.kind == "i" else b"d"
+    datos = np.stack([x, y]).astype(np.dtype(tipo.decode()), copy=False)
+    cabecera = _CABECERA.pack(_MAGIA, estado.st_size, estado.st_mtime_ns, x.size, tipo)
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    salida = tempfile.NamedTemporaryFile("wb", dir=directorio, delete=False)
+    try:
+        with salida:
+            salida.write(cabecera.ljust(_TAM_CABECERA, b"\0"))
+            datos.tofile(salida)
+        os.replace(salida.name, ruta)
+    except BaseException:
+        # Un disco lleno o un error al renombrar no deja el temporal junto al texto
+        try:
+            os.unlink(salida.name)
+        except OSError:
+            pass
+        raise
+
+
+def leer_columnas(nombre_archivo, usar_cache=True):
+    """
+    Lee un archivo de puntos como dos arreglos tipados x e y.
+
+    El texto se interpreta en C con NumPy, sin crear objetos de Python por
+    cada número. Si `usar_cache` es verdadero, el resultado se guarda en
+    `ruta_cache(nombre_archivo)` y las siguientes lecturas mapean ese
+    archivo en memoria. El binario registra el tamaño y la fecha de
+    modificación del texto, por lo que se regenera solo si el texto cambia.
+
+    Parameters
+    ----------
+    nombre_archivo : str
+        Ruta del archivo de texto que contiene los datos.
+    usar_cache : bool, optional
+        Si se usa y actualiza el archivo binario. Por defecto True.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Arreglos (x, y) de int64, o de float64 si alguna coordenada no es
+        entera. Si vienen del binario son de solo lectura.
+
+    Raises
+    ------
+    ValueError
+        Si las líneas no tienen el mismo número de valores o contienen
+        valores no numéricos.
+
+    Notes
+    -----
+    Si no se puede escribir el binario (por ejemplo, en un directorio de
+    solo lectura) la lectura funciona igual, sin caché.
+    """
+    if np is None:
+        raise ImportError("leer_columnas requiere NumPy.")
+    estado = os.stat(nombre_archivo)
+    ruta = ruta_cache(nombre_archivo)
+    if usar_cache:
+        columnas = _cargar_cache(ruta, estado)
+        if columnas is not None:
+            return columnas
+
+    with open(nombre_archivo, encoding="utf-8") as datos:
+        x = _parsear_linea(datos.readline())
+        y = _parsear_linea(datos.readline())
+    if x.size != y.size:
+        raise ValueError(
+            f"'{nombre_archivo}' tiene {x.size} coordenadas x y {y.size} coordenadas y."
+        )
+    if x.dtype != y.dtype:
+        x = x.astype(np.float64)
+        y = y.astype(np.float64)
+
+    if usar_cache:
+        try:
+            _guardar_cache(ruta, estado, x, y)
+        except OSError:
+            pass
+    return x, y
+
+
+def _inicio_segunda_linea(archivo, tam_lectura):
+    """Posición del primer byte de la segunda línea, leyendo por trozos."""
+    archivo.seek(0)
+    posicion = 0
+    while True:
+        trozo = archivo.read(tam_lectura)
+        if not trozo:
+            return posicion
+        salto = trozo.find(b"\n")
+        if salto >= 0:
+            return posicion + salto + 1
+        posicion += len(trozo)
+
+
+def _numeros_de_linea(archivo, tam_lectura):
+    """Genera los enteros de la línea actual de `archivo`, por trozos."""
+    resto = b""
+    while True:
+        trozo = archivo.read(tam_lectura)
+        salto = trozo.find(b"\n")
+        if salto >= 0:
+            trozo = trozo[:salto]
+        partes = (resto + trozo).split(b",")
+        if not trozo or salto >= 0:
+            # Último trozo de la línea: una línea vacía no tiene números
+            if partes != [b""]:
+                yield from map(int, partes)
+            return
+        # El último fragmento puede ser un número cortado por el trozo
+        resto = partes.pop()
+        yield from map(int, partes)
+
+
+def leer_bloques(nombre_archivo, tam_bloque=65536, tam_lectura=1 << 20):
+    """
+    Recorre un archivo de puntos por bloques, con memoria acotada.
+
+    El archivo se abre dos veces: un lector avanza por la línea de las x y
+    otro por la de las y, ambos leyendo trozos de `tam_lectura` bytes, de
+    modo que nunca se cargan las líneas completas. Los puntos se emparejan
+    en el mismo orden que en `leer_puntos`.
+
+    Parameters
+    ----------
+    nombre_archivo : str
+        Ruta del archivo de texto que contiene los datos.
+    tam_bloque : int, optional
+        Número máximo de puntos por bloque. Por defecto 65536.
+    tam_lectura : int, optional
+        Bytes leídos del disco en cada acceso. Por defecto 1 MiB.
+
+    Yields
+    ------
+    list of tuple of int
+        Bloques consecutivos de hasta `tam_bloque` puntos (x, y).
+
+    Raises
+    ------
+    ValueError
+        Si las dos líneas no tienen el mismo número de valores o contienen
+        valores que no son enteros.
+
+    Notes
+    -----
+    La memoria usada es O(tam_bloque + tam_lectura), independiente del
+    tamaño del archivo, así que sirve para archivos más grandes que la RAM.
+    """
+    with open(nombre_archivo, "rb") as archivo_x, open(nombre_archivo, "rb") as archivo_y:
+        archivo_y.seek(_inicio_segunda_linea(archivo_y, tam_lectura))
+        pares = itertools.zip_longest(_numeros_de_linea(archivo_x, tam_lectura),
+                                      _numeros_de_linea(archivo_y, tam_lectura))
+        while True:
+            bloque = list(itertools.islice(pares, tam_bloque))
+            if not bloque:
+                return
+            if None in bloque[-1]:
+                raise ValueError(
+                    f"'{nombre_archivo}' no tiene el mismo número de coordenadas x e y."
+                )
+            yield bloque
+
+
+def leer_puntos_nd(nombre_archivo, dimension=None):
+    """
+    Lee un archivo de puntos de d dimensiones como una lista de tuplas.
+
+    Generaliza el formato de dos líneas: la línea k contiene la coordenada k
+    de todos los puntos, separadas por coma, así que un archivo de d líneas
+    describe puntos de d dimensiones. Un archivo de dos líneas se lee igual
+    que con `leer_puntos`.
+
+    Parameters
+    ----------
+    nombre_archivo : str
+        Ruta del archivo de texto que contiene los datos.
+    dimension : int, optional
+        Número de coordenadas esperado. Si se indica y el archivo tiene otro
+        número de líneas, se genera un ValueError.
+
+    Returns
+    -------
+    list of tuple of int
+        Lista de puntos, cada uno una tupla con una coordenada por línea.
+
+    Raises
+    ------
+    ValueError
+        Si las líneas no tienen el mismo número de valores, si contienen
+        valores que no son enteros o si no coinciden con `dimension`.
+
+    Notes
+    -----
+    Se ignoran las líneas vacías al final del archivo.
+
+    Examples
+    --------
+    Suponiendo un archivo `puntos_3d.txt` con el contenido:
+    1,4
+    2,5
+    3,6
+
+    >>> leer_puntos_nd("puntos_3d.txt")
+    [(1, 2, 3), (4, 5, 6)]
+    """
+    with open(nombre_archivo, encoding="utf-8") as datos:
+        lineas = datos.read().rstrip().splitlines()
+    coordenadas = [list(map(int, linea.split(","))) if linea.strip() else []
+                   for linea in lineas]
+    if dimension is not None and len(coordenadas) != dimension:
+        raise ValueError(
+            f"'{nombre_archivo}' tiene {len(coordenadas)} coordenadas por punto "
+            f"y se esperaban {dimension}."
+        )
+    if len({len(valores) for valores in coordenadas}) > 1:
+        raise ValueError(
+            f"'{nombre_archivo}' no tiene el mismo número de valores en todas sus líneas."
+        )
+    return list(zip(*coordenadas))
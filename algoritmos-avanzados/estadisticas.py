@@ -0,0 +1,134 @@
+"""
+Módulo para medir dónde gasta el tiempo el divide y conquista.
+
+Ofrece un registro de estadísticas que `encontrar_par_mas_cercano` llena
+cuando se le pasa mediante el argumento `estadisticas`: profundidad de la
+recursión, casos base, tamaño de las franjas por nivel, evaluaciones de
+distancia y tiempo de cada fase. Sirve para distinguir entradas patológicas
+(por ejemplo, muchos puntos con la misma x, que producen franjas del tamaño
+de todo el nivel) de un simple crecimiento del tamaño.
+
+Los contadores los lleva la propia `par_mas_cercano_div_conq_recursivo`
+cuando recibe un registro; sin él, solo comprueba que no lo tiene, así que
+no medir apenas cuesta.
+
+Contenido
+---------
+- Clases
+    - EstadisticasParCercano: Registro de estadísticas de una ejecución.
+- Funciones
+    - par_mas_cercano_div_conq_medido: Divide y conquista que llena un registro.
+"""
+import time
+
+from main import par_mas_cercano_div_conq_recursivo
+
+
+class EstadisticasParCercano:
+    """
+    Estadísticas de una ejecución del divide y conquista.
+
+    Attributes
+    ----------
+    n : int
+        Número de puntos de la entrada.
+    profundidad_maxima : int
+        Nivel más profundo alcanzado por la recursión (la raíz es el nivel 0).
+    llamadas_caso_base : int
+        Número de llamadas resueltas por fuerza bruta.
+    evaluaciones_distancia : int
+        Número de llamadas a `calcular_distancia`, en casos base y franjas.
+    franja_por_nivel : list of int
+        Suma de los tamaños de las franjas de cada nivel de la recursión.
+    tiempo_ordenacion : float
+        Segundos dedicados a las dos ordenaciones iniciales.
+    tiempo_particion : float
+        Segundos dedicados a repartir los puntos entre las dos mitades.
+    tiempo_franja : float
+        Segundos dedicados a construir y recorrer las franjas.
+    tiempo_total : float
+        Segundos de toda la ejecución.
+
+    Examples
+    --------
+    >>> from main import encontrar_par_mas_cercano
+    >>> estadisticas = EstadisticasParCercano()
+    >>> encontrar_par_mas_cercano([(0, 0), (3, 4), (1, 1), (7, 7)], estadisticas=estadisticas)
+    ((0, 0), (1, 1), 1.4142135623730951)
+    >>> estadisticas.profundidad_maxima, estadisticas.llamadas_caso_base
+    (1, 2)
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.profundidad_maxima = 0
+        self.llamadas_caso_base = 0
+        self.evaluaciones_distancia = 0
+        self.franja_por_nivel = []
+        self.tiempo_ordenacion = 0.0
+        self.tiempo_particion = 0.0
+        self.tiempo_franja = 0.0
+        self.tiempo_total = 0.0
+
+    def como_dict(self):
+        """
+        Devuelve las estadísticas como un diccionario serializable en JSON.
+
+        Returns
+        -------
+        dict
+            Un diccionario con un elemento por atributo.
+        """
+        return dict(vars(self), franja_por_nivel=list(self.franja_por_nivel))
+
+    def resumen(self):
+        """
+        Devuelve un resumen legible de las estadísticas.
+
+        Returns
+        -------
+        str
+            Varias líneas de texto con los contadores y los tiempos.
+        """
+        lineas = [
+            f"Puntos: {self.n}",
+            f"Profundidad máxima: {self.profundidad_maxima}",
+            f"Llamadas al caso base: {self.llamadas_caso_base}",
+            f"Evaluaciones de distancia: {self.evaluaciones_distancia}",
+            f"Tiempo total: {self.tiempo_total:.3f} s (ordenación "
+            f"{self.tiempo_ordenacion:.3f} s, partición {self.tiempo_particion:.3f} s, "
+            f"franjas {self.tiempo_franja:.3f} s)",
+            "Tamaño de las franjas por nivel:",
+        ]
+        lineas += [f"  {nivel}: {tam}" for nivel, tam in enumerate(self.franja_por_nivel)]
+        return "\n".join(lineas)
+
+
+def par_mas_cercano_div_conq_medido(puntos, estadisticas):
+    """
+    Ejecuta el divide y conquista llenando un registro de estadísticas.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+    estadisticas : EstadisticasParCercano
+        Registro donde se acumulan los contadores y tiempos. Se puede
+        reutilizar entre ejecuciones para obtener totales.
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto1, punto2, min_dist), la misma que devuelve
+        `par_mas_cercano_div_conq`.
+    """
+    inicio = time.perf_counter()
+    estadisticas.n += len(puntos)
+    puntos_ordenados_x = sorted(puntos, key=lambda p: p[0])
+    puntos_ordenados_y = sorted(puntos, key=lambda p: p[1])
+    estadisticas.tiempo_ordenacion += time.perf_counter() - inicio
+
+    resultado = par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y,
+                                                   estadisticas)
+    estadisticas.tiempo_total += time.perf_counter() - inicio
+    return resultado
@@ -0,0 +1,342 @@
+"""
+Módulo con un índice espacial k-d persistente para conjuntos de puntos 2D.
+
+El índice se construye una vez a partir de la salida de `leer_puntos` y
+responde consultas de vecino más cercano, k vecinos más cercanos, puntos
+dentro de un radio y el par más cercano global. Puede guardarse en disco y
+cargarse de nuevo sin reconstruirlo.
+
+Contenido
+---------
+- Clases
+    - IndiceKD: Árbol k-d implícito sobre arreglos de coordenadas.
+"""
+import heapq
+import math
+import numbers
+import os
+import struct
+from array import array
+
+from main import leer_puntos
+
+_MAGIA = b"IKD1"
+_CABECERA = struct.Struct("<4scIQ")
+
+
+class IndiceKD:
+    """
+    Árbol k-d implícito sobre un conjunto fijo de puntos (x, y).
+
+    Los puntos se reordenan en dos arreglos de coordenadas de forma que cada
+    rango `[inicio, fin)` es un nodo: el punto en su posición media es la
+    mediana que divide el resto del rango por x en los niveles pares y por y
+    en los impares, y los rangos con a lo sumo `tam_hoja` puntos son hojas.
+    Como la estructura queda implícita en el orden, basta con guardar los dos
+    arreglos para persistir el índice.
+
+    Attributes
+    ----------
+    tam_hoja : int
+        Número máximo de puntos en una hoja.
+
+    Examples
+    --------
+    >>> indice = IndiceKD([(0, 0), (5, 5), (1, 1), (9, 0)])
+    >>> indice.vecino_mas_cercano((4, 4))
+    ((5, 5), 1.4142135623730951)
+    >>> indice.par_mas_cercano()
+    ((0, 0), (1, 1), 1.4142135623730951)
+    """
+
+    def __init__(self, puntos, tam_hoja=8):
+        """
+        Construye el índice en O(n log^2 n).
+
+        Parameters
+        ----------
+        puntos : list of tuple of int
+            Lista de puntos, donde cada punto es una tupla (x, y).
+        tam_hoja : int, optional
+            Número máximo de puntos en una hoja. Por defecto 8.
+        """
+        self.tam_hoja = tam_hoja
+        buffer = list(puntos)
+        self._construir(buffer, 0, len(buffer), 0)
+        self._x = [p[0] for p in buffer]
+        self._y = [p[1] for p in buffer]
+
+    def _construir(self, buffer, inicio, fin, profundidad):
+        """Ordena recursivamente `buffer` para que cada rango sea un nodo."""
+        while fin - inicio > self.tam_hoja:
+            eje = profundidad % 2
+            buffer[inicio:fin] = sorted(buffer[inicio:fin], key=lambda p: p[eje])
+            medio = (inicio + fin) // 2
+            self._construir(buffer, inicio, medio, profundidad + 1)
+            inicio = medio + 1
+            profundidad += 1
+
+    def __len__(self):
+        return len(self._x)
+
+    def __iter__(self):
+        return zip(self._x, self._y)
+
+    def _punto(self, i):
+        return self._x[i], self._y[i]
+
+    @classmethod
+    def desde_archivo(cls, nombre_archivo, tam_hoja=8):
+        """
+        Construye el índice a partir de un archivo de puntos.
+
+        Parameters
+        ----------
+        nombre_archivo : str
+            Ruta del archivo de texto con el formato de `leer_puntos`.
+        tam_hoja : int, optional
+            Número máximo de puntos en una hoja. Por defecto 8.
+
+        Returns
+        -------
+        IndiceKD
+            El índice construido.
+        """
+        return cls(leer_puntos(nombre_archivo), tam_hoja)
+
+    def _buscar_vecinos(self, qx, qy, k, excluir=-1, cota2=math.inf):
+        """
+        Devuelve los k índices más cercanos a (qx, qy) como lista de
+        (-dist2, indice), formando un montículo de máximos.
+
+        Solo se consideran puntos con distancia al cuadrado menor que `cota2`
+        y distintos del índice `excluir`.
+        """
+        xs, ys = self._x, self._y
+        tam_hoja = self.tam_hoja
+        mejores = []
+
+        def peor():
+            return -mejores[0][0] if len(mejores) == k else cota2
+
+        def visitar(inicio, fin, profundidad):
+            if fin - inicio <= tam_hoja:
+                for i in range(inicio, fin):
+                    dx = xs[i] - qx
+                    dy = ys[i] - qy
+                    d2 = dx * dx + dy * dy
+                    if d2 < peor() and i != excluir:
+                        if len(mejores) == k:
+                            heapq.heapreplace(mejores, (-d2, i))
+                        else:
+                            heapq.heappush(mejores, (-d2, i))
+                return
+            medio = (inicio + fin) // 2
+            visitar(medio, medio + 1, profundidad)
+            if profundidad % 2 == 0:
+                diferencia = qx - xs[medio]
+            else:
+                diferencia = qy - ys[medio]
+            if diferencia < 0:
+                visitar(inicio, medio, profundidad + 1)
+                if diferencia * diferencia < peor():
+                    visitar(medio + 1, fin, profundidad + 1)
+            else:
+                visitar(medio + 1, fin, profundidad + 1)
+                if diferencia * diferencia < peor():
+                    visitar(inicio, medio, profundidad + 1)
+
+        visitar(0, len(xs), 0)
+        return mejores
+
+    def vecino_mas_cercano(self, punto, cota2=math.inf):
+        """
+        Encuentra el punto del índice más cercano a `punto`.
+
+        Parameters
+        ----------
+        punto : tuple of int
+            Punto de consulta (x, y); no necesita pertenecer al índice.
+        cota2 : float, optional
+            Solo se buscan vecinos a distancia al cuadrado menor que `cota2`,
+            lo que poda más el árbol. Por defecto sin cota.
+
+        Returns
+        -------
+        tuple
+            Una tupla (vecino, distancia), o (None, inf) si el índice está
+            vacío o ningún punto está por debajo de `cota2`.
+        """
+        mejores = self._buscar_vecinos(punto[0], punto[1], 1, cota2=cota2)
+        if not mejores:
+            return None, float('inf')
+        menos_d2, i = mejores[0]
+        return self._punto(i), math.sqrt(-menos_d2)
+
+    def k_vecinos(self, punto, k):
+        """
+        Encuentra los k puntos del índice más cercanos a `punto`.
+
+        Parameters
+        ----------
+        punto : tuple of int
+            Punto de consulta (x, y).
+        k : int
+            Número de vecinos a devolver.
+
+        Returns
+        -------
+        list of tuple
+            Lista de tuplas (vecino, distancia) ordenada por distancia
+            creciente, con a lo sumo k elementos.
+        """
+        if k <= 0:
+            return []
+        mejores = self._buscar_vecinos(punto[0], punto[1], k)
+        return [(self._punto(i), math.sqrt(-menos_d2))
+                for menos_d2, i in sorted(mejores, reverse=True)]
+
+    def en_radio(self, punto, radio):
+        """
+        Encuentra todos los puntos a distancia menor o igual que `radio`.
+
+        Parameters
+        ----------
+        punto : tuple of int
+            Punto de consulta (x, y).
+        radio : float
+            Radio de búsqueda.
+
+        Returns
+        -------
+        list of tuple of int
+            Puntos dentro del círculo, en el orden interno del índice.
+        """
+        xs, ys = self._x, self._y
+        tam_hoja = self.tam_hoja
+        qx, qy = punto
+        radio2 = radio * radio
+        encontrados = []
+
+        def visitar(inicio, fin, profundidad):
+            if fin - inicio <= tam_hoja:
+                for i in range(inicio, fin):
+                    dx = xs[i] - qx
+                    dy = ys[i] - qy
+                    if dx * dx + dy * dy <= radio2:
+                        encontrados.append((xs[i], ys[i]))
+                return
+            medio = (inicio + fin) // 2
+            visitar(medio, medio + 1, profundidad)
+            diferencia = (qx - xs[medio]) if profundidad % 2 == 0 else (qy - ys[medio])
+            if diferencia <= radio:
+                visitar(inicio, medio, profundidad + 1)
+            if diferencia >= -radio:
+                visitar(medio + 1, fin, profundidad + 1)
+
+        visitar(0, len(xs), 0)
+        return encontrados
+
+    def par_mas_cercano(self):
+        """
+        Encuentra el par más cercano global usando el propio índice.
+
+        Cada punto busca su vecino más cercano acotado por la mejor distancia
+        hallada hasta el momento, lo que poda casi todo el árbol.
+
+        Returns
+        -------
+        tuple
+            Una tupla (punto1, punto2, min_dist) con el mismo contrato que
+            `encontrar_par_mas_cercano`.
+        """
+        mejor_d2 = math.inf
+        par = None
+        for i in range(len(self._x)):
+            mejores = self._buscar_vecinos(self._x[i], self._y[i], 1, i, mejor_d2)
+            if mejores:
+                mejor_d2 = -mejores[0][0]
+                par = (i, mejores[0][1])
+                if mejor_d2 == 0:
+                    break
+        if par is None:
+            return None, None, float('inf')
+        return self._punto(par[0]), self._punto(par[1]), math.sqrt(mejor_d2)
+
+    def guardar(self, nombre_archivo):
+        """
+        Guarda el índice en un archivo binario compacto.
+
+        Parameters
+        ----------
+        nombre_archivo : str
+            Ruta del archivo de salida.
+
+        Notes
+        -----
+        Se almacenan los dos arreglos de coordenadas ya ordenados, como
+        enteros de 64 bits si todas las coordenadas son enteras y como
+        flotantes de doble precisión en otro caso.
+        """
+        # numbers.Integral también acepta los enteros de NumPy
+        enteros = all(isinstance(v, numbers.Integral) for v in self._x) and \
+            all(isinstance(v, numbers.Integral) for v in self._y)
+        tipo = "q" if enteros else "d"
+        with open(nombre_archivo, "wb") as salida:
+            salida.write(_CABECERA.pack(_MAGIA, tipo.encode(), self.tam_hoja, len(self._x)))
+            array(tipo, self._x).tofile(salida)
+            array(tipo, self._y).tofile(salida)
+
+    @classmethod
+    def cargar(cls, nombre_archivo):
+        """
+        Carga un índice guardado con `guardar` sin reconstruirlo.
+
+        Parameters
+        ----------
+        nombre_archivo : str
+            Ruta del archivo generado por `guardar`.
+
+        Returns
+        -------
+        IndiceKD
+            El índice cargado.
+
+        Raises
+        ------
+        ValueError
+            Si el archivo no tiene el formato esperado o está truncado.
+        """
+        with open(nombre_archivo, "rb") as entrada:
+            cabecera = entrada.read(_CABECERA.size)
+            if len(cabecera) < _CABECERA.size:
+                raise ValueError(f"'{nombre_archivo}' no es un índice k-d válido.")
+            magia, tipo, tam_hoja, n = _CABECERA.unpack(cabecera)
+            if magia != _MAGIA or tipo not in (b"q", b"d"):
+                raise ValueError(f"'{nombre_archivo}' no es un índice k-d válido.")
+            esperado = _CABECERA.size + 2 * n * array(tipo.decode()).itemsize
+            tamano = os.fstat(entrada.fileno()).st_size
+            if tamano != esperado:
+                raise ValueError(
+                    f"'{nombre_archivo}' ocupa {tamano} bytes y su cabecera indica "
+                    f"{n} puntos ({esperado} bytes); el archivo está incompleto o dañado."
+                )
+            xs = array(tipo.decode())
+            ys = array(tipo.decode())
+            xs.fromfile(entrada, n)
+            ys.fromfile(entrada, n)
+
+        indice = cls.__new__(cls)
+        indice.tam_hoja = tam_hoja
+        indice._x = xs.tolist()
+        indice._y = ys.tolist()
+        return indice
+
+
+if __name__ == "__main__":
+    indice_datos = IndiceKD.desde_archivo("datos_10000.txt")
+    indice_datos.guardar("datos_10000.ikd")
+    indice_cargado = IndiceKD.cargar("datos_10000.ikd")
+    print(f"Puntos indexados: {len(indice_cargado)}")
+    print(f"Par más cercano: {indice_cargado.par_mas_cercano()}")
+    print(f"Vecino de (0, 0): {indice_cargado.vecino_mas_cercano((0, 0))}")
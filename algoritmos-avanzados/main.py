@@ -13,11 +13,31 @@ Contenido
     - calcular_distancia: Calcula la distancia euclidiana entre dos puntos.
     - par_mas_cercano_fuerza_bruta: Encuentra el par más cercano usando fuerza bruta.
     - par_mas_cercano_div_conq: Encuentra el par más cercano usando divide y conquista.
+    - par_mas_cercano_columnas: Motor vectorizado sobre columnas x/y de NumPy.
+    - par_mas_cercano_numpy: Adapta el motor vectorizado a listas de tuplas.
+    - par_mas_cercano_indices: Divide y conquista sobre rangos de un único búfer.
+    - par_mas_cercano_iterativo: Divide y conquista ascendente, sin recursión.
+    - par_mas_cercano_rejilla: Algoritmo aleatorizado de tiempo lineal esperado.
+    - vecinos_mas_cercanos_columnas: Vecino más cercano de cada punto (columnas).
+    - vecinos_mas_cercanos: Vecino más cercano de cada punto de una lista.
     - encontrar_par_mas_cercano: Función principal que coordina la solución.
+
+Attributes
+----------
+MOTORES : dict
+    Motores disponibles para `encontrar_par_mas_cercano`, indexados por nombre.
 """
 import math
+import random
 import time
 
+from carga_puntos import leer_bloques
+
+try:
+    import numpy as np
+except ImportError:  # NumPy solo es necesario para el motor "numpy"
+    np = None
+
 def leer_puntos(nombre_archivo):
     """
     Lee un archivo de texto y devuelve una lista de tuplas de enteros.
@@ -38,8 +58,11 @@ def leer_puntos(nombre_archivo):
     Notes
     -----
     - Se asume que el archivo tiene formato válido y no contiene líneas vacías.
-    - Si una línea no contiene exactamente dos valores separados por coma,
-    puede generar una excepción.
+    - Si las dos líneas no tienen el mismo número de valores se genera un
+    ValueError.
+    - Es un envoltorio sobre `carga_puntos.leer_bloques`, que recorre el
+    archivo por bloques; para archivos más grandes que la memoria conviene
+    usar directamente ese generador.
 
     Examples
     --------
@@ -50,10 +73,10 @@ def leer_puntos(nombre_archivo):
     >>> leer_puntos("puntos.txt")
     [(1, 2), (3, 4), (5, 6)]
     """
-    with open(nombre_archivo) as datos:
-        x = list(map(int, datos.readline().split(",")))
-        y = list(map(int, datos.readline().split(",")))
-    return list(zip(x, y))
+    puntos = []
+    for bloque in leer_bloques(nombre_archivo):
+        puntos.extend(bloque)
+    return puntos
 
 def calcular_distancia(punto1, punto2):
     """
@@ -119,7 +142,8 @@ def par_mas_cercano_fuerza_bruta(puntos):
                 par_cercano = (puntos[i], puntos[j])
     return par_cercano[0], par_cercano[1], min_dist
 
-def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y):
+def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y,
+                                       estadisticas=None, nivel=0):
     """
     Encuentra el par de puntos más cercano usando la estrategia de divide y conquista.
 
@@ -131,6 +155,11 @@ def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y):
         Lista de puntos ordenados por su coordenada x.
     puntos_ordenados_y : list of tuple of int
         Lista de puntos ordenados por su coordenada y.
+    estadisticas : estadisticas.EstadisticasParCercano, optional
+        Registro donde acumular contadores y tiempos de cada fase. Por
+        defecto None: no se mide nada.
+    nivel : int, optional
+        Profundidad de esta llamada en la recursión; la raíz es el nivel 0.
 
     Returns
     -------
@@ -149,12 +178,19 @@ def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y):
     Esto implica considerar puntos dentro de una "franja" alrededor de la línea divisoria.
     """
     n = len(puntos_ordenados_x)
+    if estadisticas is not None and nivel > estadisticas.profundidad_maxima:
+        estadisticas.profundidad_maxima = nivel
 
     # Caso base: si hay pocos puntos, usar fuerza bruta
     if n <= 3:
+        if estadisticas is not None:
+            estadisticas.llamadas_caso_base += 1
+            estadisticas.evaluaciones_distancia += n * (n - 1) // 2
         return par_mas_cercano_fuerza_bruta(puntos_ordenados_x)
 
     # 1. Divide
+    if estadisticas is not None:
+        inicio = time.perf_counter()
     medio = n // 2
     punto_medio = puntos_ordenados_x[medio]
 
@@ -166,10 +202,16 @@ def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y):
             p_y_izq.append(p)
         else:
             p_y_der.append(p)
-    
+    p_x_izq = puntos_ordenados_x[:medio]
+    p_x_der = puntos_ordenados_x[medio:]
+    if estadisticas is not None:
+        estadisticas.tiempo_particion += time.perf_counter() - inicio
+
     # 2. Conquista
-    p1_izq, p2_izq, dist_izq = par_mas_cercano_div_conq_recursivo(puntos_ordenados_x[:medio], p_y_izq)
-    p1_der, p2_der, dist_der = par_mas_cercano_div_conq_recursivo(puntos_ordenados_x[medio:], p_y_der)
+    p1_izq, p2_izq, dist_izq = par_mas_cercano_div_conq_recursivo(
+        p_x_izq, p_y_izq, estadisticas, nivel + 1)
+    p1_der, p2_der, dist_der = par_mas_cercano_div_conq_recursivo(
+        p_x_der, p_y_der, estadisticas, nivel + 1)
 
     # Determinar la distancia mínima de las sub-soluciones
     if dist_izq <= dist_der:
@@ -181,6 +223,8 @@ def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y):
 
     # 3. Combina
     # Crear una franja de puntos cuya distancia x al punto medio sea menor que d_min
+    if estadisticas is not None:
+        inicio = time.perf_counter()
     franja = []
     for punto in puntos_ordenados_y:
         if abs(punto[0] - punto_medio[0]) < d_min:
@@ -189,6 +233,7 @@ def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y):
     # Buscar el par más cercano en la franja
     # Los puntos en 'franja' ya están ordenados por y
     tam_franja = len(franja)
+    evaluaciones = 0
     for i in range(tam_franja):
         for j in range(i + 1, tam_franja):
             # Optimización: solo comparar puntos si su diferencia en y es menor que d_min
@@ -198,20 +243,794 @@ def par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y):
             if dist < d_min:
                 d_min = dist
                 par_min = (franja[i], franja[j])
+        else:
+            j = tam_franja
+        # Se cuenta una vez por punto y no en cada comparación: franja[i] se
+        # comparó con los j - i - 1 puntos que lo siguen hasta el corte
+        evaluaciones += j - i - 1
+
+    if estadisticas is not None:
+        estadisticas.tiempo_franja += time.perf_counter() - inicio
+        estadisticas.evaluaciones_distancia += evaluaciones
+        por_nivel = estadisticas.franja_por_nivel
+        while len(por_nivel) <= nivel:
+            por_nivel.append(0)
+        por_nivel[nivel] += tam_franja
 
     return par_min[0], par_min[1], d_min
 
-def encontrar_par_mas_cercano(puntos):
+def par_mas_cercano_div_conq(puntos):
+    """
+    Ordena los puntos y ejecuta la versión recursiva de divide y conquista.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto1, punto2, min_dist) como la de
+        `par_mas_cercano_div_conq_recursivo`.
+    """
+    puntos_ordenados_x = sorted(puntos, key=lambda p: p[0])
+    puntos_ordenados_y = sorted(puntos, key=lambda p: p[1])
+
+    return par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y)
+
+def _columnas_numericas(x, y):
+    """Convierte x e y a arreglos de NumPy donde los cuadrados no desborden."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x.dtype.kind in "iub" and y.dtype.kind in "iub":
+        limite = max(int(np.abs(x).max(initial=0)), int(np.abs(y).max(initial=0)))
+        # (2 * 2^30)^2 * 2 cabe en int64: las distancias al cuadrado son exactas
+        if limite < 2**30:
+            return x.astype(np.int64, copy=False), y.astype(np.int64, copy=False)
+    return x.astype(np.float64, copy=False), y.astype(np.float64, copy=False)
+
+def _mejor_por_grupo(grupo, dist2, idx_a, idx_b):
+    """
+    Devuelve, para cada grupo presente, el candidato de menor distancia.
+
+    Los candidatos de cada grupo deben ser contiguos (por ejemplo, con
+    `grupo` ordenado); así la reducción es lineal y, ante empates, se
+    conserva el primer candidato de cada grupo.
+    """
+    inicios = np.flatnonzero(np.r_[True, grupo[1:] != grupo[:-1]])
+    minimos = np.minimum.reduceat(dist2, inicios)
+    tamanos = np.diff(np.r_[inicios, grupo.size])
+    candidatos = np.flatnonzero(dist2 == np.repeat(minimos, tamanos))
+    segmento = np.repeat(np.arange(inicios.size), tamanos)[candidatos]
+    elegidos = candidatos[np.r_[True, segmento[1:] != segmento[:-1]]]
+    return grupo[inicios], minimos, idx_a[elegidos], idx_b[elegidos]
+
+def _actualizar_mejores(mejor, grupo, dist2, idx_a, idx_b):
+    """Actualiza in situ los arreglos (dist2, i, j) de cada grupo con candidatos."""
+    if grupo.size == 0:
+        return
+    grupos, dist2, idx_a, idx_b = _mejor_por_grupo(grupo, dist2, idx_a, idx_b)
+    mejora = dist2 < mejor[0][grupos]
+    grupos = grupos[mejora]
+    mejor[0][grupos] = dist2[mejora]
+    mejor[1][grupos] = idx_a[mejora]
+    mejor[2][grupos] = idx_b[mejora]
+
+def _comparar_vecinos(x, y, grupo, limite2, mejor, indices):
+    """
+    Compara cada punto con los siguientes de su mismo grupo mientras la
+    diferencia en y al cuadrado sea menor que `limite2` del grupo.
+
+    Los puntos deben venir ordenados por grupo y, si `limite2` es finito,
+    por y dentro de cada grupo. Si para un desplazamiento ningún par es
+    válido, tampoco lo será para los siguientes, así que el número de pasadas
+    está acotado por el tamaño de la franja más densa. Los candidatos se
+    registran en `mejor` traducidos con `indices`.
+    """
+    n = x.size
+    k = 1
+    while k < n:
+        dy = y[k:] - y[:-k]
+        validos = (grupo[k:] == grupo[:-k]) & (dy * dy < limite2[grupo[:-k]])
+        if not validos.any():
+            break
+        a = np.flatnonzero(validos)
+        b = a + k
+        dx = x[b] - x[a]
+        dist2 = dx * dx + dy[a] * dy[a]
+        _actualizar_mejores(mejor, grupo[a], dist2, indices[a], indices[b])
+        k += 1
+
+def par_mas_cercano_columnas(x, y, tam_hoja=8):
+    """
+    Encuentra el par más cercano sobre columnas x/y usando NumPy.
+
+    Es un divide y conquista de abajo hacia arriba: los puntos se ordenan una
+    sola vez por x (y se calcula su rango en y) y se agrupan en hojas
+    contiguas de `tam_hoja` puntos. Los casos base de todas las hojas y las
+    franjas de todas las fusiones de un mismo nivel se resuelven con
+    operaciones vectorizadas, de modo que el intérprete solo ejecuta
+    O(log n) iteraciones en lugar de una por par.
+
+    Parameters
+    ----------
+    x : array_like
+        Coordenadas x de los puntos.
+    y : array_like
+        Coordenadas y de los puntos, con la misma longitud que `x`.
+    tam_hoja : int, optional
+        Número de puntos por hoja resuelta por fuerza bruta. Por defecto 8.
+
+    Returns
+    -------
+    tuple
+        Una tupla conteniendo:
+        - i (int): Índice en `x`/`y` del primer punto del par más cercano.
+        - j (int): Índice en `x`/`y` del segundo punto del par más cercano.
+        - min_dist (float): La distancia mínima entre los dos puntos.
+        Retorna (None, None, float('inf')) si hay menos de dos puntos.
+
+    Notes
+    -----
+    Las distancias se comparan al cuadrado y la raíz se toma una sola vez al
+    final. Con coordenadas enteras se opera en int64, por lo que el resultado
+    es exacto; ante empates puede elegir un par distinto al del motor
+    recursivo, pero siempre a la misma distancia.
+    """
+    if np is None:
+        raise ImportError("El motor vectorizado requiere NumPy.")
+    x, y = _columnas_numericas(x, y)
+    n = x.size
+    if n < 2:
+        return None, None, float('inf')
+
+    orden = np.argsort(x, kind="stable")
+    xs = x[orden]
+    ys = y[orden]
+    infinito = np.iinfo(np.int64).max if xs.dtype.kind == "i" else np.inf
+    posiciones = np.arange(n)
+
+    # Casos base: todas las hojas a la vez, comparando todos los pares
+    num_grupos = -(-n // tam_hoja)
+    mejor = [np.full(num_grupos, infinito, dtype=xs.dtype),
+             np.zeros(num_grupos, dtype=np.int64),
+             np.zeros(num_grupos, dtype=np.int64)]
+    _comparar_vecinos(xs, ys, posiciones // tam_hoja, mejor[0].copy(), mejor, posiciones)
+
+    # Orden por (grupo, y) mantenido nivel a nivel: cada grupo padre es la
+    # concatenación de dos tramos ya ordenados, que el ordenamiento estable
+    # detecta y fusiona en tiempo casi lineal (como en Shamos y Hoey)
+    rango_y = np.empty(n, dtype=np.int64)
+    rango_y[np.argsort(ys, kind="stable")] = posiciones
+    orden_y = np.argsort((posiciones // tam_hoja) * n + rango_y, kind="stable")
+
+    # Combina: fusionar grupos adyacentes nivel a nivel
+    tam_grupo = tam_hoja
+    while num_grupos > 1:
+        impar = num_grupos % 2
+        num_padres = num_grupos // 2 + impar
+        nuevo = []
+        for columna in mejor:
+            izq = columna[0::2]
+            der = columna[1::2]
+            if impar:
+                der = np.append(der, infinito if columna is mejor[0] else 0)
+            nuevo.append((izq, der))
+        toma_der = nuevo[0][1] < nuevo[0][0]
+        mejor = [np.where(toma_der, der, izq) for izq, der in nuevo]
+
+        tam_grupo *= 2
+        grupo = posiciones // tam_grupo
+        orden_y = orden_y[np.argsort(grupo[orden_y] * n + rango_y[orden_y], kind="stable")]
+        # La recta divisoria de cada padre pasa por el primer punto de su hijo derecho
+        inicio_der = np.minimum(np.arange(num_padres) * tam_grupo + tam_grupo // 2, n - 1)
+        dx = xs - xs[inicio_der][grupo]
+        en_franja = dx * dx < mejor[0][grupo]
+        if impar:
+            # El último padre no tiene hijo derecho: no hay franja que revisar
+            en_franja &= grupo != num_padres - 1
+        franja = orden_y[en_franja[orden_y]]
+        if franja.size > 1:
+            _comparar_vecinos(xs[franja], ys[franja], grupo[franja], mejor[0], mejor, franja)
+        num_grupos = num_padres
+
+    return (int(orden[mejor[1][0]]), int(orden[mejor[2][0]]),
+            math.sqrt(float(mejor[0][0])))
+
+def par_mas_cercano_numpy(puntos):
+    """
+    Encuentra el par más cercano con el motor vectorizado de NumPy.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto1, punto2, min_dist) con los puntos tal como
+        aparecen en `puntos`.
+
+    See Also
+    --------
+    par_mas_cercano_columnas : Motor que opera directamente sobre columnas.
+    """
+    if np is None:
+        raise ImportError("El motor vectorizado requiere NumPy.")
+    coordenadas = np.asarray(puntos)
+    i, j, min_dist = par_mas_cercano_columnas(coordenadas[:, 0], coordenadas[:, 1])
+    if i is None:
+        return None, None, min_dist
+    return puntos[i], puntos[j], min_dist
+
+def _mejorar_vecinos(mejor2, vecino, a, b, dist2):
+    """Asigna `b` como vecino de `a` donde `dist2` mejora; `a` no se repite."""
+    mejora = dist2 < mejor2[a]
+    mejor2[a[mejora]] = dist2[mejora]
+    vecino[a[mejora]] = b[mejora]
+
+def _buscar_en_otra_mitad(xs, ys, consultas, candidatos, claves, limites, mejor2, vecino):
+    """
+    Compara cada consulta con los candidatos de su ventana [inicio, fin) y
+    actualiza su vecino. Procesa las consultas en bloques para acotar la
+    memoria de los pares expandidos.
+    """
+    inicio, fin = limites
+    cuenta = fin - inicio
+    acumulado = np.cumsum(cuenta)
+    bloque = 1 << 22
+    desde = 0
+    while desde < consultas.size:
+        base = acumulado[desde - 1] if desde else 0
+        hasta = max(int(np.searchsorted(acumulado, base + bloque, side="right")), desde + 1)
+        cuenta_bloque = cuenta[desde:hasta]
+        total = int(cuenta_bloque.sum())
+        if total:
+            a = np.repeat(consultas[desde:hasta], cuenta_bloque)
+            salto = inicio[desde:hasta] - (np.cumsum(cuenta_bloque) - cuenta_bloque)
+            b = candidatos[np.repeat(salto, cuenta_bloque) + np.arange(total)]
+            dx = xs[b] - xs[a]
+            dy = ys[b] - ys[a]
+            grupos, minimos, _, elegidos = _mejor_por_grupo(a, dx * dx + dy * dy, a, b)
+            _mejorar_vecinos(mejor2, vecino, grupos, elegidos, minimos)
+        desde = hasta
+
+def vecinos_mas_cercanos_columnas(x, y, tam_hoja=32):
+    """
+    Calcula el vecino más cercano de cada punto dado en columnas x/y.
+
+    Usa la misma estructura de abajo hacia arriba que
+    `par_mas_cercano_columnas`: cada punto resuelve su hoja por fuerza bruta
+    y, en cada fusión, solo los puntos más cerca de la recta divisoria que
+    de su vecino actual buscan en la otra mitad, dentro de la ventana en y
+    que marca esa distancia. Cada nivel es un conjunto de operaciones
+    vectorizadas, por lo que el costo es O(n log n) para distribuciones sin
+    puntos aislados muy lejanos.
+
+    Parameters
+    ----------
+    x : array_like
+        Coordenadas x de los puntos.
+    y : array_like
+        Coordenadas y de los puntos, con la misma longitud que `x`.
+    tam_hoja : int, optional
+        Número de puntos por hoja resuelta por fuerza bruta. Por defecto 32.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Una tupla conteniendo:
+        - vecino (ndarray of int64): Índice del vecino más cercano de cada
+          punto, o -1 si hay menos de dos puntos.
+        - distancia (ndarray of float64): Distancia a ese vecino.
+
+    Notes
+    -----
+    Ante empates se devuelve uno cualquiera de los vecinos a la distancia
+    mínima. Los puntos repetidos son vecinos entre sí a distancia 0.
+    """
+    if np is None:
+        raise ImportError("El cálculo vectorizado de vecinos requiere NumPy.")
+    x, y = _columnas_numericas(x, y)
+    n = x.size
+    if n < 2:
+        return np.full(n, -1, dtype=np.int64), np.full(n, np.inf)
+
+    orden = np.argsort(x, kind="stable")
+    xs = x[orden]
+    ys = y[orden]
+    infinito = np.iinfo(np.int64).max if xs.dtype.kind == "i" else np.inf
+    posiciones = np.arange(n)
+    mejor2 = np.full(n, infinito, dtype=xs.dtype)
+    vecino = np.full(n, -1, dtype=np.int64)
+
+    # Casos base: todos los pares de cada hoja, actualizando ambos extremos
+    hoja = posiciones // tam_hoja
+    for k in range(1, min(tam_hoja, n)):
+        a = posiciones[:-k][hoja[:-k] == hoja[k:]]
+        b = a + k
+        dx = xs[b] - xs[a]
+        dy = ys[b] - ys[a]
+        dist2 = dx * dx + dy * dy
+        _mejorar_vecinos(mejor2, vecino, a, b, dist2)
+        _mejorar_vecinos(mejor2, vecino, b, a, dist2)
+
+    # En flotante, para no convertir el arreglo en cada búsqueda de ventana
+    y_ordenadas = np.sort(ys).astype(np.float64)
+    rango_y = np.empty(n, dtype=np.int64)
+    rango_y[np.argsort(ys, kind="stable")] = posiciones
+    orden_y = np.argsort(hoja * n + rango_y, kind="stable")
+
+    tam_grupo = tam_hoja
+    while tam_grupo < n:
+        tam_grupo *= 2
+        grupo = posiciones // tam_grupo
+        orden_y = orden_y[np.argsort(grupo[orden_y] * n + rango_y[orden_y], kind="stable")]
+        inicio_der = grupo * tam_grupo + tam_grupo // 2
+        en_der = posiciones >= inicio_der
+        # El último grupo puede no tener hijo derecho
+        con_pareja = inicio_der < n
+        dx_medio = xs - xs[np.minimum(inicio_der, n - 1)]
+        cerca = con_pareja & (dx_medio * dx_medio < mejor2)
+
+        for lado in (False, True):
+            # Consultas en orden (grupo, y): las búsquedas binarias llegan casi
+            # ordenadas y aprovechan la caché
+            consultas = orden_y[cerca[orden_y] & (en_der[orden_y] == lado)]
+            if consultas.size == 0:
+                continue
+            # Candidatos de la otra mitad, por (grupo, y), dentro del radio
+            # máximo de las consultas de su grupo
+            radio_max2 = np.zeros(n // tam_grupo + 1, dtype=xs.dtype)
+            np.maximum.at(radio_max2, grupo[consultas], mejor2[consultas])
+            candidatos = orden_y[con_pareja[orden_y] & (en_der[orden_y] != lado)]
+            dx_cand = dx_medio[candidatos]
+            candidatos = candidatos[dx_cand * dx_cand < radio_max2[grupo[candidatos]]]
+            if candidatos.size == 0:
+                continue
+            claves = grupo[candidatos] * n + rango_y[candidatos]
+
+            radio = np.sqrt(mejor2[consultas].astype(np.float64))
+            desde = np.searchsorted(y_ordenadas, ys[consultas] - radio, side="left")
+            hasta = np.searchsorted(y_ordenadas, ys[consultas] + radio, side="right")
+            base = grupo[consultas] * n
+            limites = (np.searchsorted(claves, base + desde, side="left"),
+                       np.searchsorted(claves, base + hasta, side="left"))
+            _buscar_en_otra_mitad(xs, ys, consultas, candidatos, claves, limites,
+                                  mejor2, vecino)
+
+    vecino_original = np.empty(n, dtype=np.int64)
+    distancia = np.empty(n, dtype=np.float64)
+    vecino_original[orden] = orden[vecino]
+    distancia[orden] = np.sqrt(mejor2.astype(np.float64))
+    return vecino_original, distancia
+
+def vecinos_mas_cercanos(puntos):
+    """
+    Calcula el vecino más cercano de cada punto de una lista.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y), por ejemplo
+        la salida de `leer_puntos`.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Arreglos (vecino, distancia) como los de
+        `vecinos_mas_cercanos_columnas`; `vecino[i]` es un índice de `puntos`.
+
+    Examples
+    --------
+    >>> vecino, distancia = vecinos_mas_cercanos([(0, 0), (3, 4), (0, 1)])
+    >>> vecino.tolist(), distancia.tolist()
+    ([2, 2, 0], [1.0, 4.242640687119285, 1.0])
+    """
+    if np is None:
+        raise ImportError("El cálculo vectorizado de vecinos requiere NumPy.")
+    coordenadas = np.asarray(puntos).reshape(-1, 2)
+    return vecinos_mas_cercanos_columnas(coordenadas[:, 0], coordenadas[:, 1])
+
+def _ordenar_por_y_rango(buffer, inicio, fin):
+    """Ordena por inserción el rango `buffer[inicio:fin]` según la coordenada y."""
+    for i in range(inicio + 1, fin):
+        punto = buffer[i]
+        j = i - 1
+        while j >= inicio and buffer[j][1] > punto[1]:
+            buffer[j + 1] = buffer[j]
+            j -= 1
+        buffer[j + 1] = punto
+
+def _par_mas_cercano_rango(buffer, auxiliar, inicio, fin):
     """
-    Función envoltorio para iniciar el algoritmo de divide y conquista.
+    Resuelve el rango `buffer[inicio:fin]` y lo deja ordenado por y.
 
-    Prepara los datos ordenando los puntos por las coordenadas (x , y)
-    antes de llamar a la función recursiva.
+    Al entrar el rango está ordenado por x; al salir queda ordenado por y,
+    gracias a la fusión de las dos mitades en `auxiliar`. Devuelve los dos
+    puntos del par más cercano y su distancia al cuadrado.
+    """
+    n = fin - inicio
+
+    # Caso base: fuerza bruta con distancias al cuadrado
+    if n <= 3:
+        mejor_d2 = float('inf')
+        p_min = q_min = None
+        for i in range(inicio, fin):
+            pi = buffer[i]
+            for j in range(i + 1, fin):
+                pj = buffer[j]
+                dx = pi[0] - pj[0]
+                dy = pi[1] - pj[1]
+                d2 = dx * dx + dy * dy
+                if d2 < mejor_d2:
+                    mejor_d2 = d2
+                    p_min, q_min = pi, pj
+        _ordenar_por_y_rango(buffer, inicio, fin)
+        return p_min, q_min, mejor_d2
+
+    # 1. Divide: la recta se fija antes de que la recursión reordene el rango
+    medio = inicio + n // 2
+    x_medio = buffer[medio][0]
+
+    # 2. Conquista
+    p_izq, q_izq, d2_izq = _par_mas_cercano_rango(buffer, auxiliar, inicio, medio)
+    p_der, q_der, d2_der = _par_mas_cercano_rango(buffer, auxiliar, medio, fin)
+    if d2_izq <= d2_der:
+        p_min, q_min, d2_min = p_izq, q_izq, d2_izq
+    else:
+        p_min, q_min, d2_min = p_der, q_der, d2_der
+
+    # Fusionar las dos mitades (ya ordenadas por y) usando el búfer auxiliar
+    i, j, k = inicio, medio, inicio
+    while i < medio and j < fin:
+        if buffer[j][1] < buffer[i][1]:
+            auxiliar[k] = buffer[j]
+            j += 1
+        else:
+            auxiliar[k] = buffer[i]
+            i += 1
+        k += 1
+    while i < medio:
+        auxiliar[k] = buffer[i]
+        i += 1
+        k += 1
+    # Los restantes de la mitad derecha ya están en su sitio; el resto se
+    # copia de vuelta elemento a elemento, sin crear una lista intermedia
+    for i in range(inicio, k):
+        buffer[i] = auxiliar[i]
+
+    # 3. Combina: la franja se escribe en el búfer auxiliar, ya libre
+    tam_franja = inicio
+    for k in range(inicio, fin):
+        punto = buffer[k]
+        dx = punto[0] - x_medio
+        if dx * dx < d2_min:
+            auxiliar[tam_franja] = punto
+            tam_franja += 1
+
+    for i in range(inicio, tam_franja):
+        pi = auxiliar[i]
+        for j in range(i + 1, tam_franja):
+            pj = auxiliar[j]
+            dy = pj[1] - pi[1]
+            if dy * dy >= d2_min:
+                break
+            dx = pj[0] - pi[0]
+            d2 = dx * dx + dy * dy
+            if d2 < d2_min:
+                d2_min = d2
+                p_min, q_min = pi, pj
+
+    return p_min, q_min, d2_min
+
+def par_mas_cercano_indices(puntos):
+    """
+    Encuentra el par más cercano sin copiar sublistas en la recursión.
+
+    Los puntos se ordenan una sola vez por x en un único búfer y la recursión
+    trabaja sobre rangos de índices de ese búfer. El orden por y de cada rango
+    se construye fusionando sus dos mitades en un búfer auxiliar reutilizable,
+    que también aloja la franja, de modo que la memoria adicional es un único
+    arreglo de n referencias en lugar de nuevas listas en cada nivel.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto1, punto2, min_dist) como la de
+        `par_mas_cercano_div_conq`.
+
+    Notes
+    -----
+    Las distancias se comparan al cuadrado (exactas con coordenadas enteras)
+    y la raíz cuadrada se calcula una única vez, al final.
+    """
+    n = len(puntos)
+    if n < 2:
+        return None, None, float('inf')
+
+    buffer = sorted(puntos)
+    auxiliar = [None] * n
+    p, q, d2 = _par_mas_cercano_rango(buffer, auxiliar, 0, n)
+    return p, q, math.sqrt(d2)
+
+def par_mas_cercano_iterativo(puntos, tam_hoja=4):
+    """
+    Encuentra el par más cercano con un divide y conquista ascendente.
+
+    Es el mismo esquema que `par_mas_cercano_indices`, pero sin recursión:
+    tras ordenar una vez por x se resuelven los tramos de `tam_hoja` puntos
+    y después, en pasadas sucesivas, se fusionan por y los tramos vecinos
+    de dos en dos (como en Shamos y Hoey), duplicando su tamaño. La franja
+    de cada fusión se toma directamente del tramo recién fusionado.
 
     Parameters
     ----------
     puntos : list of tuple of int
         Lista de puntos, donde cada punto es una tupla (x, y).
+    tam_hoja : int, optional
+        Número de puntos de los tramos iniciales, resueltos por fuerza
+        bruta. Por defecto 4.
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto1, punto2, min_dist) como la de
+        `par_mas_cercano_div_conq`.
+
+    Notes
+    -----
+    Cada pasada fusiona los tramos de `buffer` en un búfer auxiliar de n
+    referencias y después intercambia los papeles de ambos, de modo que
+    ninguna fusión crea listas; los tramos iniciales se ordenan por
+    inserción en su sitio. La franja se escribe en una tercera lista de n
+    referencias, también reservada al inicio y reutilizada.
+
+    Cada fusión compara la franja con la mejor distancia global hallada
+    hasta el momento, que nunca es mayor que la de sus dos mitades, así que
+    las franjas son a lo sumo tan anchas como en la versión recursiva. No
+    hay límite de recursión que alcanzar, sea cual sea la distribución de
+    los puntos.
+
+    References
+    ----------
+    Shamos, M. I., y Hoey, D. (1975). Closest-point problems. 16th Annual
+    Symposium on Foundations of Computer Science, 151-162.
+    """
+    n = len(puntos)
+    if n < 2:
+        return None, None, float('inf')
+
+    buffer = sorted(puntos)
+    x_orden = [punto[0] for punto in buffer]
+    auxiliar = [None] * n
+    franja = [None] * n
+
+    # 1. Hojas: fuerza bruta y ordenación por y de cada tramo inicial
+    mejor_d2 = float('inf')
+    p_min = q_min = None
+    for inicio in range(0, n, tam_hoja):
+        fin = min(inicio + tam_hoja, n)
+        for i in range(inicio, fin):
+            pi = buffer[i]
+            for j in range(i + 1, fin):
+                pj = buffer[j]
+                dx = pi[0] - pj[0]
+                dy = pi[1] - pj[1]
+                d2 = dx * dx + dy * dy
+                if d2 < mejor_d2:
+                    mejor_d2 = d2
+                    p_min, q_min = pi, pj
+        _ordenar_por_y_rango(buffer, inicio, fin)
+
+    # 2. Pasadas ascendentes: fusionar tramos vecinos en `auxiliar` y revisar su franja
+    ancho = tam_hoja
+    while ancho < n and mejor_d2 > 0:
+        for inicio in range(0, n, 2 * ancho):
+            medio = min(inicio + ancho, n)
+            fin = min(medio + ancho, n)
+            i, j, k = inicio, medio, inicio
+            while i < medio and j < fin:
+                if buffer[j][1] < buffer[i][1]:
+                    auxiliar[k] = buffer[j]
+                    j += 1
+                else:
+                    auxiliar[k] = buffer[i]
+                    i += 1
+                k += 1
+            while i < medio:
+                auxiliar[k] = buffer[i]
+                i += 1
+                k += 1
+            while j < fin:
+                auxiliar[k] = buffer[j]
+                j += 1
+                k += 1
+            # Un último tramo sin pareja solo se copia, hasta la pasada siguiente
+            if medio == fin:
+                continue
+
+            x_medio = x_orden[medio]
+            tam_franja = 0
+            for k in range(inicio, fin):
+                punto = auxiliar[k]
+                dx = punto[0] - x_medio
+                if dx * dx < mejor_d2:
+                    franja[tam_franja] = punto
+                    tam_franja += 1
+
+            for i in range(tam_franja):
+                pi = franja[i]
+                for j in range(i + 1, tam_franja):
+                    pj = franja[j]
+                    dy = pj[1] - pi[1]
+                    if dy * dy >= mejor_d2:
+                        break
+                    dx = pj[0] - pi[0]
+                    d2 = dx * dx + dy * dy
+                    if d2 < mejor_d2:
+                        mejor_d2 = d2
+                        p_min, q_min = pi, pj
+        buffer, auxiliar = auxiliar, buffer
+        ancho *= 2
+
+    return p_min, q_min, math.sqrt(mejor_d2)
+
+def _lado_celda(dist2):
+    """Lado de celda no menor que la distancia cuya raíz cuadrada es `dist2`."""
+    if isinstance(dist2, int):
+        return math.isqrt(dist2) + 1
+    return math.sqrt(dist2)
+
+def _construir_rejilla(puntos, lado):
+    """Agrupa los puntos en un diccionario de celdas cuadradas de lado `lado`."""
+    rejilla = {}
+    for punto in puntos:
+        celda = (punto[0] // lado, punto[1] // lado)
+        if celda in rejilla:
+            rejilla[celda].append(punto)
+        else:
+            rejilla[celda] = [punto]
+    return rejilla
+
+def par_mas_cercano_rejilla(puntos, semilla=None):
+    """
+    Encuentra el par más cercano con una rejilla de dispersión aleatorizada.
+
+    Los puntos se insertan en orden aleatorio en una rejilla cuyas celdas
+    miden al menos la distancia mínima actual; cada punto nuevo solo se
+    compara con las 9 celdas vecinas. Cuando aparece un par más cercano, la
+    rejilla se reconstruye con el nuevo lado. Como la probabilidad de que el
+    i-ésimo punto mejore la distancia es a lo sumo 2/i, el costo esperado de
+    las reconstrucciones es lineal.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+    semilla : int, optional
+        Semilla del generador aleatorio. Con la misma semilla el resultado,
+        incluido el par elegido ante empates, es reproducible.
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto1, punto2, min_dist) como la de
+        `par_mas_cercano_div_conq`.
+
+    Notes
+    -----
+    El tiempo esperado es O(n), independiente de la distribución de los
+    puntos, a cambio de usar un diccionario como tabla de dispersión.
+
+    References
+    ----------
+    Khuller, S., & Matias, Y. (1995). A simple randomized sieve algorithm for
+    the closest-pair problem. Information and Computation, 118(1), 34-37.
+    """
+    n = len(puntos)
+    if n < 2:
+        return None, None, float('inf')
+
+    orden = list(puntos)
+    random.Random(semilla).shuffle(orden)
+
+    p_min, q_min = orden[0], orden[1]
+    dx = p_min[0] - q_min[0]
+    dy = p_min[1] - q_min[1]
+    d2_min = dx * dx + dy * dy
+    if d2_min == 0:
+        return p_min, q_min, 0.0
+
+    lado = _lado_celda(d2_min)
+    rejilla = _construir_rejilla(orden[:2], lado)
+
+    for i in range(2, n):
+        punto = orden[i]
+        cx = punto[0] // lado
+        cy = punto[1] // lado
+
+        mejor_d2 = d2_min
+        vecino = None
+        for vx in (cx - 1, cx, cx + 1):
+            for vy in (cy - 1, cy, cy + 1):
+                for otro in rejilla.get((vx, vy), ()):
+                    dx = punto[0] - otro[0]
+                    dy = punto[1] - otro[1]
+                    d2 = dx * dx + dy * dy
+                    if d2 < mejor_d2:
+                        mejor_d2 = d2
+                        vecino = otro
+
+        if vecino is None:
+            celda = (cx, cy)
+            if celda in rejilla:
+                rejilla[celda].append(punto)
+            else:
+                rejilla[celda] = [punto]
+            continue
+
+        # Mejora: reconstruir la rejilla con el nuevo lado
+        p_min, q_min, d2_min = vecino, punto, mejor_d2
+        if d2_min == 0:
+            break
+        lado = _lado_celda(d2_min)
+        rejilla = _construir_rejilla(orden[:i + 1], lado)
+
+    return p_min, q_min, math.sqrt(d2_min)
+
+def _par_mas_cercano_paralelo(puntos, **opciones):
+    """Carga bajo demanda el motor multinúcleo, que depende de este módulo."""
+    from par_cercano_paralelo import par_mas_cercano_paralelo
+    return par_mas_cercano_paralelo(puntos, **opciones)
+
+def _par_mas_cercano_nd(puntos, **opciones):
+    """Carga bajo demanda el motor de d dimensiones."""
+    from par_cercano_nd import par_mas_cercano_nd
+    return par_mas_cercano_nd(puntos, **opciones)
+
+MOTORES = {
+    "div_conq": par_mas_cercano_div_conq,
+    "numpy": par_mas_cercano_numpy,
+    "indices": par_mas_cercano_indices,
+    "iterativo": par_mas_cercano_iterativo,
+    "rejilla": par_mas_cercano_rejilla,
+    "paralelo": _par_mas_cercano_paralelo,
+    "nd": _par_mas_cercano_nd,
+}
+
+def encontrar_par_mas_cercano(puntos, motor="div_conq", estadisticas=None, **opciones):
+    """
+    Encuentra el par más cercano de `puntos` con el motor indicado.
+
+    Es el punto de entrada común a todos los motores de `MOTORES`: valida
+    el nombre del motor, resuelve los casos con menos de dos puntos y
+    delega en la función correspondiente, que se encarga de ordenar o
+    preparar los datos que necesite.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+    motor : str, optional
+        Nombre del motor a utilizar, una de las claves de `MOTORES`.
+        Por defecto "div_conq" (la versión recursiva con listas).
+    estadisticas : estadisticas.EstadisticasParCercano, optional
+        Si se indica, se ejecuta el motor "div_conq" acumulando en este
+        registro la profundidad, los casos base, las franjas por nivel, las
+        evaluaciones de distancia y el tiempo de cada fase. Por defecto
+        None: se ejecuta el motor sin medir.
+    **opciones
+        Argumentos adicionales para el motor, por ejemplo `semilla` para
+        los motores "rejilla" y "nd" o `procesos` para el motor "paralelo".
+        El motor "nd" acepta puntos de cualquier número de coordenadas.
 
     Returns
     -------
@@ -221,19 +1040,34 @@ def encontrar_par_mas_cercano(puntos):
         - punto2 (tuple of int): El segundo punto del par más cercano.
         - min_dist (float): La distancia mínima entre los dos puntos.
 
+    Raises
+    ------
+    ValueError
+        Si `motor` no es uno de los motores disponibles, o si se piden
+        `estadisticas` para un motor distinto de "div_conq".
+
     References
     ----------
     Adaptado del algoritmo descrito en Cormen, T. H., Leiserson, C. E.,
     Rivest, R. L., & Stein, C. (2009). *Introduction to Algorithms*. MIT Press.
     """
+    if motor not in MOTORES:
+        raise ValueError(
+            f"Motor desconocido: {motor!r}. Opciones: {', '.join(MOTORES)}"
+        )
+
+    if estadisticas is not None:
+        if motor != "div_conq":
+            raise ValueError("Las estadísticas solo están disponibles para el motor 'div_conq'.")
+        # Carga bajo demanda: el módulo de estadísticas depende de este
+        from estadisticas import par_mas_cercano_div_conq_medido
+        return par_mas_cercano_div_conq_medido(puntos, estadisticas)
+
     n = len(puntos)
     if n < 2:
         return None, None, float('inf')
 
-    puntos_ordenados_x = sorted(puntos, key=lambda p: p[0])
-    puntos_ordenados_y = sorted(puntos, key=lambda p: p[1])
-
-    return par_mas_cercano_div_conq_recursivo(puntos_ordenados_x, puntos_ordenados_y)
+    return MOTORES[motor](puntos, **opciones)
 
 if __name__ == "__main__":
     # Ejemplo de uso:
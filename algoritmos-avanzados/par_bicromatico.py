@@ -0,0 +1,87 @@
+"""
+Módulo para encontrar el par más cercano entre dos conjuntos de puntos.
+
+Complementa a `encontrar_par_mas_cercano` para el caso bicromático: un
+punto del par debe pertenecer al conjunto A y el otro al conjunto B, por
+ejemplo `datos_1000.txt` frente a `datos_10000.txt`. En lugar de comparar
+todos los pares del producto cruzado, uno de los conjuntos se organiza en un
+`IndiceKD` y los puntos del otro lo consultan con la mejor distancia
+hallada hasta el momento como cota.
+
+Contenido
+---------
+- Funciones
+    - encontrar_par_bicromatico: Par más cercano con un punto de cada conjunto.
+"""
+import math
+
+from indice_kd import IndiceKD
+
+
+def encontrar_par_bicromatico(conjunto_a, conjunto_b, tam_hoja=8):
+    """
+    Encuentra el par más cercano con un punto de A y otro de B.
+
+    Si alguno de los conjuntos ya es un `IndiceKD`, se usa tal cual; si no,
+    se indexa el mayor de los dos y se consulta con los puntos del menor.
+
+    Parameters
+    ----------
+    conjunto_a, conjunto_b : list of tuple of int or IndiceKD
+        Los dos conjuntos, como listas de puntos (por ejemplo, la salida de
+        `leer_puntos`) o como índices ya construidos.
+    tam_hoja : int, optional
+        Tamaño de hoja del índice cuando hay que construirlo. Por defecto 8.
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto_a, punto_b, min_dist): el primer punto siempre
+        pertenece a `conjunto_a` y el segundo a `conjunto_b`, sea cual sea
+        el conjunto indexado. Retorna (None, None, float('inf')) si alguno
+        de los conjuntos está vacío.
+
+    Notes
+    -----
+    Construir el índice cuesta O(n log^2 n) y cada consulta, acotada por la
+    mejor distancia actual, visita en la práctica O(log n) nodos, así que el
+    total es O((n + m) log^2 (n + m)) frente al O(n m) del producto cruzado.
+    Las distancias se comparan al cuadrado, exactas con coordenadas enteras,
+    y la búsqueda termina en cuanto aparece un punto común a ambos conjuntos.
+
+    Examples
+    --------
+    >>> encontrar_par_bicromatico([(0, 0), (10, 10)], [(1, 1), (2, 2), (0, 1)])
+    ((0, 0), (0, 1), 1.0)
+    >>> encontrar_par_bicromatico([(0, 0), (0, 1)], [(5, 5)])
+    ((0, 1), (5, 5), 6.4031242374328485)
+    """
+    if len(conjunto_a) == 0 or len(conjunto_b) == 0:
+        return None, None, float('inf')
+
+    # El índice es B salvo que solo A venga indexado o, sin índices, A sea mayor
+    a_es_indice = isinstance(conjunto_a, IndiceKD)
+    b_es_indice = isinstance(conjunto_b, IndiceKD)
+    invertido = a_es_indice and not b_es_indice or \
+        not a_es_indice and not b_es_indice and len(conjunto_a) > len(conjunto_b)
+    consultas, indice = (conjunto_b, conjunto_a) if invertido else (conjunto_a, conjunto_b)
+    if not isinstance(indice, IndiceKD):
+        indice = IndiceKD(indice, tam_hoja)
+
+    mejor_d2 = math.inf
+    par = None
+    for punto in consultas:
+        vecino, _ = indice.vecino_mas_cercano(punto, mejor_d2)
+        if vecino is None:
+            continue
+        dx = punto[0] - vecino[0]
+        dy = punto[1] - vecino[1]
+        mejor_d2 = dx * dx + dy * dy
+        par = (punto, vecino)
+        if mejor_d2 == 0:
+            break
+
+    consulta, vecino = par
+    if invertido:
+        return vecino, consulta, math.sqrt(mejor_d2)
+    return consulta, vecino, math.sqrt(mejor_d2)
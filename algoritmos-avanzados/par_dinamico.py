@@ -0,0 +1,205 @@
+"""
+Módulo para mantener el par más cercano de un conjunto de puntos que cambia.
+
+Pensado para flujos de puntos que llegan por lotes: en lugar de volver a
+ejecutar `encontrar_par_mas_cercano` sobre todo lo acumulado, la estructura
+acepta inserciones y eliminaciones y mantiene el par más cercano actualizado.
+
+Contenido
+---------
+- Clases
+    - ParMasCercanoDinamico: Par más cercano con inserciones y eliminaciones.
+"""
+import heapq
+import math
+
+from main import _lado_celda, encontrar_par_mas_cercano
+
+
+class ParMasCercanoDinamico:
+    """
+    Par más cercano de un multiconjunto de puntos con actualizaciones.
+
+    Los puntos distintos se guardan en una rejilla de dispersión cuyo lado
+    `lado` es mayor que la distancia mínima actual d y a lo sumo unas cuatro
+    veces d. Todos los pares a distancia menor que `lado` caen en celdas
+    vecinas y se guardan en un montículo, cuyo mínimo válido es el par más
+    cercano. Como `lado` es proporcional a d, cada punto tiene un número
+    acotado de pares cercanos y cada actualización cuesta O(log n).
+
+    La rejilla se reconstruye, en O(n log n), solo cuando d cae por debajo de
+    `lado / 4` o cuando las eliminaciones dejan el montículo sin pares
+    válidos. En secuencias de actualizaciones no adversarias esto ocurre
+    pocas veces, por lo que el costo amortizado es sublineal.
+
+    Los puntos repetidos se cuentan aparte: mientras exista un punto con dos
+    o más copias, el par más cercano es ese punto consigo mismo, a
+    distancia 0, igual que en un recálculo completo.
+
+    Examples
+    --------
+    >>> flujo = ParMasCercanoDinamico([(0, 0), (10, 10)])
+    >>> flujo.insertar((9, 9))
+    >>> flujo.par_mas_cercano()
+    ((9, 9), (10, 10), 1.4142135623730951)
+    >>> flujo.eliminar((10, 10))
+    >>> flujo.par_mas_cercano()
+    ((0, 0), (9, 9), 12.727922061357855)
+    """
+
+    def __init__(self, puntos=()):
+        """
+        Inicializa la estructura con los puntos dados.
+
+        Parameters
+        ----------
+        puntos : iterable of tuple of int, optional
+            Puntos iniciales, por ejemplo la salida de `leer_puntos`.
+        """
+        self._conteo = {}
+        self._repetidos = set()
+        self._total = 0
+        for punto in puntos:
+            self._agregar_conteo(punto)
+        self._reconstruir()
+
+    def __len__(self):
+        return self._total
+
+    def _agregar_conteo(self, punto):
+        """Suma una copia de `punto` y devuelve True si es un punto nuevo."""
+        copias = self._conteo.get(punto, 0) + 1
+        self._conteo[punto] = copias
+        self._total += 1
+        if copias == 2:
+            self._repetidos.add(punto)
+        return copias == 1
+
+    def _celda(self, punto):
+        return punto[0] // self._lado, punto[1] // self._lado
+
+    def _vecinos(self, punto):
+        """Genera los puntos distintos de las 9 celdas alrededor de `punto`."""
+        cx, cy = self._celda(punto)
+        for vx in (cx - 1, cx, cx + 1):
+            for vy in (cy - 1, cy, cy + 1):
+                yield from self._celdas.get((vx, vy), ())
+
+    def _registrar_pares(self, punto):
+        """Añade al montículo los pares de `punto` a distancia menor que `lado`."""
+        for otro in self._vecinos(punto):
+            if otro == punto:
+                continue
+            dx = punto[0] - otro[0]
+            dy = punto[1] - otro[1]
+            d2 = dx * dx + dy * dy
+            if d2 < self._lado2:
+                heapq.heappush(self._pares, (d2, min(punto, otro), max(punto, otro)))
+
+    def _reconstruir(self):
+        """Recalcula el lado de la rejilla y todos los pares cercanos."""
+        distintos = list(self._conteo)
+        self._celdas = {}
+        self._pares = []
+        p, q, _ = encontrar_par_mas_cercano(distintos)
+        if p is None:
+            # Menos de dos puntos distintos: no hay pares que mantener
+            self._lado = self._lado2 = None
+            return
+
+        dx = p[0] - q[0]
+        dy = p[1] - q[1]
+        # Lado mayor que el doble de la distancia: 2d = raíz de 4d²
+        self._lado = _lado_celda(4 * (dx * dx + dy * dy))
+        self._lado2 = self._lado * self._lado
+        for punto in distintos:
+            self._registrar_pares(punto)
+            self._celdas.setdefault(self._celda(punto), set()).add(punto)
+
+    def _par_valido(self):
+        """Descarta pares obsoletos de la cima del montículo y devuelve el mínimo."""
+        while self._pares:
+            d2, p, q = self._pares[0]
+            if p in self._conteo and q in self._conteo:
+                return d2, p, q
+            heapq.heappop(self._pares)
+        return None
+
+    def insertar(self, punto):
+        """
+        Inserta una copia de `punto`.
+
+        Parameters
+        ----------
+        punto : tuple of int
+            Punto (x, y) a insertar.
+        """
+        if not self._agregar_conteo(punto):
+            return
+        if self._lado is None:
+            self._reconstruir()
+            return
+
+        self._registrar_pares(punto)
+        self._celdas.setdefault(self._celda(punto), set()).add(punto)
+
+        # Si la distancia mínima bajó mucho, la rejilla quedó demasiado gruesa
+        par = self._par_valido()
+        if par is not None and 16 * par[0] < self._lado2:
+            self._reconstruir()
+
+    def eliminar(self, punto):
+        """
+        Elimina una copia de `punto`.
+
+        Parameters
+        ----------
+        punto : tuple of int
+            Punto (x, y) a eliminar.
+
+        Raises
+        ------
+        ValueError
+            Si `punto` no está en la estructura.
+        """
+        copias = self._conteo.get(punto, 0)
+        if copias == 0:
+            raise ValueError(f"El punto {punto} no está en la estructura.")
+        self._total -= 1
+        if copias > 1:
+            self._conteo[punto] = copias - 1
+            if copias == 2:
+                self._repetidos.discard(punto)
+            return
+
+        del self._conteo[punto]
+        if self._lado is None:
+            return
+        celda = self._celda(punto)
+        self._celdas[celda].discard(punto)
+        if not self._celdas[celda]:
+            del self._celdas[celda]
+
+        # Sin pares válidos la distancia mínima creció por encima de `lado`;
+        # con demasiados pares obsoletos conviene compactar el montículo
+        if self._par_valido() is None or len(self._pares) > 8 * len(self._conteo) + 64:
+            self._reconstruir()
+
+    def par_mas_cercano(self):
+        """
+        Devuelve el par más cercano actual.
+
+        Returns
+        -------
+        tuple
+            Una tupla (punto1, punto2, min_dist) con el mismo contrato que
+            `encontrar_par_mas_cercano`.
+        """
+        if self._repetidos:
+            punto = next(iter(self._repetidos))
+            return punto, punto, 0.0
+        par = self._par_valido() if self._lado is not None else None
+        if par is None:
+            return None, None, float('inf')
+        d2, p, q = par
+        return p, q, math.sqrt(d2)
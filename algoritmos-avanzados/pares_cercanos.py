@@ -0,0 +1,148 @@
+"""
+Módulo para enumerar varios pares cercanos en lugar de uno solo.
+
+Generaliza `encontrar_par_mas_cercano` para tareas de deduplicación: obtener
+los k pares más cercanos o todos los pares a distancia menor que un umbral.
+Ambas funciones son generadores, por lo que millones de coincidencias nunca
+se guardan en memoria a la vez.
+
+Contenido
+---------
+- Funciones
+    - pares_bajo_umbral: Genera todos los pares a distancia menor que un umbral.
+    - k_pares_mas_cercanos: Genera los k pares más cercanos en orden creciente.
+"""
+import heapq
+import itertools
+import math
+
+from main import encontrar_par_mas_cercano
+
+# Celdas vecinas "hacia adelante": cada par de celdas adyacentes se visita una vez
+_VECINAS_ADELANTE = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def pares_bajo_umbral(puntos, umbral):
+    """
+    Genera todos los pares de puntos a distancia menor que `umbral`.
+
+    Los puntos se agrupan en una rejilla de celdas de lado `umbral`, de modo
+    que cada par buscado queda en la misma celda o en celdas adyacentes. El
+    costo es O(n + m), con m el número de pares comparados, que es
+    proporcional a la salida salvo en regiones muy densas.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+    umbral : float
+        Distancia máxima (exclusiva) de los pares a generar.
+
+    Yields
+    ------
+    tuple
+        Tuplas (punto1, punto2, distancia), sin un orden particular. Cada
+        par de posiciones de `puntos` se genera una sola vez; los puntos
+        repetidos forman pares a distancia 0.
+
+    Examples
+    --------
+    >>> sorted(pares_bajo_umbral([(0, 0), (1, 0), (5, 5), (0, 1)], 1.5))
+    [((0, 0), (0, 1), 1.0), ((0, 0), (1, 0), 1.0), ((1, 0), (0, 1), 1.4142135623730951)]
+    """
+    if umbral <= 0:
+        return
+    umbral2 = umbral * umbral
+
+    celdas = {}
+    for i, punto in enumerate(puntos):
+        celdas.setdefault((punto[0] // umbral, punto[1] // umbral), []).append(i)
+
+    def comparar(i, j):
+        p = puntos[i]
+        q = puntos[j]
+        dx = p[0] - q[0]
+        dy = p[1] - q[1]
+        d2 = dx * dx + dy * dy
+        if d2 < umbral2:
+            return p, q, math.sqrt(d2)
+        return None
+
+    for (cx, cy), miembros in celdas.items():
+        for a, i in enumerate(miembros):
+            for j in miembros[a + 1:]:
+                par = comparar(i, j)
+                if par is not None:
+                    yield par
+        for ox, oy in _VECINAS_ADELANTE:
+            otros = celdas.get((cx + ox, cy + oy))
+            if otros is None:
+                continue
+            for i in miembros:
+                for j in otros:
+                    par = comparar(i, j)
+                    if par is not None:
+                        yield par
+
+
+def k_pares_mas_cercanos(puntos, k):
+    """
+    Genera los k pares más cercanos en orden de distancia creciente.
+
+    Parte de la distancia del par más cercano entre puntos distintos y la
+    duplica hasta que `pares_bajo_umbral` produce al menos k pares. Cada
+    umbral se recorre una sola vez y sus pares pasan por un montículo
+    acotado con los k menores, de modo que el recorrido que alcanza k pares
+    ya deja la respuesta y la memoria es O(n + k). Con puntos uniformes el
+    área de búsqueda crece de forma geométrica y el último umbral genera del
+    orden de 4k pares; con puntos agrupados, duplicar el umbral puede sumar
+    de golpe muchos más.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+    k : int
+        Número de pares a generar. Si hay menos pares posibles, se generan
+        todos.
+
+    Yields
+    ------
+    tuple
+        Tuplas (punto1, punto2, distancia) ordenadas por distancia. El
+        primer par generado está a la misma distancia que el resultado de
+        `encontrar_par_mas_cercano`.
+
+    Examples
+    --------
+    >>> list(k_pares_mas_cercanos([(0, 0), (3, 0), (10, 0), (4, 0)], 2))
+    [((3, 0), (4, 0), 1.0), ((0, 0), (3, 0), 3.0)]
+    """
+    n = len(puntos)
+    k = min(k, n * (n - 1) // 2)
+    if k <= 0:
+        return
+
+    _, _, umbral = encontrar_par_mas_cercano(list(set(puntos)))
+    if math.isinf(umbral):
+        # Todos los puntos coinciden: cualquier par está a distancia 0
+        for i, j in itertools.islice(itertools.combinations(range(n), 2), k):
+            yield puntos[i], puntos[j], 0.0
+        return
+
+    while True:
+        # Montículo de los k pares menores; en la raíz, el mayor (y, a igual
+        # distancia, el hallado después)
+        mejores = []
+        for orden, (p, q, distancia) in enumerate(pares_bajo_umbral(puntos, umbral)):
+            entrada = (-distancia, -orden, p, q)
+            if len(mejores) < k:
+                heapq.heappush(mejores, entrada)
+            elif entrada > mejores[0]:
+                heapq.heapreplace(mejores, entrada)
+        if len(mejores) == k:
+            break
+        umbral *= 2
+
+    for distancia, _, p, q in sorted(mejores, reverse=True):
+        yield p, q, -distancia
@@ -0,0 +1,230 @@
+"""
+Módulo para resolver muchos archivos de puntos en paralelo.
+
+Procesa todos los archivos de un directorio, o los listados en un
+manifiesto, repartidos entre varios procesos: mientras un proceso lee su
+archivo otro ya está resolviendo el suyo. Por cada archivo escribe un
+registro estructurado (JSON Lines o CSV) con el par, la distancia, el número
+de puntos y el tiempo de cada fase. Un archivo con errores queda registrado
+como tal sin detener el resto del lote.
+
+Contenido
+---------
+- Funciones
+    - listar_archivos: Obtiene los archivos de un directorio o manifiesto.
+    - procesar_archivo: Lee y resuelve un archivo, devolviendo su registro.
+    - procesar_lote: Procesa varios archivos en paralelo y escribe los registros.
+
+Examples
+--------
+Desde la línea de comandos::
+
+    python procesar_lote.py datos/ --procesos 8 --salida resultados.jsonl
+    python procesar_lote.py manifiesto.txt --formato csv --salida resultados.csv
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from main import MOTORES, encontrar_par_mas_cercano, leer_puntos
+
+CAMPOS = ["archivo", "motor", "n", "p_x", "p_y", "q_x", "q_y", "distancia",
+          "lectura_s", "resolucion_s", "total_s", "error"]
+
+
+def listar_archivos(ruta):
+    """
+    Obtiene los archivos de puntos a procesar.
+
+    Parameters
+    ----------
+    ruta : str
+        Un directorio, del que se toman todos los archivos `.txt`, o un
+        manifiesto con una ruta por línea. Las rutas relativas del
+        manifiesto se resuelven desde su directorio; se ignoran las líneas
+        vacías y las que empiezan por "#".
+
+    Returns
+    -------
+    list of str
+        Rutas de los archivos, en orden.
+    """
+    if os.path.isdir(ruta):
+        return sorted(os.path.join(ruta, nombre) for nombre in os.listdir(ruta)
+                      if nombre.endswith(".txt"))
+
+    base = os.path.dirname(ruta)
+    archivos = []
+    with open(ruta, encoding="utf-8") as manifiesto:
+        for linea in manifiesto:
+            linea = linea.strip()
+            if linea and not linea.startswith("#"):
+                archivos.append(os.path.join(base, linea))
+    return archivos
+
+
+def procesar_archivo(nombre_archivo, motor="div_conq"):
+    """
+    Lee y resuelve un archivo, midiendo cada fase.
+
+    Parameters
+    ----------
+    nombre_archivo : str
+        Ruta del archivo de puntos.
+    motor : str, optional
+        Motor de `encontrar_par_mas_cercano`. Por defecto "div_conq".
+
+    Returns
+    -------
+    dict
+        Registro con las claves de `CAMPOS`. Si algo falla, "error" contiene
+        el mensaje y los campos del resultado quedan vacíos; la función no
+        propaga la excepción.
+    """
+    registro = dict.fromkeys(CAMPOS)
+    registro["archivo"] = nombre_archivo
+    registro["motor"] = motor
+    inicio = time.perf_counter()
+    try:
+        puntos = leer_puntos(nombre_archivo)
+        leido = time.perf_counter()
+        punto_a, punto_b, distancia = encontrar_par_mas_cercano(puntos, motor)
+        resuelto = time.perf_counter()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        registro["error"] = f"{type(e).__name__}: {e}"
+        registro["total_s"] = time.perf_counter() - inicio
+        return registro
+
+    registro["n"] = len(puntos)
+    if punto_a is not None:
+        registro["p_x"], registro["p_y"] = punto_a
+        registro["q_x"], registro["q_y"] = punto_b
+        registro["distancia"] = distancia
+    registro["lectura_s"] = leido - inicio
+    registro["resolucion_s"] = resuelto - leido
+    registro["total_s"] = resuelto - inicio
+    return registro
+
+
+def _registro_error(nombre_archivo, motor, error):
+    """Registro de un archivo que no llegó a devolver el suyo."""
+    registro = dict.fromkeys(CAMPOS)
+    registro.update(archivo=nombre_archivo, motor=motor, error=f"{type(error).__name__}: {error}")
+    return registro
+
+
+def _procesar_aislado(nombre_archivo, motor):
+    """
+    Procesa un archivo en un proceso propio.
+
+    Si el proceso muere (por ejemplo, por falta de memoria), solo este
+    archivo queda registrado con error.
+    """
+    with ProcessPoolExecutor(max_workers=1) as ejecutor:
+        try:
+            return ejecutor.submit(procesar_archivo, nombre_archivo, motor).result()
+        except BrokenProcessPool as e:
+            return _registro_error(nombre_archivo, motor, e)
+
+
+def procesar_lote(archivos, salida, formato="jsonl", motor="div_conq", procesos=None):
+    """
+    Procesa varios archivos en paralelo y escribe un registro por archivo.
+
+    Los registros se escriben a medida que terminan los archivos, así que
+    el orden de la salida puede diferir del de `archivos`.
+
+    Si un proceso muere, el grupo de procesos queda inservible y todos sus
+    archivos sin terminar fallan con él. Esos archivos se vuelven a
+    procesar, cada uno en un proceso propio, para que solo quede con error
+    el que provocó la caída.
+
+    Parameters
+    ----------
+    archivos : list of str
+        Rutas de los archivos de puntos.
+    salida : file
+        Archivo de texto abierto donde escribir los registros.
+    formato : {"jsonl", "csv"}, optional
+        Una línea JSON por archivo o una fila CSV con cabecera.
+    motor : str, optional
+        Motor de `encontrar_par_mas_cercano`. Por defecto "div_conq".
+    procesos : int, optional
+        Número de procesos. Por defecto, el número de núcleos disponibles.
+
+    Returns
+    -------
+    int
+        Número de archivos que terminaron con error.
+    """
+    if formato == "csv":
+        escritor = csv.DictWriter(salida, fieldnames=CAMPOS)
+        escritor.writeheader()
+        escribir = escritor.writerow
+    else:
+        def escribir(registro):
+            salida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+    errores = 0
+
+    def emitir(registro):
+        nonlocal errores
+        if registro["error"] is not None:
+            errores += 1
+        escribir(registro)
+        salida.flush()
+
+    interrumpidos = []
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = {ejecutor.submit(procesar_archivo, nombre, motor): nombre
+                   for nombre in archivos}
+        for futuro in as_completed(futuros):
+            try:
+                registro = futuro.result()
+            except BrokenProcessPool:
+                # Un proceso murió: no se sabe aún qué archivo lo provocó
+                interrumpidos.append(futuros[futuro])
+                continue
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                registro = _registro_error(futuros[futuro], motor, e)
+            emitir(registro)
+
+    if interrumpidos:
+        with ThreadPoolExecutor(max_workers=procesos or os.cpu_count()) as hilos:
+            for registro in hilos.map(_procesar_aislado, interrumpidos,
+                                      [motor] * len(interrumpidos)):
+                emitir(registro)
+    return errores
+
+
+def main():
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Resuelve el par más cercano de muchos archivos en paralelo.")
+    parser.add_argument("ruta", help="Directorio con archivos .txt o manifiesto de rutas.")
+    parser.add_argument("--salida", default="-",
+                        help="Archivo de resultados; '-' para la salida estándar.")
+    parser.add_argument("--formato", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--motor", choices=list(MOTORES), default="div_conq")
+    parser.add_argument("--procesos", type=int, default=None)
+    argumentos = parser.parse_args()
+
+    archivos = listar_archivos(argumentos.ruta)
+    if argumentos.salida == "-":
+        errores = procesar_lote(archivos, sys.stdout, argumentos.formato,
+                                argumentos.motor, argumentos.procesos)
+    else:
+        with open(argumentos.salida, "w", encoding="utf-8", newline="") as salida:
+            errores = procesar_lote(archivos, salida, argumentos.formato,
+                                    argumentos.motor, argumentos.procesos)
+    print(f"Archivos procesados: {len(archivos)}, con error: {errores}", file=sys.stderr)
+    sys.exit(1 if errores else 0)
+
+
+if __name__ == "__main__":
+    main()
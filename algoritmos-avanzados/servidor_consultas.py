@@ -0,0 +1,366 @@
+"""
+Módulo con un servidor residente de consultas sobre conjuntos de puntos.
+
+Cada ejecución de `main.py` paga el arranque del intérprete, la lectura del
+archivo y la ordenación antes de responder. Este servidor de asyncio carga
+cada archivo una sola vez, construye su `IndiceKD`, resuelve su par más
+cercano y lo mantiene en memoria; después responde consultas de par más
+cercano, vecino más cercano, k vecinos y radio en milisegundos.
+
+El protocolo es JSON por líneas sobre TCP: cada línea es una consulta (un
+objeto) o un lote de consultas (una lista de objetos), y el servidor
+responde con una línea con la respuesta o la lista de respuestas, en el
+mismo orden. Varios clientes se atienden a la vez y cada cliente puede
+enviar varias líneas sin esperar las respuestas.
+
+Los clientes solo pueden consultar los archivos precargados al arrancar y,
+si se indica una raíz, los que están bajo ella. En memoria se mantienen a
+lo sumo `max_conjuntos` conjuntos; al cargar uno más se descarta el usado
+hace más tiempo.
+
+Contenido
+---------
+- Clases
+    - ConjuntoResidente: Puntos de un archivo cargados e indexados en memoria.
+    - ServidorConsultas: Servidor asyncio que responde consultas en JSON.
+- Funciones
+    - consultar: Cliente sencillo que envía una consulta o un lote.
+
+Examples
+--------
+Desde la línea de comandos::
+
+    python servidor_consultas.py datos_1000.txt datos_10000.txt --puerto 8765
+    python servidor_consultas.py --raiz datos/ --max-conjuntos 4
+
+Y desde otro proceso::
+
+    consultar({"consulta": "vecino", "archivo": "datos_1000.txt", "punto": [0, 0]})
+    consultar([{"consulta": "par_mas_cercano", "archivo": "datos_10000.txt"},
+               {"consulta": "radio", "archivo": "datos_10000.txt",
+                "punto": [0, 0], "radio": 50}])
+"""
+import argparse
+import asyncio
+import collections
+import json
+import math
+import os
+import socket
+
+from indice_kd import IndiceKD
+from main import MOTORES, encontrar_par_mas_cercano, leer_puntos
+
+CONSULTAS = ("par_mas_cercano", "vecino", "k_vecinos", "radio", "cargar")
+
+# Los lotes grandes ocupan una sola línea: se admite hasta 16 MiB por línea
+LIMITE_LINEA = 1 << 24
+
+
+def _distancia_json(distancia):
+    """JSON no admite infinito: una distancia infinita se envía como null."""
+    return None if math.isinf(distancia) else distancia
+
+
+class ConjuntoResidente:
+    """
+    Puntos de un archivo, indexados y con su par más cercano ya resuelto.
+
+    Attributes
+    ----------
+    nombre_archivo : str
+        Ruta del archivo de puntos.
+    indice : IndiceKD
+        Índice sobre los puntos del archivo.
+    par : tuple
+        Resultado (punto1, punto2, min_dist) de `encontrar_par_mas_cercano`.
+    """
+
+    def __init__(self, nombre_archivo, motor="div_conq"):
+        """
+        Lee el archivo, construye el índice y resuelve el par más cercano.
+
+        Parameters
+        ----------
+        nombre_archivo : str
+            Ruta del archivo de puntos.
+        motor : str, optional
+            Motor de `encontrar_par_mas_cercano`. Por defecto "div_conq".
+        """
+        puntos = leer_puntos(nombre_archivo)
+        self.nombre_archivo = nombre_archivo
+        self.indice = IndiceKD(puntos)
+        self.par = encontrar_par_mas_cercano(puntos, motor)
+
+    def responder(self, consulta):
+        """
+        Responde una consulta sobre este conjunto.
+
+        Parameters
+        ----------
+        consulta : dict
+            Objeto con la clave "consulta" (uno de `CONSULTAS`) y, según el
+            tipo, "punto", "k" o "radio".
+
+        Returns
+        -------
+        dict
+            El resultado, listo para serializar en JSON.
+
+        Raises
+        ------
+        ValueError
+            Si el tipo de consulta no existe o faltan sus argumentos.
+        """
+        tipo = consulta.get("consulta")
+        if tipo in ("par_mas_cercano", "cargar"):
+            p, q, distancia = self.par
+            return {"p": p, "q": q, "distancia": _distancia_json(distancia),
+                    "n": len(self.indice)}
+        if tipo not in CONSULTAS:
+            raise ValueError(f"Consulta desconocida: {tipo!r}. Opciones: {', '.join(CONSULTAS)}")
+
+        if "punto" not in consulta:
+            raise ValueError(f"La consulta {tipo!r} requiere un 'punto'.")
+        punto = tuple(consulta["punto"])
+        if tipo == "vecino":
+            vecino, distancia = self.indice.vecino_mas_cercano(punto)
+            return {"vecino": vecino, "distancia": _distancia_json(distancia)}
+        if tipo == "k_vecinos":
+            vecinos = self.indice.k_vecinos(punto, int(consulta.get("k", 1)))
+            return {"vecinos": [{"vecino": vecino, "distancia": distancia}
+                                for vecino, distancia in vecinos]}
+        if "radio" not in consulta:
+            raise ValueError("La consulta 'radio' requiere un 'radio'.")
+        return {"puntos": self.indice.en_radio(punto, consulta["radio"])}
+
+
+class ServidorConsultas:
+    """
+    Servidor asyncio que mantiene conjuntos residentes y responde consultas.
+
+    Los archivos se cargan una sola vez, en un hilo aparte para no detener
+    a los demás clientes; si varias consultas piden a la vez un archivo
+    que aún no está cargado, todas esperan la misma carga. Las consultas
+    también se resuelven en hilos del ejecutor por defecto, así que el
+    bucle de eventos sigue atendiendo a otros clientes y las consultas de
+    un lote se reparten entre varios hilos.
+
+    Attributes
+    ----------
+    motor : str
+        Motor de `encontrar_par_mas_cercano` usado al cargar.
+    raiz : str or None
+        Directorio cuyos archivos pueden consultarse, además de los
+        precargados con `servir`; None si solo se admiten estos.
+    max_conjuntos : int
+        Número máximo de conjuntos residentes.
+    """
+
+    def __init__(self, motor="div_conq", raiz=None, max_conjuntos=8):
+        """
+        Configura el servidor; los archivos se cargan al consultarlos.
+
+        Parameters
+        ----------
+        motor : str, optional
+            Motor de `encontrar_par_mas_cercano`. Por defecto "div_conq".
+        raiz : str, optional
+            Directorio cuyos archivos pueden consultarse. Por defecto solo
+            se admiten los archivos precargados.
+        max_conjuntos : int, optional
+            Conjuntos que se mantienen en memoria a la vez. Por defecto 8.
+
+        Raises
+        ------
+        ValueError
+            Si `max_conjuntos` es menor que 1.
+        """
+        if max_conjuntos < 1:
+            raise ValueError("max_conjuntos debe ser al menos 1.")
+        self.motor = motor
+        self.raiz = None if raiz is None else os.path.realpath(raiz)
+        self.max_conjuntos = max_conjuntos
+        self._permitidos = set()
+        # Ruta real -> carga (futuro), de la usada hace más tiempo a la más reciente
+        self._cargas = collections.OrderedDict()
+
+    def _permitido(self, clave):
+        """Indica si un cliente puede consultar la ruta real `clave`."""
+        if clave in self._permitidos:
+            return True
+        return self.raiz is not None and os.path.commonpath([self.raiz, clave]) == self.raiz
+
+    async def conjunto(self, nombre_archivo):
+        """
+        Devuelve el conjunto residente de `nombre_archivo`, cargándolo si hace falta.
+
+        Parameters
+        ----------
+        nombre_archivo : str
+            Ruta del archivo de puntos.
+
+        Returns
+        -------
+        ConjuntoResidente
+            El conjunto ya cargado.
+
+        Raises
+        ------
+        ValueError
+            Si el archivo no está entre los precargados ni bajo `raiz`.
+        """
+        clave = os.path.realpath(nombre_archivo)
+        if not self._permitido(clave):
+            raise ValueError(f"Archivo no permitido: {nombre_archivo!r}.")
+        carga = self._cargas.get(clave)
+        if carga is None:
+            bucle = asyncio.get_running_loop()
+            carga = bucle.run_in_executor(None, ConjuntoResidente, clave, self.motor)
+            self._cargas[clave] = carga
+            while len(self._cargas) > self.max_conjuntos:
+                # Quien ya espera una carga descartada la recibe igual
+                self._cargas.popitem(last=False)
+        else:
+            self._cargas.move_to_end(clave)
+        try:
+            return await carga
+        except Exception:
+            # Una carga fallida no queda en memoria: se reintenta en la siguiente consulta
+            if self._cargas.get(clave) is carga:
+                del self._cargas[clave]
+            raise
+
+    async def responder(self, consulta):
+        """Responde una consulta; los errores se devuelven en la respuesta."""
+        try:
+            if not isinstance(consulta, dict) or "archivo" not in consulta:
+                raise ValueError("Cada consulta debe ser un objeto con un 'archivo'.")
+            conjunto = await self.conjunto(consulta["archivo"])
+            bucle = asyncio.get_running_loop()
+            resultado = await bucle.run_in_executor(None, conjunto.responder, consulta)
+            respuesta = {"ok": True, "resultado": resultado}
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            respuesta = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        if isinstance(consulta, dict) and "id" in consulta:
+            respuesta["id"] = consulta["id"]
+        return respuesta
+
+    @staticmethod
+    async def _leer_linea(lector):
+        """
+        Lee una línea como `readline`; None si supera `LIMITE_LINEA`.
+
+        Una línea demasiado larga se descarta entera, hasta su salto de
+        línea, para que la siguiente se lea desde su inicio.
+        """
+        try:
+            return await lector.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumidos = e.consumed
+        while True:
+            try:
+                await lector.readexactly(consumidos)
+                await lector.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                consumidos = e.consumed
+
+    async def _responder_linea(self, linea):
+        """Responde una línea recibida: una consulta, un lote o un error."""
+        if linea is None:
+            return {"ok": False, "error": f"Línea de más de {LIMITE_LINEA} bytes."}
+        try:
+            mensaje = json.loads(linea)
+        except json.JSONDecodeError as e:
+            return {"ok": False, "error": f"JSON inválido: {e}"}
+        if isinstance(mensaje, list):
+            return await asyncio.gather(*map(self.responder, mensaje))
+        return await self.responder(mensaje)
+
+    async def _atender(self, lector, escritor):
+        """Atiende a un cliente: una respuesta por cada línea recibida."""
+        try:
+            while (linea := await self._leer_linea(lector)) != b"":
+                respuesta = await self._responder_linea(linea)
+                escritor.write(json.dumps(respuesta).encode() + b"\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def servir(self, host="127.0.0.1", puerto=8765, archivos=()):
+        """
+        Precarga `archivos` y atiende clientes hasta que se cancele la tarea.
+
+        Parameters
+        ----------
+        host : str, optional
+            Dirección en la que escuchar. Por defecto solo la máquina local.
+        puerto : int, optional
+            Puerto TCP. Por defecto 8765; con 0 se elige uno libre.
+        archivos : iterable of str, optional
+            Archivos a cargar antes de aceptar clientes; los clientes
+            pueden consultarlos aunque no estén bajo `raiz`.
+        """
+        archivos = list(archivos)
+        self._permitidos.update(os.path.realpath(archivo) for archivo in archivos)
+        await asyncio.gather(*map(self.conjunto, archivos))
+        servidor = await asyncio.start_server(self._atender, host, puerto, limit=LIMITE_LINEA)
+        direccion = servidor.sockets[0].getsockname()
+        print(f"Escuchando en {direccion[0]}:{direccion[1]}", flush=True)
+        async with servidor:
+            await servidor.serve_forever()
+
+
+def consultar(consultas, host="127.0.0.1", puerto=8765):
+    """
+    Envía una consulta o un lote al servidor y devuelve la respuesta.
+
+    Parameters
+    ----------
+    consultas : dict or list of dict
+        Una consulta, o una lista de consultas que se responden como lote.
+    host : str, optional
+        Dirección del servidor. Por defecto la máquina local.
+    puerto : int, optional
+        Puerto del servidor. Por defecto 8765.
+
+    Returns
+    -------
+    dict or list of dict
+        La respuesta, o la lista de respuestas en el mismo orden.
+    """
+    with socket.create_connection((host, puerto)) as conexion:
+        conexion.sendall(json.dumps(consultas).encode() + b"\n")
+        with conexion.makefile("rb") as lector:
+            return json.loads(lector.readline())
+
+
+def main():
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Servidor residente de consultas de par más cercano.")
+    parser.add_argument("archivos", nargs="*", help="Archivos a precargar.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--motor", choices=list(MOTORES), default="div_conq")
+    parser.add_argument("--raiz", help="Directorio cuyos archivos pueden consultarse.")
+    parser.add_argument("--max-conjuntos", type=int, default=8,
+                        help="Conjuntos que se mantienen en memoria a la vez.")
+    argumentos = parser.parse_args()
+
+    servidor = ServidorConsultas(argumentos.motor, argumentos.raiz, argumentos.max_conjuntos)
+    try:
+        asyncio.run(servidor.servir(argumentos.host, argumentos.puerto, argumentos.archivos))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,30 @@
 """
-Módulo para calcular el par de puntos más cercano usando la estrategia 
-divide y conquista.
+Módulo para calcular el par de puntos más cercano por fuerza bruta.
 
-Este módulo incluye funciones para leer coordenadas desde un archivo de texto
-plano y calcular eficientemente la distancia mínima entre pares de puntos.
+Además de la versión directa con dos ciclos, incluye una versión vectorizada
+que recorre todos los pares por bloques con memoria acotada. Sirve como
+referencia exacta para verificar los motores rápidos de `main` con cientos
+de miles de puntos.
+
+Contenido
+---------
+- Funciones
+    - distancia: Calcula la distancia euclidiana entre dos puntos.
+    - fuerza_bruta: Encuentra el par más cercano comparando todos los pares.
+    - fuerza_bruta_bloques: Versión vectorizada y por bloques sobre columnas x e y.
+    - fuerza_bruta_vectorizada: Igual que `fuerza_bruta_bloques`, sobre una lista de puntos.
+    - leer_tuplas: Lee un archivo de puntos como una lista de tuplas.
 """
 
 import math
 import time
 
+try:
+    import numpy as np
+except ImportError:  # NumPy solo es necesario para la versión por bloques
+    np = None
+
+
 def distancia(p, q):
     d = math.sqrt((q[0] - p[0]) ** 2 + (q[1] - p[1]) ** 2)
     return d
@@ -25,6 +41,150 @@ def fuerza_bruta(lista_pares):
                 pares_cercanos = [lista_pares[i], lista_pares[j]]
     return pares_cercanos, dis_minima
 
+
+def _mejor_empate(d2, posiciones, orden, inicio_fila, inicio_columna):
+    """Entre las posiciones de un bloque con distancia `d2`, el par (i, j) menor."""
+    filas, columnas = posiciones
+    i = orden[inicio_fila + filas]
+    j = orden[inicio_columna + columnas]
+    bajo = np.minimum(i, j)
+    alto = np.maximum(i, j)
+    elegido = np.lexsort((alto, bajo))[0]
+    return d2, int(bajo[elegido]), int(alto[elegido])
+
+
+def fuerza_bruta_bloques(x, y, tam_bloque=256, podar=True):
+    """
+    Encuentra el par más cercano comparando todos los pares por bloques.
+
+    Los puntos se ordenan por x y se recorren bloques de `tam_bloque` filas
+    por `tam_bloque` columnas: cada bloque calcula sus distancias al
+    cuadrado en una sola operación de NumPy, sobre búferes reutilizados, y
+    se reduce a su mínimo. La memoria es O(n + tam_bloque^2), sin importar n.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Coordenadas de los puntos.
+    tam_bloque : int, optional
+        Lado de los bloques de distancias. Por defecto 256 (512 KiB por búfer,
+        que caben en la caché del procesador).
+    podar : bool, optional
+        Si es verdadero, se omiten los bloques cuya separación en x ya es
+        mayor que la mejor distancia encontrada. La poda es exacta: solo
+        descarta pares que no pueden igualar ni mejorar el mínimo. Con False
+        se evalúan literalmente los n(n-1)/2 pares. Por defecto True.
+
+    Returns
+    -------
+    tuple
+        Una tupla (i, j, min_dist) con i < j índices de las entradas.
+        Retorna (None, None, float('inf')) si hay menos de dos puntos.
+
+    Notes
+    -----
+    Con coordenadas enteras menores que 2^30 en valor absoluto las
+    distancias al cuadrado se calculan en int64 y son exactas; en otro caso
+    se usa float64. Ante empates se devuelve el par (i, j) lexicográficamente
+    menor, que es también el que encuentra `fuerza_bruta`, de modo que el
+    resultado no depende de `tam_bloque` ni de la poda.
+
+    Examples
+    --------
+    >>> fuerza_bruta_bloques([0, 5, 1, 6], [0, 5, 0, 5], tam_bloque=2)
+    (0, 2, 1.0)
+    """
+    if np is None:
+        raise ImportError("fuerza_bruta_bloques requiere NumPy.")
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = x.size
+    if n < 2:
+        return None, None, float('inf')
+    if x.dtype.kind in "iub" and y.dtype.kind in "iub" and \
+            max(int(np.abs(x).max()), int(np.abs(y).max())) < 2**30:
+        tipo = np.int64
+        infinito = np.iinfo(np.int64).max
+    else:
+        tipo = np.float64
+        infinito = np.inf
+
+    orden = np.argsort(x, kind="stable")
+    xs = x[orden].astype(tipo)
+    ys = y[orden].astype(tipo)
+    dx = np.empty((tam_bloque, tam_bloque), dtype=tipo)
+    dy = np.empty_like(dx)
+    # Parte inferior (con la diagonal) de un bloque consigo mismo: pares repetidos
+    triangulo = np.tri(tam_bloque, dtype=bool)
+
+    mejor = (infinito, n, n)
+    for fila in range(0, n, tam_bloque):
+        fin_fila = min(fila + tam_bloque, n)
+        for columna in range(fila, n, tam_bloque):
+            fin_columna = min(columna + tam_bloque, n)
+            separacion = xs[columna] - xs[fin_fila - 1]
+            if podar and separacion > 0 and separacion * separacion > mejor[0]:
+                # xs está ordenado: los bloques siguientes están aún más lejos
+                break
+            filas = fin_fila - fila
+            columnas = fin_columna - columna
+            bloque = dx[:filas, :columnas]
+            auxiliar = dy[:filas, :columnas]
+            np.subtract(xs[fila:fin_fila, None], xs[None, columna:fin_columna], out=bloque)
+            np.multiply(bloque, bloque, out=bloque)
+            np.subtract(ys[fila:fin_fila, None], ys[None, columna:fin_columna], out=auxiliar)
+            np.multiply(auxiliar, auxiliar, out=auxiliar)
+            np.add(bloque, auxiliar, out=bloque)
+            if columna == fila:
+                bloque[triangulo[:filas, :columnas]] = infinito
+
+            d2 = bloque.min()
+            if d2 > mejor[0] or d2 == infinito:
+                continue
+            candidato = _mejor_empate(d2, np.nonzero(bloque == d2), orden, fila, columna)
+            mejor = min(mejor, candidato)
+
+    d2, i, j = mejor
+    return i, j, math.sqrt(d2)
+
+
+def fuerza_bruta_vectorizada(puntos, tam_bloque=256, podar=True):
+    """
+    Encuentra el par más cercano de una lista de puntos por fuerza bruta.
+
+    Aplica `fuerza_bruta_bloques` a las coordenadas de `puntos`; devuelve
+    el mismo formato que los motores de `main`, para compararlos con él.
+
+    Parameters
+    ----------
+    puntos : list of tuple of int
+        Lista de puntos, donde cada punto es una tupla (x, y).
+    tam_bloque : int, optional
+        Lado de los bloques de distancias. Por defecto 256.
+    podar : bool, optional
+        Ver `fuerza_bruta_bloques`. Por defecto True.
+
+    Returns
+    -------
+    tuple
+        Una tupla (punto1, punto2, min_dist), con punto1 anterior a punto2
+        en `puntos`. Retorna (None, None, float('inf')) si hay menos de dos
+        puntos.
+
+    Examples
+    --------
+    >>> fuerza_bruta_vectorizada([(0, 0), (5, 5), (1, 0), (6, 5)])
+    ((0, 0), (1, 0), 1.0)
+    """
+    if np is None:
+        raise ImportError("fuerza_bruta_vectorizada requiere NumPy.")
+    if len(puntos) < 2:
+        return None, None, float('inf')
+    coordenadas = np.asarray(puntos)
+    i, j, dist = fuerza_bruta_bloques(coordenadas[:, 0], coordenadas[:, 1], tam_bloque, podar)
+    return puntos[i], puntos[j], dist
+
+
 def leer_tuplas(nombre_archivo):
     """
     Lee dos líneas de un archivo de texto y devuelve una lista de tuplas.
@@ -61,11 +221,12 @@ def leer_tuplas(nombre_archivo):
     return list(zip(x, y))
 
 
-lista = leer_tuplas("datos_100.txt")
-inicio1 = time.time()
-pares, dist = fuerza_bruta(lista)
-fin1 = time.time()
+if __name__ == "__main__":
+    lista = leer_tuplas("datos_100.txt")
+    inicio1 = time.time()
+    pares, dist = fuerza_bruta(lista)
+    fin1 = time.time()
 
-print("Los pares más cercanos son {} y {}.".format(pares[0], pares[1]))
-print("La distancia entre ellos es {:.3f}".format(dist))
-print("El tiempo de ejecución fue de {:.3f} s.".format(fin1 - inicio1))
+    print("Los pares más cercanos son {} y {}.".format(pares[0], pares[1]))
+    print("La distancia entre ellos es {:.3f}".format(dist))
+    print("El tiempo de ejecución fue de {:.3f} s.".format(fin1 - inicio1))
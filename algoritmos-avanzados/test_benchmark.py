@@ -0,0 +1,45 @@
+"""
+Pruebas de `benchmark.ejecutar_benchmark` con conjuntos pequeños.
+
+Contenido
+---------
+- Funciones
+    - test_motores_coinciden_en_cada_distribucion: Todos los motores dan la
+      distancia de la fuerza bruta.
+    - test_tamano_sin_motores: Un tamaño en el que se omiten todos los motores.
+"""
+import pytest
+
+from benchmark import DISTRIBUCIONES, ejecutar_benchmark, generar_puntos
+from main import par_mas_cercano_fuerza_bruta
+
+MOTORES_PRUEBA = ["fuerza_bruta", "div_conq", "numpy"]
+
+
+def test_motores_coinciden_en_cada_distribucion(tmp_path):
+    tamanos = [2, 60]
+
+    registros = ejecutar_benchmark(tamanos, list(DISTRIBUCIONES), MOTORES_PRUEBA,
+                                   repeticiones=1, calentamiento=0,
+                                   directorio_datos=str(tmp_path))
+
+    assert len(registros) == len(DISTRIBUCIONES) * len(tamanos) * len(MOTORES_PRUEBA)
+    for registro in registros:
+        puntos = list(zip(*generar_puntos(registro["distribucion"], registro["n"])))
+        assert registro["coincide"]
+        assert registro["distancia"] == pytest.approx(par_mas_cercano_fuerza_bruta(puntos)[2])
+        assert registro["mediana_s"] >= 0 and registro["memoria_pico_bytes"] >= 0
+
+
+def test_tamano_sin_motores(tmp_path):
+    argumentos = dict(repeticiones=1, calentamiento=0, limite_fuerza_bruta=5,
+                      directorio_datos=str(tmp_path))
+
+    assert ejecutar_benchmark([10], ["uniforme"], ["fuerza_bruta"], **argumentos) == []
+
+    registros = ejecutar_benchmark([4, 10], ["uniforme"], ["fuerza_bruta", "div_conq"],
+                                   **argumentos)
+
+    assert [(r["n"], r["motor"]) for r in registros] == [
+        (4, "fuerza_bruta"), (4, "div_conq"), (10, "div_conq")]
+    assert all(registro["coincide"] for registro in registros)
@@ -0,0 +1,85 @@
+"""
+Pruebas de la caché persistente de `cache_resultados`.
+
+Contenido
+---------
+- Funciones
+    - test_resolver_usa_la_cache: Un archivo ya resuelto se responde sin resolverlo.
+    - test_desalojo_por_margen: El directorio solo se recorre al superar el margen.
+    - test_desalojo_borra_temporales_abandonados: Se borran los temporales viejos.
+"""
+import os
+import shutil
+import time
+
+import cache_resultados
+from cache_resultados import CacheResultados
+from main import encontrar_par_mas_cercano, leer_puntos
+
+
+def test_resolver_usa_la_cache(tmp_path, monkeypatch):
+    archivo = tmp_path / "puntos.txt"
+    archivo.write_text("1,20,300,5,9\n4,50,600,7,2\n")
+    cache = CacheResultados(str(tmp_path / "cache"))
+    esperado = encontrar_par_mas_cercano(leer_puntos(str(archivo)), "numpy")
+
+    assert cache.resolver(str(archivo), "numpy") == esperado
+
+    def no_resolver(*args, **kwargs):
+        raise AssertionError("se resolvió un archivo que estaba en la caché")
+
+    monkeypatch.setattr(cache_resultados, "encontrar_par_mas_cercano", no_resolver)
+    copia = tmp_path / "copia.txt"
+    shutil.copy(archivo, copia)
+    assert cache.resolver(str(archivo), "numpy") == esperado
+    assert cache.resolver(str(copia), "numpy") == esperado
+
+    # Otro contenido, otro motor u otras opciones son otra clave
+    claves = {cache.clave(str(archivo), "numpy"), cache.clave(str(archivo), "div_conq"),
+              cache.clave(str(archivo), "rejilla", semilla=1),
+              cache.clave(str(archivo), "rejilla", semilla=2)}
+    archivo.write_text("1,20,300,5,9\n4,50,600,7,3\n")
+    claves.add(cache.clave(str(archivo), "numpy"))
+    assert len(claves) == 5
+
+
+def _entradas(directorio):
+    return sorted(nombre for nombre in os.listdir(directorio) if nombre.endswith(".json"))
+
+
+def test_desalojo_por_margen(tmp_path):
+    cache = CacheResultados(str(tmp_path), max_entradas=100)
+    recorridos = []
+    desalojar = cache._desalojar
+
+    def contar_recorridos():
+        recorridos.append(len(_entradas(tmp_path)))
+        desalojar()
+
+    cache._desalojar = contar_recorridos
+    for i in range(300):
+        cache.guardar(f"{i:03d}", ((i, 0), (i, 1), 1.0))
+        assert len(_entradas(tmp_path)) <= 110
+
+    # Un recorrido inicial y luego uno cada vez que se supera el margen
+    assert len(recorridos) <= 300 // 10
+    assert all(n in (1, 111) for n in recorridos)
+    assert len(_entradas(tmp_path)) >= 100
+    assert cache.obtener("299") == ((299, 0), (299, 1), 1.0)
+    assert cache.obtener("000") is None
+
+
+def test_desalojo_borra_temporales_abandonados(tmp_path):
+    viejo = tmp_path / "viejo.tmp"
+    viejo.write_text("[")
+    antes = time.time() - 3600
+    os.utime(viejo, (antes, antes))
+    reciente = tmp_path / "reciente.tmp"
+    reciente.write_text("[")
+    cache = CacheResultados(str(tmp_path), max_entradas=5)
+
+    cache.guardar("a", ((0, 0), (0, 1), 1.0))
+
+    assert not viejo.exists()
+    assert reciente.exists()
+    assert _entradas(tmp_path) == ["a.json"]
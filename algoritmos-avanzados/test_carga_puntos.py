@@ -0,0 +1,140 @@
+"""
+Pruebas de los lectores de archivos de puntos de `carga_puntos`.
+
+Contenido
+---------
+- Funciones
+    - test_leer_columnas_coincide_con_leer_puntos: Mismos puntos, con y sin caché.
+    - test_leer_columnas_flotantes: Una coordenada no entera da columnas float64.
+    - test_leer_columnas_rechaza_lineas_invalidas: Errores de formato.
+    - test_leer_columnas_sin_avisos: Espacios y saltos de Windows, sin avisos de NumPy.
+    - test_binario_truncado_se_regenera: Un binario a medias no se mapea.
+    - test_fallo_al_guardar_no_deja_temporales: Un error de escritura no deja
+      archivos sueltos.
+    - test_leer_bloques_con_trozos_pequenos: Los números cortados entre trozos
+      se reconstruyen.
+    - test_leer_bloques_ultima_linea_irregular: Líneas de distinta longitud.
+    - test_leer_puntos_nd: Archivos de d líneas.
+"""
+import os
+import random
+import warnings
+
+import numpy as np
+import pytest
+
+from carga_puntos import leer_bloques, leer_columnas, leer_puntos_nd, ruta_cache
+from main import leer_puntos
+
+
+def _escribir(ruta, texto):
+    ruta.write_text(texto)
+    return str(ruta)
+
+
+def test_leer_columnas_coincide_con_leer_puntos(tmp_path):
+    archivo = _escribir(tmp_path / "puntos.txt", "1,20,300,5,-7\n4,50,600,7,-8\n")
+    esperados = leer_puntos(archivo)
+
+    for _ in range(2):
+        x, y = leer_columnas(archivo)
+
+        assert x.dtype == np.int64 and y.dtype == np.int64
+        assert list(zip(x.tolist(), y.tolist())) == esperados
+        assert os.path.exists(ruta_cache(archivo))
+
+    x, y = leer_columnas(archivo, usar_cache=False)
+    assert list(zip(x.tolist(), y.tolist())) == esperados
+
+
+def test_leer_columnas_flotantes(tmp_path):
+    archivo = _escribir(tmp_path / "puntos.txt", "1,2.5,3\n4,5,6e2\n")
+
+    x, y = leer_columnas(archivo)
+
+    assert x.dtype == np.float64 and y.dtype == np.float64
+    assert x.tolist() == [1.0, 2.5, 3.0]
+    assert y.tolist() == [4.0, 5.0, 600.0]
+
+
+@pytest.mark.parametrize("texto", ["1,2,3\n4,5\n", "1,a,3\n4,5,6\n"])
+def test_leer_columnas_rechaza_lineas_invalidas(tmp_path, texto):
+    archivo = _escribir(tmp_path / "puntos.txt", texto)
+
+    with pytest.raises(ValueError):
+        leer_columnas(archivo)
+
+
+def test_leer_columnas_sin_avisos(tmp_path):
+    archivo = _escribir(tmp_path / "puntos.txt", " 1, -2 ,3\r\n4,5, 6\r\n")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        x, y = leer_columnas(archivo, usar_cache=False)
+
+    assert x.dtype == np.int64
+    assert x.tolist() == [1, -2, 3] and y.tolist() == [4, 5, 6]
+
+
+def test_binario_truncado_se_regenera(tmp_path):
+    archivo = tmp_path / "puntos.txt"
+    archivo.write_text("1,20,300,5\n4,50,600,7\n")
+    leer_columnas(str(archivo))
+    binario = ruta_cache(str(archivo))
+    completo = os.path.getsize(binario)
+    with open(binario, "r+b") as salida:
+        salida.truncate(completo - 8)
+
+    x, y = leer_columnas(str(archivo))
+
+    assert x.tolist() == [1, 20, 300, 5]
+    assert y.tolist() == [4, 50, 600, 7]
+    assert os.path.getsize(binario) == completo
+
+
+def test_fallo_al_guardar_no_deja_temporales(tmp_path, monkeypatch):
+    archivo = _escribir(tmp_path / "puntos.txt", "1,20,300\n4,50,600\n")
+
+    def sin_espacio(origen, destino):
+        raise OSError(28, "No queda espacio en el dispositivo")
+
+    monkeypatch.setattr(os, "replace", sin_espacio)
+    x, y = leer_columnas(archivo)
+
+    assert x.tolist() == [1, 20, 300]
+    assert y.tolist() == [4, 50, 600]
+    assert os.listdir(tmp_path) == ["puntos.txt"]
+
+
+@pytest.mark.parametrize("salto_final", ["", "\n"])
+def test_leer_bloques_con_trozos_pequenos(tmp_path, salto_final):
+    azar = random.Random(9)
+    xs = [azar.randint(-10**9, 10**9) for _ in range(500)]
+    ys = [azar.randint(-10**9, 10**9) for _ in range(500)]
+    archivo = _escribir(tmp_path / "puntos.txt", ",".join(map(str, xs)) + "\n"
+                        + ",".join(map(str, ys)) + salto_final)
+
+    bloques = list(leer_bloques(archivo, tam_bloque=64, tam_lectura=7))
+
+    assert all(len(bloque) == 64 for bloque in bloques[:-1])
+    assert [punto for bloque in bloques for punto in bloque] == list(zip(xs, ys))
+
+
+@pytest.mark.parametrize("texto", ["1,2,3,4,5\n6,7,8,9\n", "1,2,3,4\n6,7,8,9,10",
+                                   "1,2,3,4,5\n"])
+def test_leer_bloques_ultima_linea_irregular(tmp_path, texto):
+    archivo = _escribir(tmp_path / "puntos.txt", texto)
+
+    with pytest.raises(ValueError):
+        list(leer_bloques(archivo, tam_bloque=2, tam_lectura=3))
+
+
+def test_leer_puntos_nd(tmp_path):
+    archivo = _escribir(tmp_path / "puntos.txt", "1,4\n2,5\n3,6\n\n")
+
+    assert leer_puntos_nd(archivo) == [(1, 2, 3), (4, 5, 6)]
+    assert leer_puntos_nd(archivo, dimension=3) == [(1, 2, 3), (4, 5, 6)]
+    with pytest.raises(ValueError):
+        leer_puntos_nd(archivo, dimension=2)
+    with pytest.raises(ValueError):
+        leer_puntos_nd(_escribir(tmp_path / "irregular.txt", "1,4\n2\n3,6\n"))
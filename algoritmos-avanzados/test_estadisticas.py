@@ -0,0 +1,55 @@
+"""
+Pruebas del divide y conquista medido de `estadisticas`.
+
+Contenido
+---------
+- Funciones
+    - test_medir_no_cambia_el_resultado: Con y sin registro se obtiene lo mismo.
+    - test_evaluaciones_cuentan_las_distancias: El contador coincide con las
+      llamadas reales a `calcular_distancia`.
+"""
+import random
+
+import pytest
+
+import main
+from estadisticas import EstadisticasParCercano
+from main import encontrar_par_mas_cercano
+
+azar = random.Random(7)
+CONJUNTOS = [
+    [(azar.randint(0, 15), azar.randint(0, 15)) for _ in range(200)],
+    [(azar.randint(-10**5, 10**5), azar.randint(-10**5, 10**5)) for _ in range(1000)],
+    [(3, azar.randint(0, 500)) for _ in range(300)],
+    [(t, t) for t in azar.sample(range(10**4), 300)],
+    [(1, 1)] * 10,
+]
+
+
+@pytest.mark.parametrize("puntos", CONJUNTOS)
+def test_medir_no_cambia_el_resultado(puntos):
+    estadisticas = EstadisticasParCercano()
+
+    medido = encontrar_par_mas_cercano(puntos, estadisticas=estadisticas)
+
+    assert medido == encontrar_par_mas_cercano(puntos)
+    assert estadisticas.n == len(puntos)
+    assert estadisticas.llamadas_caso_base > 0
+    assert len(estadisticas.franja_por_nivel) <= estadisticas.profundidad_maxima
+
+
+@pytest.mark.parametrize("puntos", CONJUNTOS)
+def test_evaluaciones_cuentan_las_distancias(puntos, monkeypatch):
+    llamadas = []
+    calcular_distancia = main.calcular_distancia
+
+    def contar(p, q):
+        llamadas.append(None)
+        return calcular_distancia(p, q)
+
+    monkeypatch.setattr(main, "calcular_distancia", contar)
+    estadisticas = EstadisticasParCercano()
+
+    encontrar_par_mas_cercano(puntos, estadisticas=estadisticas)
+
+    assert estadisticas.evaluaciones_distancia == len(llamadas)
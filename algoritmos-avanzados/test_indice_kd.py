@@ -0,0 +1,144 @@
+"""
+Pruebas del índice k-d de `indice_kd`, comparado con la fuerza bruta.
+
+Contenido
+---------
+- Funciones
+    - test_vecino_mas_cercano: Vecino más cercano de puntos de consulta.
+    - test_k_vecinos: Distancias de los k vecinos más cercanos.
+    - test_en_radio: Puntos dentro de un círculo, borde incluido.
+    - test_par_mas_cercano: Par más cercano global.
+    - test_guardar_y_cargar: El índice cargado responde igual que el original.
+    - test_cargar_rechaza_otro_formato: Un archivo ajeno da ValueError.
+    - test_cargar_rechaza_archivo_truncado: Un índice cortado da ValueError.
+    - test_guardar_enteros_de_numpy: Las coordenadas np.int64 se guardan como
+      enteros.
+    - test_cota_y_recorrido: `vecino_mas_cercano` con cota y el iterador.
+"""
+import math
+import random
+
+import numpy as np
+import pytest
+
+from indice_kd import IndiceKD
+from main import par_mas_cercano_fuerza_bruta
+
+azar = random.Random(4)
+CONJUNTOS = {
+    "repetidos": [(azar.randint(0, 10), azar.randint(0, 10)) for _ in range(300)],
+    "amplios": [(azar.randint(-10**6, 10**6), azar.randint(-10**6, 10**6)) for _ in range(500)],
+    "colineales": [(3, azar.randint(0, 1000)) for _ in range(200)],
+    "flotantes": [(azar.uniform(-5, 5), azar.uniform(-5, 5)) for _ in range(200)],
+    "unico": [(7, 7)],
+}
+CONSULTAS = [(azar.randint(-12, 12), azar.randint(-12, 12)) for _ in range(30)] + [(0, 0), (3, 500)]
+
+
+def _distancias(puntos, consulta):
+    return sorted(math.dist(punto, consulta) for punto in puntos)
+
+
+@pytest.mark.parametrize("tam_hoja", [1, 8])
+@pytest.mark.parametrize("nombre", sorted(CONJUNTOS))
+def test_vecino_mas_cercano(nombre, tam_hoja):
+    puntos = CONJUNTOS[nombre]
+    indice = IndiceKD(puntos, tam_hoja)
+
+    for consulta in CONSULTAS:
+        vecino, distancia = indice.vecino_mas_cercano(consulta)
+
+        assert vecino in puntos
+        assert distancia == pytest.approx(_distancias(puntos, consulta)[0])
+        assert math.dist(vecino, consulta) == pytest.approx(distancia)
+
+
+@pytest.mark.parametrize("nombre", sorted(CONJUNTOS))
+def test_k_vecinos(nombre):
+    puntos = CONJUNTOS[nombre]
+    indice = IndiceKD(puntos)
+
+    for consulta in CONSULTAS:
+        for k in (0, 1, 5, len(puntos) + 3):
+            vecinos = indice.k_vecinos(consulta, k)
+
+            assert [d for _, d in vecinos] == pytest.approx(_distancias(puntos, consulta)[:k])
+            assert all(math.dist(v, consulta) == pytest.approx(d) for v, d in vecinos)
+
+
+@pytest.mark.parametrize("nombre", sorted(CONJUNTOS))
+def test_en_radio(nombre):
+    puntos = CONJUNTOS[nombre]
+    indice = IndiceKD(puntos)
+
+    for consulta in CONSULTAS:
+        for radio in (0, 1, 2.5, 40):
+            esperados = [p for p in puntos if math.dist(p, consulta) <= radio]
+            assert sorted(indice.en_radio(consulta, radio)) == sorted(esperados)
+
+
+@pytest.mark.parametrize("nombre", sorted(CONJUNTOS))
+def test_par_mas_cercano(nombre):
+    puntos = CONJUNTOS[nombre]
+
+    p, q, distancia = IndiceKD(puntos).par_mas_cercano()
+
+    assert distancia == pytest.approx(par_mas_cercano_fuerza_bruta(puntos)[2])
+    if len(puntos) >= 2:
+        assert math.dist(p, q) == pytest.approx(distancia)
+
+
+@pytest.mark.parametrize("nombre", sorted(CONJUNTOS))
+def test_guardar_y_cargar(nombre, tmp_path):
+    puntos = CONJUNTOS[nombre]
+    indice = IndiceKD(puntos, tam_hoja=4)
+    ruta = str(tmp_path / "indice.ikd")
+
+    indice.guardar(ruta)
+    cargado = IndiceKD.cargar(ruta)
+
+    assert len(cargado) == len(indice)
+    assert cargado.tam_hoja == 4
+    assert cargado.par_mas_cercano() == indice.par_mas_cercano()
+    for consulta in CONSULTAS:
+        assert cargado.k_vecinos(consulta, 3) == indice.k_vecinos(consulta, 3)
+
+
+def test_cargar_rechaza_otro_formato(tmp_path):
+    ruta = tmp_path / "otro.ikd"
+    ruta.write_bytes(b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        IndiceKD.cargar(str(ruta))
+
+
+def test_cargar_rechaza_archivo_truncado(tmp_path):
+    ruta = tmp_path / "indice.ikd"
+    IndiceKD(CONJUNTOS["amplios"]).guardar(str(ruta))
+    ruta.write_bytes(ruta.read_bytes()[:-8])
+
+    with pytest.raises(ValueError, match="incompleto"):
+        IndiceKD.cargar(str(ruta))
+
+
+def test_guardar_enteros_de_numpy(tmp_path):
+    puntos = [(np.int64(x), np.int64(y)) for x, y in CONJUNTOS["amplios"]]
+    ruta = str(tmp_path / "indice.ikd")
+
+    IndiceKD(puntos).guardar(ruta)
+    cargado = IndiceKD.cargar(ruta)
+
+    p, q, _ = cargado.par_mas_cercano()
+    assert all(type(v) is int for v in p + q)
+    assert cargado.par_mas_cercano() == IndiceKD(CONJUNTOS["amplios"]).par_mas_cercano()
+
+
+def test_cota_y_recorrido():
+    puntos = CONJUNTOS["amplios"]
+    indice = IndiceKD(puntos)
+
+    assert sorted(indice) == sorted(puntos)
+    for consulta in CONSULTAS:
+        vecino, distancia = indice.vecino_mas_cercano(consulta)
+        assert indice.vecino_mas_cercano(consulta, distancia ** 2 + 1)[0] is not None
+        assert indice.vecino_mas_cercano(consulta, distancia ** 2 * 0.99) == (None, math.inf)
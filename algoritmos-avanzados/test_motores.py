@@ -0,0 +1,174 @@
+"""
+Pruebas que comparan los motores de `main` con la fuerza bruta.
+
+Cada motor debe devolver la misma distancia mínima que
+`solucion_fuerza_bruta.fuerza_bruta_vectorizada` y un par de puntos de la
+entrada que esté a esa distancia. Los conjuntos de prueba incluyen puntos
+repetidos y puntos colineales, los casos donde más fácil es equivocarse al
+partir o al recorrer la franja.
+
+Contenido
+---------
+- Funciones
+    - conjuntos_de_prueba: Genera los conjuntos de puntos de las pruebas.
+    - test_motor_coincide_con_fuerza_bruta: Compara cada motor de `MOTORES`.
+    - test_columnas_con_varios_tamanos_de_hoja: Índices y distancia de
+      `par_mas_cercano_columnas`.
+    - test_indices_no_modifica_la_entrada: El motor "indices" no altera la lista.
+    - test_rejilla_reproducible_con_semilla: Misma semilla, mismo par.
+    - test_vecinos_coinciden_con_fuerza_bruta: Compara `vecinos_mas_cercanos`.
+    - test_fuerza_bruta_vectorizada_coincide: El oráculo por bloques coincide
+      con `par_mas_cercano_fuerza_bruta`.
+    - test_iterativo_con_varios_tamanos_de_hoja: Compara `par_mas_cercano_iterativo`.
+    - test_nd_coincide_en_varias_dimensiones: El motor "nd" con d distinto de 2.
+"""
+import functools
+import itertools
+import math
+import random
+
+import numpy as np
+import pytest
+
+from main import (
+    MOTORES,
+    encontrar_par_mas_cercano,
+    par_mas_cercano_columnas,
+    par_mas_cercano_fuerza_bruta,
+    par_mas_cercano_indices,
+    par_mas_cercano_iterativo,
+    par_mas_cercano_rejilla,
+    vecinos_mas_cercanos,
+)
+from solucion_fuerza_bruta import fuerza_bruta_vectorizada
+
+
+def conjuntos_de_prueba():
+    """
+    Genera los conjuntos de puntos de las pruebas.
+
+    Returns
+    -------
+    list of tuple
+        Pares (nombre, puntos), siempre con al menos dos puntos.
+    """
+    azar = random.Random(2024)
+    conjuntos = []
+    for n in (2, 3, 5, 50, 500):
+        # Coordenadas en un rango pequeño: casi seguro hay repetidos
+        conjuntos.append((f"pequenos_{n}",
+                          [(azar.randint(0, 20), azar.randint(0, 20)) for _ in range(n)]))
+        conjuntos.append((f"amplios_{n}",
+                          [(azar.randint(-10**6, 10**6), azar.randint(-10**6, 10**6))
+                           for _ in range(n)]))
+    conjuntos.append(("vertical", [(7, azar.randint(0, 10**4)) for _ in range(300)]))
+    conjuntos.append(("horizontal", [(azar.randint(0, 10**4), -3) for _ in range(300)]))
+    diagonal = [(t, 2 * t + 1) for t in azar.sample(range(10**4), 300)]
+    conjuntos.append(("diagonal", diagonal))
+    conjuntos.append(("diagonal_con_repetidos", diagonal + azar.sample(diagonal, 5)))
+    conjuntos.append(("todos_iguales", [(5, 5)] * 40))
+    return conjuntos
+
+
+CONJUNTOS = conjuntos_de_prueba()
+NOMBRES = [nombre for nombre, _ in CONJUNTOS]
+
+# Distancia mínima de cada conjunto, calculada una sola vez
+ESPERADAS = {nombre: fuerza_bruta_vectorizada(puntos)[2] for nombre, puntos in CONJUNTOS}
+
+# El motor "paralelo" resolvería en serie con tan pocos puntos
+OPCIONES = {"paralelo": {"procesos": 2, "umbral_serial": 2}}
+
+
+@pytest.mark.parametrize("motor", sorted(MOTORES))
+@pytest.mark.parametrize("nombre, puntos", CONJUNTOS, ids=NOMBRES)
+def test_motor_coincide_con_fuerza_bruta(motor, nombre, puntos):
+    p, q, distancia = encontrar_par_mas_cercano(list(puntos), motor=motor,
+                                                **OPCIONES.get(motor, {}))
+
+    assert distancia == pytest.approx(ESPERADAS[nombre])
+    assert p in puntos and q in puntos
+    assert math.dist(p, q) == pytest.approx(distancia)
+    if distancia == 0:
+        assert puntos.count(p) >= 2
+
+
+@pytest.mark.parametrize("tam_hoja", [2, 3, 8, 64])
+def test_columnas_con_varios_tamanos_de_hoja(tam_hoja):
+    for nombre, puntos in CONJUNTOS:
+        coordenadas = np.asarray(puntos)
+
+        i, j, distancia = par_mas_cercano_columnas(coordenadas[:, 0], coordenadas[:, 1], tam_hoja)
+
+        assert i != j
+        assert distancia == pytest.approx(ESPERADAS[nombre]), nombre
+        assert math.dist(puntos[i], puntos[j]) == pytest.approx(distancia)
+
+
+def test_indices_no_modifica_la_entrada():
+    for nombre, puntos in CONJUNTOS:
+        entrada = list(puntos)
+
+        _, _, distancia = par_mas_cercano_indices(entrada)
+
+        assert entrada == puntos
+        assert distancia == pytest.approx(ESPERADAS[nombre]), nombre
+
+
+def test_rejilla_reproducible_con_semilla():
+    for _, puntos in CONJUNTOS:
+        resultados = {par_mas_cercano_rejilla(puntos, semilla=3) for _ in range(3)}
+        assert len(resultados) == 1
+
+
+@pytest.mark.parametrize("nombre, puntos", CONJUNTOS, ids=NOMBRES)
+def test_vecinos_coinciden_con_fuerza_bruta(nombre, puntos):
+    coordenadas = np.asarray(puntos, dtype=np.float64)
+    diferencias = coordenadas[:, None, :] - coordenadas[None, :, :]
+    distancias = np.sqrt((diferencias ** 2).sum(axis=2))
+    np.fill_diagonal(distancias, np.inf)
+
+    vecino, distancia = vecinos_mas_cercanos(puntos)
+
+    np.testing.assert_allclose(distancia, distancias.min(axis=1), err_msg=nombre)
+    assert (vecino != np.arange(len(puntos))).all()
+    np.testing.assert_allclose(distancias[np.arange(len(puntos)), vecino], distancia)
+
+
+@functools.lru_cache(maxsize=None)
+def _distancia_fuerza_bruta(nombre):
+    return par_mas_cercano_fuerza_bruta(dict(CONJUNTOS)[nombre])[2]
+
+
+@pytest.mark.parametrize("tam_bloque", [5, 64, 256])
+@pytest.mark.parametrize("podar", [True, False])
+def test_fuerza_bruta_vectorizada_coincide(tam_bloque, podar):
+    for nombre, puntos in CONJUNTOS:
+        p, q, distancia = fuerza_bruta_vectorizada(puntos, tam_bloque, podar)
+
+        assert distancia == _distancia_fuerza_bruta(nombre), nombre
+        assert math.dist(p, q) == distancia
+        assert puntos.index(p) < len(puntos) - 1 - puntos[::-1].index(q)
+
+
+@pytest.mark.parametrize("tam_hoja", [1, 2, 3, 16])
+def test_iterativo_con_varios_tamanos_de_hoja(tam_hoja):
+    for nombre, puntos in CONJUNTOS:
+        p, q, distancia = par_mas_cercano_iterativo(list(puntos), tam_hoja)
+
+        assert distancia == pytest.approx(ESPERADAS[nombre]), nombre
+        assert math.dist(p, q) == pytest.approx(distancia)
+
+
+@pytest.mark.parametrize("dimension", [1, 3, 5])
+def test_nd_coincide_en_varias_dimensiones(dimension):
+    azar = random.Random(dimension)
+    for n in (2, 10, 200):
+        puntos = [tuple(azar.randint(0, 30) for _ in range(dimension)) for _ in range(n)]
+        esperada = min(math.dist(p, q) for p, q in itertools.combinations(puntos, 2))
+
+        p, q, distancia = encontrar_par_mas_cercano(puntos, motor="nd", semilla=1)
+
+        assert distancia == pytest.approx(esperada)
+        assert p in puntos and q in puntos
+        assert math.dist(p, q) == pytest.approx(esperada)
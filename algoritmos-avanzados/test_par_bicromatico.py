@@ -0,0 +1,49 @@
+"""
+Pruebas de `par_bicromatico.encontrar_par_bicromatico` frente al producto cruzado.
+
+Contenido
+---------
+- Funciones
+    - test_coincide_con_producto_cruzado: Distancia mínima y pertenencia de
+      cada punto del par, con y sin índices ya construidos.
+    - test_conjunto_vacio: Sin puntos en uno de los conjuntos no hay par.
+"""
+import itertools
+import math
+import random
+
+import pytest
+
+from indice_kd import IndiceKD
+from par_bicromatico import encontrar_par_bicromatico
+
+azar = random.Random(18)
+CASOS = {
+    "iguales": ([(azar.randint(0, 50), azar.randint(0, 50)) for _ in range(80)],
+                [(azar.randint(0, 50), azar.randint(0, 50)) for _ in range(80)]),
+    "desiguales": ([(azar.randint(-10**5, 10**5), azar.randint(-10**5, 10**5)) for _ in range(20)],
+                   [(azar.randint(-10**5, 10**5), azar.randint(-10**5, 10**5)) for _ in range(400)]),
+    "separados": ([(azar.randint(0, 100), azar.randint(0, 100)) for _ in range(150)],
+                  [(azar.randint(10**4, 10**4 + 100), azar.randint(0, 100)) for _ in range(30)]),
+    "unitarios": ([(3, 4)], [(0, 0)]),
+}
+
+
+@pytest.mark.parametrize("indexar", ["ninguno", "a", "b", "ambos"])
+@pytest.mark.parametrize("nombre", sorted(CASOS))
+def test_coincide_con_producto_cruzado(nombre, indexar):
+    a, b = CASOS[nombre]
+    esperada = min(math.dist(p, q) for p, q in itertools.product(a, b))
+    conjunto_a = IndiceKD(a) if indexar in ("a", "ambos") else a
+    conjunto_b = IndiceKD(b) if indexar in ("b", "ambos") else b
+
+    p, q, distancia = encontrar_par_bicromatico(conjunto_a, conjunto_b, tam_hoja=4)
+
+    assert distancia == pytest.approx(esperada)
+    assert p in a and q in b
+    assert math.dist(p, q) == pytest.approx(distancia)
+
+
+def test_conjunto_vacio():
+    assert encontrar_par_bicromatico([], [(1, 1)]) == (None, None, math.inf)
+    assert encontrar_par_bicromatico(IndiceKD([(1, 1)]), []) == (None, None, math.inf)
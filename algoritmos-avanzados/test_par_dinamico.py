@@ -0,0 +1,56 @@
+"""
+Pruebas de `par_dinamico.ParMasCercanoDinamico` frente a un recálculo completo.
+
+Contenido
+---------
+- Funciones
+    - test_inserciones_y_eliminaciones_intercaladas: Tras cada operación el
+      par coincide con la fuerza bruta sobre los puntos actuales.
+    - test_eliminar_punto_ausente: Eliminar un punto que no está da ValueError.
+"""
+import math
+import random
+
+import pytest
+
+from main import par_mas_cercano_fuerza_bruta
+from par_dinamico import ParMasCercanoDinamico
+
+
+@pytest.mark.parametrize("semilla, rango", [(1, 6), (2, 40), (3, 10**6)])
+def test_inserciones_y_eliminaciones_intercaladas(semilla, rango):
+    azar = random.Random(semilla)
+    actuales = [(azar.randint(0, rango), azar.randint(0, rango)) for _ in range(20)]
+    flujo = ParMasCercanoDinamico(actuales)
+
+    for _ in range(600):
+        if actuales and azar.random() < 0.45:
+            punto = actuales.pop(azar.randrange(len(actuales)))
+            flujo.eliminar(punto)
+        else:
+            # A veces se repite un punto existente, para crear duplicados
+            if actuales and azar.random() < 0.2:
+                punto = azar.choice(actuales)
+            else:
+                punto = (azar.randint(0, rango), azar.randint(0, rango))
+            actuales.append(punto)
+            flujo.insertar(punto)
+
+        p, q, distancia = flujo.par_mas_cercano()
+
+        assert len(flujo) == len(actuales)
+        assert distancia == pytest.approx(par_mas_cercano_fuerza_bruta(actuales)[2])
+        if len(actuales) >= 2:
+            assert p in actuales and q in actuales
+            assert math.dist(p, q) == pytest.approx(distancia)
+            if distancia == 0:
+                assert actuales.count(p) >= 2
+
+
+def test_eliminar_punto_ausente():
+    flujo = ParMasCercanoDinamico([(0, 0), (1, 1)])
+    flujo.eliminar((1, 1))
+
+    with pytest.raises(ValueError):
+        flujo.eliminar((1, 1))
+    assert flujo.par_mas_cercano() == (None, None, math.inf)
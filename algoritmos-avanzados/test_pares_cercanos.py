@@ -0,0 +1,86 @@
+"""
+Pruebas de `pares_cercanos` frente a la enumeración de todos los pares.
+
+Contenido
+---------
+- Funciones
+    - test_pares_bajo_umbral: Todos los pares a distancia menor que el umbral.
+    - test_k_pares_mas_cercanos: Las k menores distancias, en orden.
+    - test_k_pares_con_puntos_iguales: Todos los puntos en el mismo lugar.
+    - test_k_pares_recorre_cada_umbral_una_vez: Sin recorridos repetidos.
+"""
+import itertools
+import math
+import random
+
+import pytest
+
+import pares_cercanos
+from pares_cercanos import k_pares_mas_cercanos, pares_bajo_umbral
+
+azar = random.Random(6)
+CONJUNTOS = {
+    "repetidos": [(azar.randint(0, 12), azar.randint(0, 12)) for _ in range(120)],
+    "amplios": [(azar.randint(-10**4, 10**4), azar.randint(-10**4, 10**4)) for _ in range(300)],
+    "colineales": [(azar.randint(0, 500), 4) for _ in range(150)],
+    "racimo": [(azar.randint(0, 3), azar.randint(0, 3)) for _ in range(60)]
+              + [(azar.randint(10**5, 10**6), azar.randint(10**5, 10**6)) for _ in range(60)],
+    "dos": [(0, 0), (3, 4)],
+}
+
+
+def _todos_los_pares(puntos):
+    """Pares de posiciones distintas como (distancia, punto menor, punto mayor)."""
+    return sorted((math.dist(p, q), min(p, q), max(p, q))
+                  for p, q in itertools.combinations(puntos, 2))
+
+
+def _normalizar(pares):
+    return sorted((d, min(p, q), max(p, q)) for p, q, d in pares)
+
+
+@pytest.mark.parametrize("nombre", sorted(CONJUNTOS))
+def test_pares_bajo_umbral(nombre):
+    puntos = CONJUNTOS[nombre]
+    todos = _todos_los_pares(puntos)
+
+    for umbral in (0, 0.5, 1, 2.5, 7, 150):
+        esperados = [par for par in todos if par[0] < umbral]
+        assert _normalizar(pares_bajo_umbral(puntos, umbral)) == pytest.approx(esperados)
+
+
+@pytest.mark.parametrize("nombre", sorted(CONJUNTOS))
+def test_k_pares_mas_cercanos(nombre):
+    puntos = CONJUNTOS[nombre]
+    distancias = [d for d, _, _ in _todos_los_pares(puntos)]
+
+    for k in (0, 1, 2, 10, 100, len(distancias) + 5):
+        pares = list(k_pares_mas_cercanos(puntos, k))
+
+        assert [d for _, _, d in pares] == pytest.approx(distancias[:k])
+        assert all(p in puntos and q in puntos for p, q, _ in pares)
+        assert all(math.dist(p, q) == pytest.approx(d) for p, q, d in pares)
+
+
+def test_k_pares_con_puntos_iguales():
+    puntos = [(2, 2)] * 6
+
+    assert list(k_pares_mas_cercanos(puntos, 4)) == [((2, 2), (2, 2), 0.0)] * 4
+    assert len(list(k_pares_mas_cercanos(puntos, 100))) == 15
+
+
+def test_k_pares_recorre_cada_umbral_una_vez(monkeypatch):
+    umbrales = []
+
+    def pares_contados(puntos, umbral):
+        umbrales.append(umbral)
+        return pares_bajo_umbral(puntos, umbral)
+
+    monkeypatch.setattr(pares_cercanos, "pares_bajo_umbral", pares_contados)
+    puntos = CONJUNTOS["amplios"]
+
+    pares = list(k_pares_mas_cercanos(puntos, 50))
+
+    esperadas = [d for d, _, _ in _todos_los_pares(puntos)][:50]
+    assert [d for _, _, d in pares] == pytest.approx(esperadas)
+    assert len(umbrales) == len(set(umbrales)) > 1
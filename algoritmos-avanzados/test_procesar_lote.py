@@ -0,0 +1,71 @@
+"""
+Pruebas del procesamiento por lotes de `procesar_lote`.
+
+Contenido
+---------
+- Funciones
+    - test_lote_registra_error_solo_del_archivo_invalido: Un archivo mal
+      formado no impide registrar el resto.
+    - test_lote_sobrevive_a_un_proceso_caido: La caída de un proceso solo
+      marca con error el archivo que la provocó.
+"""
+import io
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import main
+from procesar_lote import procesar_lote
+
+
+def _leer_registros(salida):
+    """Devuelve los registros JSON Lines escritos, indexados por archivo."""
+    registros = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+    return {os.path.basename(r["archivo"]): r for r in registros}
+
+
+def test_lote_registra_error_solo_del_archivo_invalido(tmp_path):
+    valido = tmp_path / "valido.txt"
+    valido.write_text("1,20,300,5\n4,50,600,7\n")
+    invalido = tmp_path / "invalido.txt"
+    invalido.write_text("1,20,x\n4,50\n")
+    salida = io.StringIO()
+
+    errores = procesar_lote([str(valido), str(invalido)], salida, procesos=2)
+
+    registros = _leer_registros(salida)
+    assert errores == 1
+    assert set(registros) == {"valido.txt", "invalido.txt"}
+    assert registros["valido.txt"]["error"] is None
+    assert registros["valido.txt"]["n"] == 4
+    assert registros["invalido.txt"]["error"] is not None
+
+
+def _motor_que_cae(puntos, **opciones):
+    """Motor de prueba que mata el proceso con el conjunto (0, 0), (9, 9)."""
+    if puntos[0] == (0, 0):
+        os._exit(1)
+    return main.par_mas_cercano_div_conq(puntos, **opciones)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="el motor sustituido solo llega a los procesos con fork")
+def test_lote_sobrevive_a_un_proceso_caido(tmp_path, monkeypatch):
+    monkeypatch.setitem(main.MOTORES, "div_conq", _motor_que_cae)
+    archivos = []
+    for i in range(4):
+        archivo = tmp_path / f"datos{i}.txt"
+        archivo.write_text("1,20,300\n4,50,600\n")
+        archivos.append(str(archivo))
+    (tmp_path / "datos2.txt").write_text("0,9\n0,9\n")
+    salida = io.StringIO()
+
+    errores = procesar_lote(archivos, salida, procesos=2)
+
+    registros = _leer_registros(salida)
+    assert errores == 1
+    assert len(registros) == 4
+    assert registros["datos2.txt"]["error"] is not None
+    assert all(registros[f"datos{i}.txt"]["error"] is None for i in (0, 1, 3))
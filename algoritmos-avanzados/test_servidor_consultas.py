@@ -0,0 +1,193 @@
+"""
+Pruebas de `servidor_consultas` con un servidor real en la interfaz local.
+
+Contenido
+---------
+- Funciones
+    - servidor: Fixture que arranca el servidor en un hilo y devuelve su puerto.
+    - test_consultas_individuales: Cada tipo de consulta frente a la fuerza bruta.
+    - test_lote: Un lote se responde en orden, con errores por consulta.
+    - test_lote_concurrente: Las consultas de un lote se resuelven a la vez.
+    - test_errores: Consultas inválidas y archivos inexistentes o no permitidos.
+    - test_linea_demasiado_larga: Se responde con un error y se sigue leyendo.
+    - test_raiz_y_limite_de_conjuntos: Archivos admitidos y conjuntos residentes.
+"""
+import asyncio
+import json
+import math
+import random
+import socket
+import threading
+import time
+
+import pytest
+
+from main import par_mas_cercano_fuerza_bruta
+from servidor_consultas import LIMITE_LINEA, ConjuntoResidente, ServidorConsultas, consultar
+
+azar = random.Random(19)
+PUNTOS = [(azar.randint(-500, 500), azar.randint(-500, 500)) for _ in range(300)]
+CONSULTAS = [(azar.randint(-600, 600), azar.randint(-600, 600)) for _ in range(10)]
+
+
+def _escribir_puntos(ruta, puntos):
+    ruta.write_text(",".join(str(x) for x, _ in puntos) + "\n"
+                    + ",".join(str(y) for _, y in puntos) + "\n")
+    return str(ruta)
+
+
+def _puerto_libre():
+    with socket.socket() as prueba:
+        prueba.bind(("127.0.0.1", 0))
+        return prueba.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def servidor(tmp_path_factory):
+    """Arranca el servidor con un archivo precargado; devuelve (archivo, puerto)."""
+    archivo = _escribir_puntos(tmp_path_factory.mktemp("servidor") / "puntos.txt", PUNTOS)
+    puerto = _puerto_libre()
+    bucle = asyncio.new_event_loop()
+    tarea = bucle.create_task(ServidorConsultas().servir("127.0.0.1", puerto, [archivo]))
+
+    def ejecutar():
+        try:
+            bucle.run_until_complete(tarea)
+        except asyncio.CancelledError:
+            pass
+
+    hilo = threading.Thread(target=ejecutar, daemon=True)
+    hilo.start()
+
+    for _ in range(200):
+        try:
+            socket.create_connection(("127.0.0.1", puerto)).close()
+            break
+        except ConnectionRefusedError:
+            time.sleep(0.05)
+
+    yield archivo, puerto
+
+    bucle.call_soon_threadsafe(tarea.cancel)
+    hilo.join(5)
+    bucle.close()
+
+
+def _distancias(consulta):
+    return sorted(math.dist(punto, consulta) for punto in PUNTOS)
+
+
+def test_consultas_individuales(servidor):
+    archivo, puerto = servidor
+
+    respuesta = consultar({"consulta": "par_mas_cercano", "archivo": archivo}, puerto=puerto)
+    assert respuesta["ok"]
+    assert respuesta["resultado"]["n"] == len(PUNTOS)
+    assert respuesta["resultado"]["distancia"] == pytest.approx(
+        par_mas_cercano_fuerza_bruta(PUNTOS)[2])
+
+    for punto in CONSULTAS:
+        distancias = _distancias(punto)
+
+        vecino = consultar({"consulta": "vecino", "archivo": archivo, "punto": punto},
+                           puerto=puerto)["resultado"]
+        assert tuple(vecino["vecino"]) in PUNTOS
+        assert vecino["distancia"] == pytest.approx(distancias[0])
+
+        k_vecinos = consultar({"consulta": "k_vecinos", "archivo": archivo, "punto": punto,
+                               "k": 4}, puerto=puerto)["resultado"]["vecinos"]
+        assert [v["distancia"] for v in k_vecinos] == pytest.approx(distancias[:4])
+
+        en_radio = consultar({"consulta": "radio", "archivo": archivo, "punto": punto,
+                              "radio": 60}, puerto=puerto)["resultado"]["puntos"]
+        assert sorted(map(tuple, en_radio)) == sorted(
+            p for p in PUNTOS if math.dist(p, punto) <= 60)
+
+
+def test_lote(servidor):
+    archivo, puerto = servidor
+    lote = [{"consulta": "vecino", "archivo": archivo, "punto": punto, "id": i}
+            for i, punto in enumerate(CONSULTAS)]
+    lote.insert(3, {"consulta": "vecino", "archivo": archivo, "id": "sin_punto"})
+
+    respuestas = consultar(lote, puerto=puerto)
+
+    assert [r["id"] for r in respuestas] == [c["id"] for c in lote]
+    assert not respuestas[3]["ok"]
+    del respuestas[3]
+    for respuesta, punto in zip(respuestas, CONSULTAS):
+        assert respuesta["ok"]
+        assert respuesta["resultado"]["distancia"] == pytest.approx(_distancias(punto)[0])
+
+
+def test_lote_concurrente(servidor, monkeypatch):
+    archivo, puerto = servidor
+    # Cada consulta espera a la otra: en serie, la barrera vencería su plazo
+    barrera = threading.Barrier(2, timeout=5)
+    responder = ConjuntoResidente.responder
+
+    def responder_a_la_vez(self, consulta):
+        barrera.wait()
+        return responder(self, consulta)
+
+    monkeypatch.setattr(ConjuntoResidente, "responder", responder_a_la_vez)
+
+    respuestas = consultar([{"consulta": "vecino", "archivo": archivo, "punto": punto}
+                            for punto in CONSULTAS[:2]], puerto=puerto)
+
+    assert [respuesta["ok"] for respuesta in respuestas] == [True, True]
+
+
+def test_errores(servidor, tmp_path):
+    archivo, puerto = servidor
+    # Un archivo válido, pero no precargado: el servidor no tiene raíz
+    otro = _escribir_puntos(tmp_path / "otro.txt", PUNTOS[:5])
+
+    for consulta in ({"consulta": "desconocida", "archivo": archivo},
+                     {"consulta": "radio", "archivo": archivo, "punto": [0, 0]},
+                     {"consulta": "vecino", "punto": [0, 0]},
+                     {"consulta": "par_mas_cercano", "archivo": str(tmp_path / "no_existe.txt")},
+                     {"consulta": "cargar", "archivo": otro}):
+        respuesta = consultar(consulta, puerto=puerto)
+        assert not respuesta["ok"] and respuesta["error"]
+
+    with socket.create_connection(("127.0.0.1", puerto)) as conexion:
+        conexion.sendall(b"{no es json\n")
+        with conexion.makefile("rb") as lector:
+            assert not json.loads(lector.readline())["ok"]
+
+
+def test_linea_demasiado_larga(servidor):
+    archivo, puerto = servidor
+    consulta = {"consulta": "par_mas_cercano", "archivo": archivo}
+
+    with socket.create_connection(("127.0.0.1", puerto)) as conexion:
+        conexion.sendall(b"[" + b" " * (LIMITE_LINEA + 10) + b"]\n"
+                         + json.dumps(consulta).encode() + b"\n")
+        with conexion.makefile("rb") as lector:
+            assert not json.loads(lector.readline())["ok"]
+            assert json.loads(lector.readline())["ok"]
+
+
+def test_raiz_y_limite_de_conjuntos(tmp_path):
+    raiz = tmp_path / "datos"
+    raiz.mkdir()
+    archivos = [_escribir_puntos(raiz / f"puntos_{i}.txt", PUNTOS[:10 + i]) for i in range(3)]
+    fuera = _escribir_puntos(tmp_path / "fuera.txt", PUNTOS[:5])
+    servidor = ServidorConsultas(raiz=str(raiz), max_conjuntos=2)
+
+    async def probar():
+        for ruta in (fuera, str(raiz / ".." / "fuera.txt")):
+            with pytest.raises(ValueError):
+                await servidor.conjunto(ruta)
+
+        primero = await servidor.conjunto(archivos[0])
+        segundo = await servidor.conjunto(archivos[1])
+        # Usar el primero lo hace el más reciente: al cargar el tercero se descarta el segundo
+        assert await servidor.conjunto(archivos[0]) is primero
+        tercero = await servidor.conjunto(archivos[2])
+        assert len(tercero.indice) == 12
+        assert await servidor.conjunto(archivos[0]) is primero
+        assert await servidor.conjunto(archivos[1]) is not segundo
+
+    asyncio.run(probar())
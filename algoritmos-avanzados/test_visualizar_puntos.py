@@ -0,0 +1,43 @@
+"""
+Pruebas de `visualizar_puntos.graficar_puntos` sin pantalla.
+
+Contenido
+---------
+- Funciones
+    - test_graficar_en_cada_modo: Se genera la imagen en ambos modos.
+    - test_modo_desconocido: Un modo inválido da ValueError.
+"""
+import random
+
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+from visualizar_puntos import MODOS, graficar_puntos  # noqa: E402
+
+
+@pytest.fixture
+def archivo_puntos(tmp_path):
+    azar = random.Random(15)
+    xs = [azar.randint(-1000, 1000) for _ in range(400)]
+    ys = [azar.randint(-1000, 1000) for _ in range(400)]
+    ruta = tmp_path / "puntos.txt"
+    ruta.write_text(",".join(map(str, xs)) + "\n" + ",".join(map(str, ys)) + "\n")
+    return str(ruta)
+
+
+@pytest.mark.parametrize("max_puntos", [None, 50])
+@pytest.mark.parametrize("modo", MODOS)
+def test_graficar_en_cada_modo(archivo_puntos, tmp_path, modo, max_puntos):
+    salida = tmp_path / f"{modo}.png"
+
+    graficar_puntos(archivo_puntos, str(salida), modo=modo, resolucion=32,
+                    max_puntos=max_puntos, resaltar_par=True)
+
+    assert salida.read_bytes().startswith(b"\x89PNG")
+
+
+def test_modo_desconocido(archivo_puntos, tmp_path):
+    with pytest.raises(ValueError):
+        graficar_puntos(archivo_puntos, str(tmp_path / "x.png"), modo="barras")
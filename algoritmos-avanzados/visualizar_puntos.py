@@ -1,17 +1,54 @@
 """
 Módulo para visualizar un conjunto de puntos en un plano 2D.
 
-Lee puntos desde un archivo de texto y los grafica usando Matplotlib.
+Lee puntos desde un archivo de texto y los grafica usando Matplotlib, ya sea
+como gráfico de dispersión o, para archivos con millones de puntos, como una
+imagen de densidad cuyo costo de dibujo no depende del número de puntos.
+Matplotlib se importa solo al graficar, de modo que importar este módulo no
+paga su tiempo de arranque.
+
+Contenido
+---------
+- Funciones
+    - graficar_puntos: Grafica los puntos de un archivo y resalta el par más cercano.
 """
-import matplotlib.pyplot as plt
-# Asumimos que main.py está en el mismo directorio o en el PYTHONPATH
-# para poder importar leer_puntos.
-# Si no, copia la función leer_puntos aquí o ajusta la importación.
-from main import leer_puntos
+try:
+    import numpy as np
+except ImportError:  # Matplotlib también requiere NumPy
+    np = None
+
+from carga_puntos import leer_columnas
+from main import par_mas_cercano_columnas
+
+MODOS = ("dispersion", "densidad")
+
+
+def _submuestra(x, y, max_puntos, semilla=0):
+    """Elige hasta `max_puntos` puntos al azar, conservando su orden."""
+    if max_puntos is None or x.size <= max_puntos:
+        return x, y
+    generador = np.random.default_rng(semilla)
+    elegidos = np.sort(generador.choice(x.size, size=max_puntos, replace=False))
+    return x[elegidos], y[elegidos]
+
+
+def _dibujar_densidad(plt, x, y, resolucion):
+    """Agrupa los puntos en una rejilla y la dibuja como una imagen."""
+    from matplotlib.colors import LogNorm
+
+    conteos, bordes_x, bordes_y = np.histogram2d(x, y, bins=resolucion)
+    # Las celdas vacías quedan sin color en lugar de confundirse con las poco densas
+    conteos = np.ma.masked_equal(conteos.T, 0)
+    plt.imshow(conteos, origin="lower", aspect="auto", cmap="viridis",
+               extent=(bordes_x[0], bordes_x[-1], bordes_y[0], bordes_y[-1]),
+               norm=LogNorm(), interpolation="nearest")
+    plt.colorbar(label="Puntos por celda")
 
-def graficar_puntos(nombre_archivo_datos, nombre_archivo_salida="puntos_visualizados.png"):
+
+def graficar_puntos(nombre_archivo_datos, nombre_archivo_salida="puntos_visualizados.png",
+                    modo="dispersion", resolucion=512, max_puntos=None, resaltar_par=False):
     """
-    Lee puntos de un archivo y genera un gráfico de dispersión.
+    Lee puntos de un archivo y genera un gráfico de dispersión o de densidad.
 
     Parameters
     ----------
@@ -20,9 +57,33 @@ def graficar_puntos(nombre_archivo_datos, nombre_archivo_salida="puntos_visualiz
     nombre_archivo_salida : str, optional
         Nombre del archivo donde se guardará el gráfico.
         Por defecto es "puntos_visualizados.png".
+    modo : {"dispersion", "densidad"}, optional
+        "dispersion" dibuja cada punto; "densidad" cuenta los puntos en una
+        rejilla de `resolucion` x `resolucion` celdas y dibuja los conteos
+        como una imagen en escala logarítmica. Por defecto "dispersion".
+    resolucion : int, optional
+        Celdas por eje en el modo "densidad". Por defecto 512.
+    max_puntos : int, optional
+        Si se indica, se grafica una muestra aleatoria (reproducible) de a
+        lo sumo `max_puntos` puntos. Por defecto se grafican todos.
+    resaltar_par : bool, optional
+        Si es verdadero, se marca el par más cercano de todos los puntos
+        (no solo de la muestra). Por defecto False.
+
+    Notes
+    -----
+    Los puntos se leen con `carga_puntos.leer_columnas`, directamente como
+    arreglos y con caché binaria, sin crear una tupla por punto. En el modo
+    "densidad" el agrupado es O(n) en C y el dibujo depende solo de
+    `resolucion`, por lo que el tiempo casi no crece con el archivo. El par
+    más cercano se calcula con `par_mas_cercano_columnas`, el motor "numpy"
+    de `encontrar_par_mas_cercano`, sobre las mismas columnas.
     """
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconocido: {modo!r}. Opciones: {', '.join(MODOS)}")
+
     try:
-        puntos = leer_puntos(nombre_archivo_datos)
+        x, y = leer_columnas(nombre_archivo_datos)
     except FileNotFoundError:
         print(f"Error: El archivo de datos '{nombre_archivo_datos}' no fue encontrado.")
         return
@@ -30,26 +91,42 @@ def graficar_puntos(nombre_archivo_datos, nombre_archivo_salida="puntos_visualiz
         print(f"Ocurrió un error al leer los puntos: {e}")
         return
 
-    if not puntos:
+    if x.size == 0:
         print("No se encontraron puntos para graficar.")
         return
 
-    # Separar las coordenadas x e y
-    x_coords = [p[0] for p in puntos]
-    y_coords = [p[1] for p in puntos]
+    import matplotlib.pyplot as plt
 
+    x_muestra, y_muestra = _submuestra(x, y, max_puntos)
     plt.figure(figsize=(10, 8))
-    plt.scatter(x_coords, y_coords, s=10)  # s es el tamaño del punto
-    plt.title(f"Visualización de Puntos del Archivo: {nombre_archivo_datos}")
+    if modo == "densidad":
+        _dibujar_densidad(plt, x_muestra, y_muestra, resolucion)
+    else:
+        plt.scatter(x_muestra, y_muestra, s=10)  # s es el tamaño del punto
+        plt.grid(True)
+
+    if resaltar_par and x.size >= 2:
+        i, j, dist = par_mas_cercano_columnas(x, y)
+        # Marcadores grandes: con muchos puntos el par ocupa menos de un píxel
+        plt.plot([x[i], x[j]], [y[i], y[j]], color="red", linewidth=1.5, marker="o",
+                 markersize=12, markerfacecolor="none",
+                 label=f"Par más cercano: ({x[i]}, {y[i]}) - ({x[j]}, {y[j]}), d = {dist:.3f}")
+        plt.legend(loc="upper right")
+
+    titulo = f"Visualización de Puntos del Archivo: {nombre_archivo_datos}"
+    if x_muestra.size < x.size:
+        titulo += f" (muestra de {x_muestra.size} de {x.size})"
+    plt.title(titulo)
     plt.xlabel("Coordenada X")
     plt.ylabel("Coordenada Y")
-    plt.grid(True)
-    
+
     try:
         plt.savefig(nombre_archivo_salida)
         print(f"Gráfico guardado como '{nombre_archivo_salida}'")
     except Exception as e:
         print(f"Error al guardar el gráfico: {e}")
+    finally:
+        plt.close()
 
 if __name__ == "__main__":
     # Puedes cambiar este nombre de archivo al que quieras visualizar